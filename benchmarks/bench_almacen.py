@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark: almacén en memoria contra almacén sqlite3.
+
+Carga N muebles con agregar_muebles_lote en una tienda con cada almacén y
+mide la carga y algunas búsquedas típicas (rango de precios angosto,
+material, nombre y tipo), verificando que ambos devuelvan lo mismo.
+
+Uso:
+    python benchmarks/bench_almacen.py [cantidad]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.categorias.asientos import Asiento
+from models.concretos.silla import Silla
+from models.concretos.mesa import Mesa
+from services.almacen import AlmacenMemoria, AlmacenSQLite
+from services.tienda import TiendaMuebles
+
+CONSULTAS = {
+    "precio 100-101": lambda tienda: tienda.filtrar_por_precio(100, 101),
+    "material metal": lambda tienda: tienda.filtrar_por_material("metal"),
+    "nombre 'silla 12'": lambda tienda: tienda.buscar_muebles_por_nombre("silla 12"),
+    "tipo Asiento": lambda tienda: tienda.obtener_muebles_por_tipo(Asiento),
+    "10 más caros": lambda tienda: tienda.obtener_mas_caros(10),
+}
+
+
+def crear_muebles(cantidad: int):
+    for i in range(cantidad):
+        if i % 2:
+            yield Silla(f"Silla {i}", "Metal" if i % 3 else "Madera", "Negro", 100.0 + i % 500, True, "tela", True, False)
+        else:
+            yield Mesa(f"Mesa {i}", "Madera", "Roble", 300.0 + i % 500, "redonda", 6, 1.5, True)
+
+
+def medir(funcion) -> tuple:
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return time.perf_counter() - inicio, resultado
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    tiendas = {"memoria": TiendaMuebles("Memoria", AlmacenMemoria()),
+               "sqlite3": TiendaMuebles("SQLite", AlmacenSQLite())}
+    print(f"{cantidad:,} muebles")
+    print(f"{'':<20}{'memoria':>12}{'sqlite3':>12}")
+    tiempos = [medir(lambda: tienda.agregar_muebles_lote(crear_muebles(cantidad)))[0]
+               for tienda in tiendas.values()]
+    print(f"{'carga en lote':<20}" + "".join(f"{tiempo:>10.3f} s" for tiempo in tiempos))
+    for nombre, consulta in CONSULTAS.items():
+        resultados = [medir(lambda: consulta(tienda)) for tienda in tiendas.values()]
+        ids = [[tienda.obtener_id(m) for m in muebles]
+               for tienda, (_, muebles) in zip(tiendas.values(), resultados)]
+        assert ids[0] == ids[1], f"Los almacenes difieren en '{nombre}'"
+        print(f"{nombre:<20}" + "".join(f"{tiempo * 1000:>9.2f} ms" for tiempo, _ in resultados))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Benchmark: costo del diario de ventas según el tamaño del grupo de confirmación.
+
+Hace N ventas de una unidad sin diario y con diario sincronizando cada 1,
+8, 64 y 512 ventas, y reporta ventas por segundo y cantidad de fsync.
+
+Uso:
+    python benchmarks/bench_diario.py [cantidad]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.concretos.silla import Silla
+from services.tienda import TiendaMuebles
+
+
+def crear_silla() -> Silla:
+    return Silla("Silla Benchmark", "Madera", "Negro", 100.0, True, "tela", True, False)
+
+
+def medir(cantidad: int, carpeta: str, tamaño_grupo: int = None) -> tuple:
+    """Ventas por segundo y sincronizaciones (None = sin diario)."""
+    tienda = TiendaMuebles("Benchmark")
+    silla = crear_silla()
+    tienda.agregar_mueble(silla, cantidad)
+    if tamaño_grupo is not None:
+        tienda.abrir_diario(os.path.join(carpeta, f"ventas-{tamaño_grupo}.diario"),
+                            tamaño_grupo=tamaño_grupo, espera_maxima=None)
+    inicio = time.perf_counter()
+    for _ in range(cantidad):
+        tienda.realizar_venta(silla)
+    diario = tienda._diario
+    tienda.cerrar_diario()
+    tiempo = time.perf_counter() - inicio
+    return cantidad / tiempo, diario.sincronizaciones if diario else 0
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    with tempfile.TemporaryDirectory(dir=os.getcwd()) as carpeta:
+        print(f"{cantidad:,} ventas")
+        print(f"{'Diario':<16}{'ventas/s':>12}{'fsync':>8}")
+        por_segundo, _ = medir(cantidad, carpeta)
+        print(f"{'sin diario':<16}{por_segundo:>12,.0f}{0:>8}")
+        for tamaño_grupo in (1, 8, 64, 512):
+            por_segundo, sincronizaciones = medir(cantidad, carpeta, tamaño_grupo)
+            print(f"{f'grupo de {tamaño_grupo}':<16}{por_segundo:>12,.0f}{sincronizaciones:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark: historial de ventas en diccionarios contra el registro columnar.
+
+Registra N ventas de la forma en que se guardaban antes (un diccionario por
+venta con la fecha ya formateada con strftime) y con RegistroVentas (fecha
+en segundos, textos internados, columnas tipadas), y reporta el tiempo de
+registro y la memoria que ocupa el historial.
+
+Uso:
+    python benchmarks/bench_historial.py [cantidad]
+"""
+
+import datetime
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.ventas import RegistroVentas, segundos_desde_epoca
+
+CLIENTES = [f"Cliente {i}" for i in range(500)]
+MUEBLES = [f"Silla {i}" for i in range(2000)]
+
+
+def con_diccionarios(cantidad: int) -> list:
+    historial = []
+    for i in range(cantidad):
+        ahora = datetime.datetime.now()
+        precio_original = 100.0 + i % 50
+        precio_final = round(precio_original * 0.9, 2)
+        historial.append({
+            "mueble": MUEBLES[i % len(MUEBLES)],
+            "cliente": CLIENTES[i % len(CLIENTES)],
+            "precio_original": precio_original,
+            "descuento": 10.0,
+            "precio_final": precio_final,
+            "cantidad": 1,
+            "total": round(precio_final * 1, 2),
+            "fecha": ahora.strftime("%Y-%m-%d %H:%M:%S")
+        })
+    return historial
+
+
+def con_registro(cantidad: int) -> RegistroVentas:
+    registro = RegistroVentas()
+    for i in range(cantidad):
+        ahora = datetime.datetime.now()
+        precio_original = 100.0 + i % 50
+        precio_final = round(precio_original * 0.9, 2)
+        registro.agregar((segundos_desde_epoca(ahora), CLIENTES[i % len(CLIENTES)],
+                          MUEBLES[i % len(MUEBLES)], 1, precio_original, 10.0,
+                          precio_final, round(precio_final * 1, 2)))
+    return registro
+
+
+def medir(funcion, cantidad: int) -> tuple:
+    """Segundos que tarda y bytes que quedan ocupados por el resultado."""
+    gc.collect()
+    inicio = time.perf_counter()
+    funcion(cantidad)
+    tiempo = time.perf_counter() - inicio
+    gc.collect()
+    tracemalloc.start()
+    resultado = funcion(cantidad)
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del resultado
+    return tiempo, memoria
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"{cantidad:,} ventas")
+    for nombre, funcion in (("diccionarios", con_diccionarios), ("columnas", con_registro)):
+        tiempo, memoria = medir(funcion, cantidad)
+        print(f"{nombre:<14}{tiempo:>8.2f} s{memoria / 2 ** 20:>10.1f} MB"
+              f"{memoria / cantidad:>8.0f} B/venta")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Benchmark: carga masiva de inventario.
+
+Mide el tiempo de TiendaMuebles.agregar_muebles_lote con un generador de
+muebles, separado del costo de construir los objetos.
+
+Uso:
+    python benchmarks/bench_ingesta.py [cantidad]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.tienda import TiendaMuebles
+from models.concretos.silla import Silla
+from models.concretos.mesa import Mesa
+
+
+def generar_muebles(cantidad: int):
+    """Genera `cantidad` muebles alternando sillas y mesas."""
+    for i in range(cantidad):
+        if i % 2:
+            yield Mesa(f"Mesa {i}", "Madera", "Roble", 300.0 + i % 100)
+        else:
+            yield Silla(f"Silla {i}", "Metal", "Negro", 100.0 + i % 50, True, "tela")
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    inicio = time.perf_counter()
+    muebles = list(generar_muebles(cantidad))
+    construccion = time.perf_counter() - inicio
+
+    tienda = TiendaMuebles("Tienda Benchmark")
+    inicio = time.perf_counter()
+    resumen = tienda.agregar_muebles_lote(muebles)
+    ingesta = time.perf_counter() - inicio
+
+    print(f"Muebles: {cantidad:,}")
+    print(f"  Construcción de objetos: {construccion:.2f} s")
+    print(f"  agregar_muebles_lote   : {ingesta:.2f} s ({cantidad / ingesta:,.0f} muebles/s)")
+    print(f"  Agregados: {resumen['agregados']:,}, rechazados: {len(resumen['rechazados'])}")
+
+
+if __name__ == "__main__":
+    main()
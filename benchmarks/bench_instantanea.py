@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark: arranque desde una instantánea binaria.
+
+Arma una tienda con N referencias, la guarda y mide, en un proceso nuevo:
+- la carga (cargar_instantanea: mmap y directorio),
+- las estadísticas (salen del resumen guardado),
+- el primer acceso al inventario (decodifica las columnas),
+- las dos primeras búsquedas por nombre (cada una indexa un trozo de
+  AlmacenMemoria.TROZO_NOMBRES muebles y recorre el resto),
+contra el tiempo de reconstruir la misma tienda creando cada objeto.
+
+Uso:
+    python benchmarks/bench_instantanea.py [cantidad]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from models.concretos.silla import Silla
+from models.concretos.mesa import Mesa
+from models.concretos.sofacama import SofaCama
+from services.tienda import TiendaMuebles
+
+MEDIR_CARGA = """
+import sys, time
+sys.path.insert(0, {raiz!r})
+inicio = time.perf_counter()
+from services.tienda import TiendaMuebles
+importar = time.perf_counter() - inicio
+inicio = time.perf_counter()
+tienda = TiendaMuebles.cargar_instantanea({ruta!r})
+carga = time.perf_counter() - inicio
+inicio = time.perf_counter()
+tienda.obtener_estadisticas()
+estadisticas = time.perf_counter() - inicio
+inicio = time.perf_counter()
+tienda.obtener_mueble_por_id(1)
+inventario = time.perf_counter() - inicio
+inicio = time.perf_counter()
+tienda.buscar_muebles_por_nombre("silla 12")
+nombres = time.perf_counter() - inicio
+inicio = time.perf_counter()
+tienda.buscar_muebles_por_nombre("mesa 7")
+segunda = time.perf_counter() - inicio
+print(importar, carga, estadisticas, inventario, nombres, segunda)
+"""
+
+
+def crear_muebles(cantidad: int):
+    for i in range(cantidad):
+        if i % 3 == 0:
+            yield Silla(f"Silla {i}", "Madera", "Negro", 100.0 + i % 50, True, "tela", i % 2 == 0, False)
+        elif i % 3 == 1:
+            yield Mesa(f"Mesa {i}", "Madera", "Roble", 300.0 + i % 50, "redonda", 6, 1.5, True)
+        else:
+            yield SofaCama(f"SofaCama {i}", "Tela", "Gris", 800.0 + i % 50)
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+    inicio = time.perf_counter()
+    tienda = TiendaMuebles("Benchmark")
+    tienda.agregar_muebles_lote(crear_muebles(cantidad))
+    tienda.buscar_muebles_por_nombre("silla 12")
+    reconstruir = time.perf_counter() - inicio
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "tienda.snap")
+        inicio = time.perf_counter()
+        tienda.guardar_instantanea(ruta)
+        guardar = time.perf_counter() - inicio
+        tamaño = os.path.getsize(ruta)
+        del tienda
+        salida = subprocess.run([sys.executable, "-c", MEDIR_CARGA.format(raiz=RAIZ, ruta=ruta)],
+                                capture_output=True, text=True, check=True).stdout
+        importar, carga, estadisticas, inventario, nombres, segunda = map(float, salida.split())
+
+    print(f"{cantidad:,} referencias, instantánea de {tamaño / 2 ** 20:.1f} MB")
+    print(f"Reconstruir creando objetos    {reconstruir:>8.2f} s")
+    print(f"Guardar instantánea            {guardar:>8.2f} s")
+    print(f"Importar la tienda             {importar:>8.3f} s")
+    print(f"Cargar instantánea             {carga:>8.3f} s")
+    print(f"Estadísticas                   {estadisticas:>8.3f} s")
+    print(f"Primer acceso al inventario    {inventario:>8.2f} s")
+    print(f"Primera búsqueda por nombre    {nombres:>8.2f} s")
+    print(f"Segunda búsqueda por nombre    {segunda:>8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memoria por mueble de cada clase concreta.
+
+Crea N instancias de cada una de las nueve clases concretas y reporta los
+bytes asignados por pieza (medidos con tracemalloc). Los textos se comparten
+entre instancias, de modo que la cifra refleja el tamaño del objeto y no el
+de sus cadenas.
+
+Con --dict mide la línea de base: cada pieza se reemplaza por un objeto
+común con los mismos atributos en su __dict__, como eran los muebles antes
+de pasar a __slots__. Correr ambos modos da la comparación antes/después.
+
+Uso:
+    python benchmarks/bench_memoria.py [--dict] [cantidad ...]
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.concretos.silla import Silla
+from models.concretos.sillon import Sillon
+from models.concretos.sofa import Sofa
+from models.concretos.sofacama import SofaCama
+from models.concretos.mesa import Mesa
+from models.concretos.escritorio import Escritorio
+from models.concretos.cama import Cama
+from models.concretos.armario import Armario
+from models.concretos.cajonera import Cajonera
+
+
+FABRICAS = {
+    "Silla": lambda: Silla("Silla", "Madera", "Negro", 100.0, True, "tela", True, False),
+    "Sillon": lambda: Sillon("Sillón", "Tela", "Gris", 400.0, True, "cuero", True, False),
+    "Sofa": lambda: Sofa("Sofá", "Tela", "Gris", 900.0, 3, True, "tela", False, True),
+    "SofaCama": lambda: SofaCama("SofaCama", "Tela", "Gris", 1200.0),
+    "Mesa": lambda: Mesa("Mesa", "Madera", "Roble", 300.0, "redonda", 6, 1.5, True),
+    "Escritorio": lambda: Escritorio("Escritorio", "Madera", "Negro", 250.0, "esquinero", 1.2, 75, True, 2),
+    "Cama": lambda: Cama("Cama", "Madera", "Blanco", 700.0, "queen"),
+    "Armario": lambda: Armario("Armario", "Madera", "Blanco", 500.0, 3, 2, True),
+    "Cajonera": lambda: Cajonera("Cajonera", "Madera", "Blanco", 150.0, 4, True),
+}
+
+
+class ConDict:
+    """Objeto con los atributos en el __dict__ (línea de base sin __slots__)."""
+
+
+def con_dict(fabrica):
+    """Fábrica de objetos ConDict con los mismos atributos que los de `fabrica`."""
+    # Una clase por tipo de mueble, como antes: las instancias de una misma
+    # clase comparten las claves de su __dict__
+    clase = type("ConDict", (ConDict,), {})
+
+    def crear():
+        mueble = fabrica()
+        objeto = clase()
+        # Se asignan uno por uno, como en un __init__, para que el __dict__
+        # comparta las claves entre instancias igual que en una clase común
+        for campo, valor in mueble.__getstate__()[1].items():
+            setattr(objeto, campo, valor)
+        objeto._observadores = ()
+        return objeto
+    return crear
+
+
+def bytes_por_pieza(fabrica, cantidad: int) -> float:
+    """Bytes asignados por instancia al crear `cantidad` muebles."""
+    piezas = [None] * cantidad
+    gc.collect()
+    tracemalloc.start()
+    inicio = tracemalloc.get_traced_memory()[0]
+    for i in range(cantidad):
+        piezas[i] = fabrica()
+    usado = tracemalloc.get_traced_memory()[0] - inicio
+    tracemalloc.stop()
+    del piezas
+    return usado / cantidad
+
+
+def main():
+    argumentos = sys.argv[1:]
+    base = "--dict" in argumentos
+    cantidades = [int(arg) for arg in argumentos if arg != "--dict"] or [10 ** 5, 10 ** 6]
+    print("Modo: " + ("línea de base con __dict__" if base else "__slots__"))
+    print("Clase       " + "".join(f"{cantidad:>14,}" for cantidad in cantidades))
+    for nombre, fabrica in FABRICAS.items():
+        if base:
+            fabrica = con_dict(fabrica)
+        fila = "".join(f"{bytes_por_pieza(fabrica, cantidad):>12.1f} B" for cantidad in cantidades)
+        print(f"{nombre:<12}{fila}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark: motor de precios por lote frente a calcular_precio por mueble.
+
+Recotiza N muebles variados (sin memoria de precios) con
+services.precios.calcular_precios y con un calcular_precio por objeto.
+
+Uso:
+    python benchmarks/bench_precios.py [cantidad]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.precios import calcular_precios
+from models.concretos.silla import Silla
+from models.concretos.mesa import Mesa
+from models.concretos.sofa import Sofa
+from models.concretos.cama import Cama
+
+
+def crear_muebles(cantidad: int) -> list:
+    """Crea `cantidad` muebles rotando entre cuatro clases."""
+    muebles = []
+    for i in range(cantidad):
+        tipo = i % 4
+        if tipo == 0:
+            muebles.append(Silla(f"Silla {i}", "Madera", "Negro", 100.0 + i % 50, True, "tela", i % 2 == 0))
+        elif tipo == 1:
+            muebles.append(Mesa(f"Mesa {i}", "Madera", "Roble", 300.0 + i % 100, "redonda", i % 8))
+        elif tipo == 2:
+            muebles.append(Sofa(f"Sofá {i}", "Tela", "Gris", 900.0 + i % 70, 2 + i % 4, True, "cuero"))
+        else:
+            muebles.append(Cama(f"Cama {i}", "Madera", "Blanco", 700.0 + i % 30, "queen"))
+    return muebles
+
+
+def olvidar_precios(muebles: list) -> None:
+    """Invalida la memoria de precios para medir el cálculo completo."""
+    for mueble in muebles:
+        mueble._precio_cache = None
+
+
+def medir(funcion, muebles: list, repeticiones: int = 5) -> float:
+    """Mejor tiempo (segundos) de varias repeticiones."""
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        olvidar_precios(muebles)
+        inicio = time.perf_counter()
+        funcion(muebles)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    muebles = crear_muebles(cantidad)
+    escalar = medir(lambda ms: [m.calcular_precio() for m in ms], muebles)
+    lote = medir(calcular_precios, muebles)
+    print(f"Muebles: {cantidad}")
+    print(f"  calcular_precio x N: {escalar:.3f} s")
+    print(f"  calcular_precios   : {lote:.3f} s")
+    print(f"  Aceleración: {escalar / lote:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
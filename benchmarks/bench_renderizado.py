@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark: reporte de inventario detallado en serie y con procesos.
+
+Arma una tienda con N muebles (sillas y sofá camas) y un comedor cada 20
+objetos, genera el reporte detallado en serie y con 2, 4, ... procesos
+hasta la cantidad de núcleos, verifica que el texto sea idéntico al serial
+y reporta el tiempo y la aceleración de cada configuración.
+
+El reporte usa un único grupo de procesos para todo el detalle, y queda en
+serie con un solo núcleo o por debajo de renderizado.MINIMO_PARALELO
+objetos: ahí los procesos solo suman el costo de serializar los muebles.
+
+Uso:
+    python benchmarks/bench_renderizado.py [cantidad] [procesos_max]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.composicion.comedor import Comedor
+from models.concretos.silla import Silla
+from models.concretos.mesa import Mesa
+from models.concretos.sofacama import SofaCama
+from services.renderizado import MINIMO_PARALELO, procesos_efectivos
+from services.tienda import TiendaMuebles
+
+
+def crear_tienda(cantidad: int) -> TiendaMuebles:
+    """Mezcla de sillas, sofá camas y comedores (uno cada 20 objetos)."""
+    muebles = []
+    tienda = TiendaMuebles("Tienda Benchmark")
+    for i in range(cantidad):
+        if i % 20 == 0:
+            mesa = Mesa(f"Mesa {i}", "Madera", "Roble", 300.0 + i % 50, "redonda", 6, 1.5, True)
+            sillas = [Silla(f"Silla {i}-{j}", "Madera", "Negro", 100.0, True, "tela", True, False) for j in range(4)]
+            tienda.agregar_comedor(Comedor(f"Comedor {i}", mesa, sillas))
+        elif i % 2:
+            muebles.append(Silla(f"Silla {i}", "Madera", "Negro", 100.0 + i % 50, True, "tela", True, False))
+        else:
+            muebles.append(SofaCama(f"SofaCama {i}", "Tela", "Gris", 800.0 + i % 50))
+    tienda.agregar_muebles_lote(muebles, agrupar=False)
+    return tienda
+
+
+def medir(funcion) -> tuple:
+    """Tiempo en segundos y resultado de la función."""
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return time.perf_counter() - inicio, resultado
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    maximo = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    tienda = crear_tienda(cantidad)
+
+    serial, esperado = medir(lambda: tienda.generar_reporte_inventario(detalle=True))
+    print(f"{cantidad:,} objetos, {os.cpu_count()} núcleos disponibles, umbral {MINIMO_PARALELO:,}")
+    print(f"{'Serie':<12}{serial:>8.2f} s")
+    procesos = 2
+    while procesos <= maximo:
+        efectivos = procesos_efectivos(procesos, cantidad)
+        tiempo, texto = medir(lambda: tienda.generar_reporte_inventario(detalle=True, procesos=procesos))
+        assert texto == esperado, "El texto en paralelo difiere del serial"
+        print(f"{procesos:>2} procesos {tiempo:>8.2f} s   x{serial / tiempo:.2f}"
+              f"{'' if efectivos > 1 else '   (en serie)'}")
+        procesos *= 2
+    if maximo < 2:
+        print("Un solo núcleo: el reporte queda en serie")
+
+
+if __name__ == "__main__":
+    main()
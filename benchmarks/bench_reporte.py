@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memoria pico del reporte de inventario con detalle.
+
+Compara armar el reporte completo como texto (generar_reporte_inventario)
+contra escribirlo línea por línea en un archivo (escribir_reporte_inventario).
+La memoria pico se mide con tracemalloc después de cargar la tienda, así que
+solo cuenta lo que asigna el reporte.
+
+Uso:
+    python benchmarks/bench_reporte.py [cantidad ...]
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.concretos.silla import Silla
+from models.concretos.mesa import Mesa
+from services.tienda import TiendaMuebles
+
+
+def crear_tienda(cantidad: int) -> TiendaMuebles:
+    """Tienda con `cantidad` referencias de sillas y mesas."""
+    tienda = TiendaMuebles("Benchmark")
+    tienda.agregar_muebles_lote(
+        Silla(f"Silla {i}", "Madera", "Negro", 100.0 + i % 50, True, "tela", True, False) if i % 2
+        else Mesa(f"Mesa {i}", "Madera", "Roble", 300.0 + i % 50, "redonda", 6, 1.5, True)
+        for i in range(cantidad)
+    )
+    return tienda
+
+
+def memoria_pico(funcion) -> int:
+    """Bytes pico asignados mientras corre la función."""
+    gc.collect()
+    tracemalloc.start()
+    funcion()
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return pico
+
+
+def main():
+    cantidades = [int(arg) for arg in sys.argv[1:]] or [10 ** 4, 10 ** 5]
+    print(f"{'Referencias':>12}{'texto completo':>18}{'en flujo':>14}")
+    for cantidad in cantidades:
+        tienda = crear_tienda(cantidad)
+        completo = memoria_pico(lambda: len(tienda.generar_reporte_inventario(detalle=True)))
+        with open(os.devnull, "w", encoding="utf-8") as archivo:
+            flujo = memoria_pico(lambda: tienda.escribir_reporte_inventario(archivo, detalle=True))
+        print(f"{cantidad:>12,}{completo / 1024:>15.0f} KB{flujo / 1024:>11.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
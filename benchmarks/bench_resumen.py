@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark: totales de una ventana de tiempo desde los resúmenes contra
+recorrer el historial.
+
+Registra N ventas repartidas en varios días y compara, para ventanas de
+distinto largo con bordes no alineados, RegistroVentas.totales contra
+sumar venta por venta las posiciones de la ventana, verificando que den
+lo mismo. También reporta el costo de mantener los resúmenes al registrar.
+
+Uso:
+    python benchmarks/bench_resumen.py [cantidad]
+"""
+
+import datetime
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.ventas import RegistroVentas, segundos_desde_epoca
+
+TIPOS = ("Silla", "Mesa", "Sofa", "Cama")
+VENTANAS = {"10 minutos": 600, "1 hora": 3600, "1 día": 86400, "7 días": 7 * 86400}
+
+
+def crear_registro(cantidad: int) -> RegistroVentas:
+    azar = random.Random(1)
+    registro = RegistroVentas()
+    momento = segundos_desde_epoca(datetime.datetime(2024, 1, 1))
+    for i in range(cantidad):
+        momento += azar.randint(0, 2)
+        tipo = TIPOS[i % len(TIPOS)]
+        registro.agregar((momento, f"Cliente {i % 500}", f"{tipo} {i % 100}", 1,
+                          110.0, 10.0, 99.0, 99.0), tipo)
+    return registro
+
+
+def por_recorrido(registro: RegistroVentas, desde: int, hasta: int) -> tuple:
+    ventas = unidades = 0
+    ingresos = 0.0
+    for posicion in registro.posiciones(desde, hasta):
+        ventas += 1
+        unidades += registro._cantidades[posicion]
+        ingresos += registro._totales[posicion]
+    return ventas, unidades, round(ingresos, 2)
+
+
+def medir(funcion, repeticiones: int = 20) -> tuple:
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        resultado = funcion()
+    return (time.perf_counter() - inicio) / repeticiones, resultado
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    inicio = time.perf_counter()
+    registro = crear_registro(cantidad)
+    print(f"{cantidad:,} ventas registradas en {time.perf_counter() - inicio:.2f} s")
+    primera = registro.fila(0)[0]
+    print(f"{'Ventana':<14}{'ventas':>10}{'recorrido':>14}{'resúmenes':>14}")
+    for nombre, largo in VENTANAS.items():
+        desde = primera + 3 * 86400 + 3 * 3600 + 17 * 60 + 13
+        hasta = desde + largo
+        tiempo_recorrido, esperado = medir(lambda: por_recorrido(registro, desde, hasta))
+        tiempo_resumen, totales = medir(lambda: registro.totales(desde, hasta))
+        obtenido = (totales["ventas"], totales["unidades"], round(totales["ingresos"], 2))
+        assert obtenido == esperado, f"Los totales difieren en '{nombre}'"
+        print(f"{nombre:<14}{esperado[0]:>10,}{tiempo_recorrido * 1000:>11.2f} ms"
+              f"{tiempo_resumen * 1000:>11.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
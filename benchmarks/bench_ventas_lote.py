@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark: ventas por lote frente a ventas individuales.
+
+Compara el tiempo de vender N muebles con una llamada a
+TiendaMuebles.realizar_ventas_lote contra N llamadas a realizar_venta.
+
+Uso:
+    python benchmarks/bench_ventas_lote.py [cantidad]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.tienda import TiendaMuebles
+from models.concretos.silla import Silla
+from models.concretos.mesa import Mesa
+
+
+def crear_tienda(cantidad: int) -> TiendaMuebles:
+    """Crea una tienda con `cantidad` muebles alternando sillas y mesas."""
+    tienda = TiendaMuebles("Tienda Benchmark")
+    tienda.aplicar_descuento("silla", 10)
+    for i in range(cantidad):
+        if i % 2:
+            mueble = Mesa(f"Mesa {i}", "Madera", "Roble", 300.0 + i % 100)
+        else:
+            mueble = Silla(f"Silla {i}", "Metal", "Negro", 100.0 + i % 50, True, "tela")
+        tienda.agregar_mueble(mueble)
+    return tienda
+
+
+def medir_individual(cantidad: int) -> float:
+    """Segundos que tarda vender todo el inventario con realizar_venta."""
+    tienda = crear_tienda(cantidad)
+    muebles = list(tienda._inventario)
+    inicio = time.perf_counter()
+    for mueble in muebles:
+        tienda.realizar_venta(mueble, "Cliente Benchmark")
+    return time.perf_counter() - inicio
+
+
+def medir_lote(cantidad: int) -> float:
+    """Segundos que tarda vender todo el inventario con realizar_ventas_lote."""
+    tienda = crear_tienda(cantidad)
+    muebles = list(tienda._inventario)
+    inicio = time.perf_counter()
+    tienda.realizar_ventas_lote(muebles, "Cliente Benchmark")
+    return time.perf_counter() - inicio
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    individual = medir_individual(cantidad)
+    lote = medir_lote(cantidad)
+    print(f"Ventas: {cantidad}")
+    print(f"  realizar_venta x N : {individual:.3f} s ({cantidad / individual:,.0f} ventas/s)")
+    print(f"  realizar_ventas_lote: {lote:.3f} s ({cantidad / lote:,.0f} ventas/s)")
+    print(f"  Aceleración: {individual / lote:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
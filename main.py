@@ -2,8 +2,20 @@
 """
 Punto de entrada principal para la aplicación Tienda de Muebles.
 Este archivo inicializa la aplicación y proporciona datos de ejemplo.
+
+Uso:
+    python main.py [--instantanea ARCHIVO] [--diario ARCHIVO [--grupo N]]
+
+Con --instantanea la tienda se carga desde ese archivo si existe; si no,
+se arma con los datos de ejemplo y se guarda ahí para el próximo arranque.
+Con --diario cada venta se escribe en ese archivo antes de aplicarse y al
+arrancar se reproducen las ventas que haya en él; --grupo indica cada
+cuántas ventas se sincroniza el diario con el disco.
 """
 
+import argparse
+import os
+
 from services.tienda import TiendaMuebles
 from ui.menu import MenuTienda
 
@@ -322,6 +334,30 @@ def mostrar_estadisticas_iniciales(tienda: 'TiendaMuebles') -> None:
         print(f"    • {tipo}: {cantidad} unidades")
 
 
+def crear_tienda(ruta_instantanea: str = None) -> 'TiendaMuebles':
+    """
+    Obtiene la tienda: desde la instantánea si existe, o armándola con los
+    datos de ejemplo (y guardándola en la instantánea si se indicó una).
+    """
+    if ruta_instantanea and os.path.exists(ruta_instantanea):
+        tienda = TiendaMuebles.cargar_instantanea(ruta_instantanea)
+        print(f"⚡ {tienda.nombre} cargada desde {ruta_instantanea}")
+        return tienda
+
+    tienda = TiendaMuebles("Mueblería Moderna OOP")
+    print(f"🏪 Inicializando {tienda.nombre}...")
+    
+    crear_catalogo_inicial(tienda)
+    
+    crear_comedores_ejemplo(tienda)
+    
+    aplicar_descuentos_ejemplo(tienda)
+
+    if ruta_instantanea:
+        print(f"💾 {tienda.guardar_instantanea(ruta_instantanea)}")
+    return tienda
+
+
 def main():
     """
     Función principal que inicializa y ejecuta la aplicación.
@@ -333,18 +369,26 @@ def main():
     - Herencia múltiple con el sofá-cama
     - Encapsulación y abstracción en toda la jerarquía
     """
+    parser = argparse.ArgumentParser(description="Tienda de Muebles - Taller OOP")
+    parser.add_argument("--instantanea", metavar="ARCHIVO",
+                        help="instantánea binaria desde la que cargar (o en la que guardar) la tienda")
+    parser.add_argument("--diario", metavar="ARCHIVO",
+                        help="diario de ventas en disco que se reproduce al arrancar")
+    parser.add_argument("--grupo", metavar="N", type=int, default=32,
+                        help="ventas por sincronización del diario (1 = cada venta)")
+    argumentos = parser.parse_args()
+    tienda = None
     try:
         print("🏠 Bienvenido a la Tienda de Muebles - Taller OOP 🏠")
         print("=" * 50)
         
-        tienda = TiendaMuebles("Mueblería Moderna OOP")
-        print(f"🏪 Inicializando {tienda.nombre}...")
-        
-        crear_catalogo_inicial(tienda)
-        
-        crear_comedores_ejemplo(tienda)
-        
-        aplicar_descuentos_ejemplo(tienda)
+        tienda = crear_tienda(argumentos.instantanea)
+        if argumentos.diario:
+            resultado = tienda.abrir_diario(argumentos.diario, tamaño_grupo=argumentos.grupo)
+            if "error" in resultado:
+                print(f"❌ {resultado['error']}")
+            else:
+                print(f"📒 Diario {argumentos.diario}: {resultado['ventas_recuperadas']} ventas recuperadas")
         
         mostrar_estadisticas_iniciales(tienda)
         
@@ -362,6 +406,8 @@ def main():
         import traceback
         traceback.print_exc()
     finally:
+        if tienda is not None:
+            tienda.cerrar_diario()
         print("\n" + "=" * 50)
         print("✨ Programa finalizado. ¡Gracias por usar la Tienda de Muebles! ✨")
 
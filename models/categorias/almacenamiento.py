@@ -11,6 +11,9 @@ class Almacenamiento(Mueble):
 	Clase abstracta para muebles que almacenan objetos.
 	Agrupa características comunes de armarios, cajoneras, etc.
 	"""
+
+	__slots__ = ('_num_puertas', '_num_cajones', '_tiene_espejos')
+
 	def __init__(self, nombre: str, material: str, color: str, precio_base: float,
 				 num_puertas: int = 0, num_cajones: int = 0, tiene_espejos: bool = False):
 		super().__init__(nombre, material, color, precio_base)
@@ -27,6 +30,7 @@ class Almacenamiento(Mueble):
 		if value < 0:
 			raise ValueError("El número de puertas no puede ser negativo")
 		self._num_puertas = value
+		self._precio_modificado()
 
 	@property
 	def num_cajones(self) -> int:
@@ -37,6 +41,7 @@ class Almacenamiento(Mueble):
 		if value < 0:
 			raise ValueError("El número de cajones no puede ser negativo")
 		self._num_cajones = value
+		self._precio_modificado()
 
 	@property
 	def tiene_espejos(self) -> bool:
@@ -45,6 +50,7 @@ class Almacenamiento(Mueble):
 	@tiene_espejos.setter
 	def tiene_espejos(self, value: bool) -> None:
 		self._tiene_espejos = bool(value)
+		self._precio_modificado()
 
 	def obtener_info_almacenamiento(self) -> str:
 		info = f"Puertas: {self.num_puertas}, Cajones: {self.num_cajones}"
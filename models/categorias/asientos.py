@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from models.mueble import Mueble
+from models.categorico import categorico
 
 class Asiento(Mueble, ABC):
     """
@@ -8,12 +9,14 @@ class Asiento(Mueble, ABC):
     como capacidad de personas, tipo de respaldo, material de tapizado, etc.
     """
 
+    __slots__ = ('_capacidad_personas', '_tiene_respaldo', '_material_tapizado')
+
     def __init__(self, nombre: str, material: str, color: str, precio_base: float,
                  capacidad_personas: int, tiene_respaldo: bool, material_tapizado: str = None):
         super().__init__(nombre, material, color, precio_base)
         self._capacidad_personas = capacidad_personas
         self._tiene_respaldo = tiene_respaldo
-        self._material_tapizado = material_tapizado
+        self._material_tapizado = categorico(material_tapizado)
 
     @property
     def capacidad_personas(self) -> int:
@@ -25,6 +28,7 @@ class Asiento(Mueble, ABC):
         if value <= 0:
             raise ValueError("La capacidad debe ser mayor a 0")
         self._capacidad_personas = value
+        self._precio_modificado()
 
     @property
     def tiene_respaldo(self) -> bool:
@@ -34,6 +38,7 @@ class Asiento(Mueble, ABC):
     @tiene_respaldo.setter
     def tiene_respaldo(self, value: bool) -> None:
         self._tiene_respaldo = bool(value)
+        self._precio_modificado()
 
     @property
     def material_tapizado(self) -> str:
@@ -44,23 +49,29 @@ class Asiento(Mueble, ABC):
     def material_tapizado(self, value: str) -> None:
         if value is not None and not value.strip():
             raise ValueError("El material de tapizado no puede estar vacío si se especifica")
-        self._material_tapizado = value.strip() if value else None
+        self._material_tapizado = categorico(value.strip()) if value else None
+        self._precio_modificado()
 
     def calcular_factor_comodidad(self) -> float:
         """
         Calcula un factor de comodidad basado en las características del asiento.
         Este es un método concreto que pueden usar las clases hijas.
         """
+        return Asiento._factor_comodidad(self._tiene_respaldo, self._material_tapizado, self._capacidad_personas)
+
+    @staticmethod
+    def _factor_comodidad(tiene_respaldo: bool, material_tapizado, capacidad_personas: int) -> float:
+        """Factor de comodidad a partir de los campos del asiento (lo usan las fórmulas de precio)."""
         factor = 1.0
-        if self.tiene_respaldo:
+        if tiene_respaldo:
             factor += 0.1
-        if self.material_tapizado:
-            if self.material_tapizado.lower() == "cuero":
+        if material_tapizado:
+            if material_tapizado.clave == "cuero":
                 factor += 0.2
-            elif self.material_tapizado.lower() == "tela":
+            elif material_tapizado.clave == "tela":
                 factor += 0.1
-        if self.capacidad_personas > 1:
-            factor += 0.05 * (self.capacidad_personas - 1)
+        if capacidad_personas > 1:
+            factor += 0.05 * (capacidad_personas - 1)
         return factor
 
     def obtener_info_asiento(self) -> str:
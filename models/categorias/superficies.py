@@ -5,6 +5,7 @@ Ejemplos: mesas, escritorios, etc.
 """
 
 from ..mueble import Mueble
+from ..categorico import categorico
 from abc import abstractmethod
 
 class Superficie(Mueble):
@@ -12,10 +13,13 @@ class Superficie(Mueble):
 	Clase abstracta para muebles que proporcionan una superficie de uso.
 	Agrupa características comunes de mesas, escritorios, etc.
 	"""
+
+	__slots__ = ('_forma', '_area_superficie')
+
 	def __init__(self, nombre: str, material: str, color: str, precio_base: float,
 				 forma: str, area_superficie: float):
 		super().__init__(nombre, material, color, precio_base)
-		self._forma = forma  # Ejemplo: rectangular, redonda, cuadrada
+		self._forma = categorico(forma)  # Ejemplo: rectangular, redonda, cuadrada
 		self._area_superficie = area_superficie  # en metros cuadrados
 
 	@property
@@ -26,7 +30,8 @@ class Superficie(Mueble):
 	def forma(self, value: str) -> None:
 		if not value or not value.strip():
 			raise ValueError("La forma no puede estar vacía")
-		self._forma = value.strip()
+		self._forma = categorico(value.strip())
+		self._precio_modificado()
 
 	@property
 	def area_superficie(self) -> float:
@@ -37,6 +42,7 @@ class Superficie(Mueble):
 		if value <= 0:
 			raise ValueError("El área debe ser mayor a 0")
 		self._area_superficie = value
+		self._precio_modificado()
 
 	def obtener_info_superficie(self) -> str:
 		info = f"Forma: {self.forma}, Área: {self.area_superficie} m²"
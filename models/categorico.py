@@ -0,0 +1,63 @@
+"""
+Valores categóricos internados.
+Los atributos de texto con pocos valores posibles (material, color, tapizado,
+forma, tamaño, mecanismo) se normalizan una sola vez al asignarse y todos
+los muebles con el mismo texto comparten un único objeto.
+"""
+
+import sys
+from typing import Dict, Optional
+
+
+class ValorCategorico(str):
+    """
+    Texto categórico compartido entre todos los muebles que lo usan.
+
+    Se comporta como el str original (igualdad, hash, impresión), y además
+    guarda su forma normalizada y un código entero estable:
+    - clave: texto en minúsculas y sin espacios extremos (internado con
+      sys.intern, por lo que compararlo con un literal es por identidad)
+    - codigo: entero único por clave; "Madera" y "madera" comparten código
+
+    No se instancia directamente: se obtiene con categorico().
+    """
+
+    def __reduce__(self):
+        # Al deserializar se vuelve a pasar por el registro para seguir compartiendo el objeto
+        return (categorico, (str(self),))
+
+
+_POR_TEXTO: Dict[str, ValorCategorico] = {}
+_CODIGOS: Dict[str, int] = {}
+
+
+def categorico(valor: Optional[str]) -> Optional[ValorCategorico]:
+    """
+    Obtiene el valor categórico compartido para un texto.
+
+    Args:
+        valor: Texto a internar (None y los valores que no son texto se devuelven tal cual)
+
+    Returns:
+        Optional[ValorCategorico]: Objeto único para ese texto exacto
+    """
+    if type(valor) is ValorCategorico or not isinstance(valor, str):
+        return valor
+    compartido = _POR_TEXTO.get(valor)
+    if compartido is None:
+        clave = sys.intern(valor.lower().strip())
+        compartido = ValorCategorico(valor)
+        compartido.clave = clave
+        compartido.codigo = _CODIGOS.setdefault(clave, len(_CODIGOS))
+        _POR_TEXTO[str(compartido)] = compartido
+    return compartido
+
+
+def codigo_de(valor: str) -> int:
+    """
+    Obtiene el código de un texto sin registrarlo.
+
+    Returns:
+        int: Código de la clave normalizada, o -1 si ningún mueble la usa
+    """
+    return _CODIGOS.get(valor.lower().strip(), -1)
@@ -4,11 +4,51 @@ Un comedor está compuesto por una mesa y varias sillas.
 """
 from models.concretos.mesa import Mesa
 from models.concretos.silla import Silla
-from typing import List
+from models.observable import Observable
+from collections.abc import Sequence
+from typing import Iterator, List
 
-class Comedor:
+
+class VistaSillas(Sequence):
+    """
+    Vista de solo lectura sobre las sillas de un comedor.
+
+    No copia la lista: refleja siempre el estado actual del comedor y no
+    permite modificarlo, por lo que consultarla no reserva memoria.
+    """
+
+    __slots__ = ('_sillas',)
+
+    def __init__(self, sillas: List['Silla']):
+        self._sillas = sillas
+
+    def __getitem__(self, indice):
+        return self._sillas[indice]
+
+    def __len__(self) -> int:
+        return len(self._sillas)
+
+    def __iter__(self) -> Iterator['Silla']:
+        return iter(self._sillas)
+
+    def __contains__(self, silla: object) -> bool:
+        return silla in self._sillas
+
+    def __repr__(self) -> str:
+        return f"VistaSillas({self._sillas!r})"
+
+
+class Comedor(Observable):
     """
     Clase que implementa composición conteniendo una mesa y sillas.
+
+    El comedor observa a sus componentes y notifica "precio" cuando cambia
+    el precio de alguno, "materiales" cuando cambia el material de alguno y
+    "sillas" cuando se agregan o quitan sillas.
+
+    El subtotal de las sillas se lleva acumulado en centavos: agregar_silla,
+    quitar_silla y los cambios de precio de una silla lo ajustan por la
+    diferencia, así que calcular el precio total no recorre las sillas.
     """
 
     def __init__(self, nombre: str, mesa: 'Mesa', sillas: List['Silla'] = None):
@@ -17,7 +57,14 @@ class Comedor:
         """
         self._nombre = nombre
         self._mesa = mesa
-        self._sillas = sillas if sillas is not None else []
+        self._sillas = list(sillas) if sillas is not None else []
+        self._vista_sillas = VistaSillas(self._sillas)
+        # Precio en centavos de cada silla (alineado con _sillas) y su suma
+        self._centavos_sillas = [self._centavos(silla) for silla in self._sillas]
+        self._subtotal_centavos = sum(self._centavos_sillas)
+        self._mesa._suscribir(self._al_modificar_componente)
+        for silla in self._sillas:
+            silla._suscribir(self._al_modificar_componente)
 
     @property
     def nombre(self) -> str:
@@ -30,9 +77,24 @@ class Comedor:
         return self._mesa
 
     @property
-    def sillas(self) -> List['Silla']:
-        """Getter para la lista de sillas."""
-        return self._sillas.copy()  # Retorna una copia para proteger la lista interna
+    def sillas(self) -> VistaSillas:
+        """Getter para las sillas: vista de solo lectura, sin copiar la lista interna."""
+        return self._vista_sillas
+
+    @property
+    def cantidad_sillas(self) -> int:
+        """Getter para la cantidad de sillas."""
+        return len(self._sillas)
+
+    @property
+    def precio_sillas(self) -> float:
+        """Getter para el subtotal acumulado de las sillas."""
+        return self._subtotal_centavos / 100
+
+    @staticmethod
+    def _centavos(mueble) -> int:
+        """Precio de un mueble en centavos enteros (las sumas no acumulan error)."""
+        return round(mueble.calcular_precio() * 100)
 
     def agregar_silla(self, silla: 'Silla') -> str:
         """
@@ -43,7 +105,12 @@ class Comedor:
         capacidad_maxima = self._calcular_capacidad_maxima()
         if len(self._sillas) >= capacidad_maxima:
             return f"No se pueden agregar más sillas. Capacidad máxima: {capacidad_maxima}"
+        centavos = self._centavos(silla)
         self._sillas.append(silla)
+        self._centavos_sillas.append(centavos)
+        self._subtotal_centavos += centavos
+        silla._suscribir(self._al_modificar_componente)
+        self._notificar("sillas")
         return f"Silla {silla.nombre} agregada exitosamente al comedor"
 
     def quitar_silla(self, indice: int = -1) -> str:
@@ -54,17 +121,55 @@ class Comedor:
             return "No hay sillas para quitar"
         try:
             silla_removida = self._sillas.pop(indice)
+            self._subtotal_centavos -= self._centavos_sillas.pop(indice)
+            if silla_removida not in self._sillas:  # la misma silla puede figurar dos veces
+                silla_removida._desuscribir(self._al_modificar_componente)
+            self._notificar("sillas")
             return f"Silla {silla_removida.nombre} removida del comedor"
         except IndexError:
             return "Índice de silla inválido"
 
+    def __getstate__(self) -> dict:
+        """Estado para pickle y copy, sin los observadores del comedor."""
+        estado = self.__dict__.copy()
+        estado.pop('_observadores', None)
+        return estado
+
+    def __setstate__(self, estado: dict) -> None:
+        """Restaura el estado y vuelve a observar a los componentes."""
+        self.__dict__.update(estado)
+        self._mesa._suscribir(self._al_modificar_componente)
+        for silla in self._sillas:
+            silla._suscribir(self._al_modificar_componente)
+
+    def _al_modificar_componente(self, mueble, atributo: str) -> None:
+        """
+        Propaga a los observadores del comedor los cambios de precio y de material de sus componentes.
+        Método privado auxiliar.
+        """
+        if atributo == "precio":
+            if mueble is not self._mesa:
+                self._actualizar_precio_silla(mueble)
+            self._notificar("precio")
+        elif atributo == "material":
+            self._notificar("materiales")
+
+    def _actualizar_precio_silla(self, silla: 'Silla') -> None:
+        """
+        Ajusta el subtotal por la diferencia de precio de una silla modificada.
+        Método privado auxiliar.
+        """
+        for indice, actual in enumerate(self._sillas):
+            if actual is silla:
+                centavos = self._centavos(silla)
+                self._subtotal_centavos += centavos - self._centavos_sillas[indice]
+                self._centavos_sillas[indice] = centavos
+
     def calcular_precio_total(self) -> float:
         """
         Calcula el precio total del comedor sumando todos sus componentes.
         """
-        precio_total = self._mesa.calcular_precio()
-        for silla in self._sillas:
-            precio_total += silla.calcular_precio()
+        precio_total = (self._centavos(self._mesa) + self._subtotal_centavos) / 100
         # Aplicar descuento por set completo (5% si tiene 4 o más sillas)
         if len(self._sillas) >= 4:
             precio_total *= 0.95  # 5% de descuento
@@ -108,7 +213,7 @@ class Comedor:
             "nombre": self.nombre,
             "total_muebles": 1 + len(self._sillas),  # mesa + sillas
             "precio_mesa": self._mesa.calcular_precio(),
-            "precio_sillas": sum(silla.calcular_precio() for silla in self._sillas),
+            "precio_sillas": self.precio_sillas,
             "precio_total": self.calcular_precio_total(),
             "capacidad_personas": len(self._sillas),
             "materiales_utilizados": self._obtener_materiales_unicos()
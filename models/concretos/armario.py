@@ -1,26 +1,40 @@
 """
 Clase concreta Armario.
 """
+from operator import attrgetter
 from models.categorias.almacenamiento import Almacenamiento
+from models.mueble import precio_memorizado
 
 
 class Armario(Almacenamiento):
+    __slots__ = ()
+
     def __init__(self, nombre: str, material: str, color: str, precio_base: float,
                  num_puertas: int = 2, num_cajones: int = 0, tiene_espejos: bool = False):
         super().__init__(nombre, material, color, precio_base, num_puertas, num_cajones, tiene_espejos)
 
     # Los getters y setters ya están implementados en la clase base Almacenamiento
 
+    # Campos que usa la fórmula de precio, en el orden de _precio. calcular_precio
+    # y el motor por lote (services.precios) los leen con este attrgetter.
+    _valores_precio = attrgetter('_precio_base', '_num_puertas', '_num_cajones', '_tiene_espejos')
+
+    @staticmethod
+    def _precio(precio_base, num_puertas, num_cajones, tiene_espejos) -> float:
+        """Fórmula de precio del armario a partir de sus campos."""
+        precio = precio_base
+        precio += 200 * num_puertas
+        precio += 80 * num_cajones
+        if tiene_espejos:
+            precio += 250
+        return round(precio, 2)
+
+    @precio_memorizado
     def calcular_precio(self) -> float:
         """
         Calcula el precio del armario según sus características.
         """
-        precio = self.precio_base
-        precio += 200 * self.num_puertas
-        precio += 80 * self.num_cajones
-        if self.tiene_espejos:
-            precio += 250
-        return round(precio, 2)
+        return Armario._precio(*Armario._valores_precio(self))
 
     def obtener_descripcion(self) -> str:
         """
@@ -1,10 +1,14 @@
 """
 Clase concreta Cajonera.
 """
+from operator import attrgetter
 from models.categorias.almacenamiento import Almacenamiento
+from models.mueble import precio_memorizado
 
 
 class Cajonera(Almacenamiento):
+    __slots__ = ('_tiene_ruedas',)
+
     def __init__(self, nombre: str, material: str, color: str, precio_base: float,
                  num_cajones: int = 3, tiene_ruedas: bool = False):
         super().__init__(nombre, material, color, precio_base, 0, num_cajones, False)
@@ -17,16 +21,27 @@ class Cajonera(Almacenamiento):
     @tiene_ruedas.setter
     def tiene_ruedas(self, value: bool) -> None:
         self._tiene_ruedas = bool(value)
+        self._precio_modificado()
+
+    # Campos que usa la fórmula de precio, en el orden de _precio. calcular_precio
+    # y el motor por lote (services.precios) los leen con este attrgetter.
+    _valores_precio = attrgetter('_precio_base', '_num_cajones', '_tiene_ruedas')
 
+    @staticmethod
+    def _precio(precio_base, num_cajones, tiene_ruedas) -> float:
+        """Fórmula de precio de la cajonera a partir de sus campos."""
+        precio = precio_base
+        precio += 70 * num_cajones
+        if tiene_ruedas:
+            precio += 50
+        return round(precio, 2)
+
+    @precio_memorizado
     def calcular_precio(self) -> float:
         """
         Calcula el precio de la cajonera según sus características.
         """
-        precio = self.precio_base
-        precio += 70 * self.num_cajones
-        if self.tiene_ruedas:
-            precio += 50
-        return round(precio, 2)
+        return Cajonera._precio(*Cajonera._valores_precio(self))
 
     def obtener_descripcion(self) -> str:
         """
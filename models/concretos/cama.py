@@ -1,14 +1,27 @@
 """
 Clase concreta Cama.
 """
-from models.mueble import Mueble
+from operator import attrgetter
+from models.categorico import categorico
+from models.mueble import Mueble, precio_memorizado
+
+class CamaBase(Mueble):
+    """
+    Comportamiento de una cama, sin campos propios.
+
+    Python no permite que dos ramas de una herencia múltiple agreguen slots
+    a la vez ("multiple bases have instance lay-out conflict"), así que los
+    métodos de la cama viven en este mixin con __slots__ vacío y cada clase
+    concreta declara _tamaño, _incluye_colchon y _tiene_cabecera en sus
+    propios slots: Cama más abajo y SofaCama, que hereda de Sofa y de CamaBase.
+    """
+
+    __slots__ = ()
 
-class Cama(Mueble):
-    
     def __init__(self, nombre: str, material: str, color: str, precio_base: float,
                  tamaño: str = "matrimonial", incluye_colchon: bool = True, tiene_cabecera: bool = True):
         super().__init__(nombre, material, color, precio_base)
-        self._tamaño = tamaño
+        self._tamaño = categorico(tamaño)
         self._incluye_colchon = incluye_colchon
         self._tiene_cabecera = tiene_cabecera
     @property
@@ -19,6 +32,7 @@ class Cama(Mueble):
     @tiene_cabecera.setter
     def tiene_cabecera(self, value: bool) -> None:
         self._tiene_cabecera = bool(value)
+        self._precio_modificado()
 
     @property
     def tamaño(self) -> str:
@@ -29,7 +43,8 @@ class Cama(Mueble):
     def tamaño(self, value: str) -> None:
         if not value or not value.strip():
             raise ValueError("El tamaño de la cama no puede estar vacío")
-        self._tamaño = value.strip()
+        self._tamaño = categorico(value.strip())
+        self._precio_modificado()
 
     @property
     def incluye_colchon(self) -> bool:
@@ -39,28 +54,40 @@ class Cama(Mueble):
     @incluye_colchon.setter
     def incluye_colchon(self, value: bool) -> None:
         self._incluye_colchon = bool(value)
+        self._precio_modificado()
 
-    def calcular_precio(self) -> float:
-        """
-        Calcula el precio de la cama según sus características.
-        """
-        precio = self.precio_base
-        if self.tamaño.lower() == "queen":
+    # Campos que usa la fórmula de precio, en el orden de _precio. calcular_precio
+    # y el motor por lote (services.precios) los leen con este attrgetter.
+    _valores_precio = attrgetter('_precio_base', '_tamaño', '_incluye_colchon', '_tiene_cabecera')
+
+    @staticmethod
+    def _precio(precio_base, tamaño, incluye_colchon, tiene_cabecera) -> float:
+        """Fórmula de precio de la cama a partir de sus campos."""
+        precio = precio_base
+        tamaño = tamaño.clave
+        if tamaño == "queen":
             precio += 400
-        elif self.tamaño.lower() == "king":
+        elif tamaño == "king":
             precio += 600
-        elif self.tamaño.lower() == "matrimonial":
+        elif tamaño == "matrimonial":
             precio += 200
-        elif self.tamaño.lower() == "individual":
+        elif tamaño == "individual":
             precio += 0
         else:
             precio += 100
-        if self.incluye_colchon:
+        if incluye_colchon:
             precio += 350
-        if self.tiene_cabecera:
+        if tiene_cabecera:
             precio += 120
         return round(precio, 2)
 
+    @precio_memorizado
+    def calcular_precio(self) -> float:
+        """
+        Calcula el precio de la cama según sus características.
+        """
+        return CamaBase._precio(*CamaBase._valores_precio(self))
+
     def obtener_descripcion(self) -> str:
         """
         Devuelve la descripción completa de la cama.
@@ -73,4 +100,17 @@ class Cama(Mueble):
         return descripcion
 
     def __str__(self) -> str:
-        return f"Cama {self.nombre} ({self.tamaño})"
\ No newline at end of file
+        return f"Cama {self.nombre} ({self.tamaño})"
+
+
+class Cama(CamaBase):
+    """
+    Clase concreta Cama.
+    """
+
+    __slots__ = ('_tamaño', '_incluye_colchon', '_tiene_cabecera')
+
+
+# Las búsquedas por tipo y los descuentos tratan a toda clase con el
+# comportamiento de cama como una Cama (ver models.mueble.jerarquia)
+CamaBase._CLASE_CONCRETA = Cama
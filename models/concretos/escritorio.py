@@ -1,9 +1,12 @@
 """
 Clase concreta Escritorio.
 """
+from operator import attrgetter
 from models.categorias.superficies import Superficie
+from models.mueble import precio_memorizado
 
 class Escritorio(Superficie):
+    __slots__ = ('_altura', '_tiene_iluminacion', '_tiene_cajones', '_cantidad_cajones')
     
     def __init__(self, nombre: str, material: str, color: str, precio_base: float,
                  forma: str = "rectangular", area_superficie: float = 1.5, altura: float = 75,
@@ -26,6 +29,7 @@ class Escritorio(Superficie):
         if value <= 0:
             raise ValueError("La altura debe ser mayor a 0")
         self._altura = value
+        self._precio_modificado()
     @property
     def tiene_iluminacion(self) -> bool:
         """Indica si el escritorio tiene iluminación incorporada."""
@@ -34,6 +38,7 @@ class Escritorio(Superficie):
     @tiene_iluminacion.setter
     def tiene_iluminacion(self, value: bool) -> None:
         self._tiene_iluminacion = bool(value)
+        self._precio_modificado()
 
     @property
     def tiene_cajones(self) -> bool:
@@ -45,6 +50,7 @@ class Escritorio(Superficie):
         self._tiene_cajones = bool(value)
         if not self._tiene_cajones:
             self._cantidad_cajones = 0
+        self._precio_modificado()
 
     @property
     def cantidad_cajones(self) -> int:
@@ -59,23 +65,36 @@ class Escritorio(Superficie):
             if value < 0:
                 raise ValueError("La cantidad de cajones no puede ser negativa")
             self._cantidad_cajones = value
+        self._precio_modificado()
 
-    def calcular_precio(self) -> float:
-        """
-        Calcula el precio del escritorio según sus características.
-        """
-        precio = self.precio_base
-        precio += self.area_superficie * 120  # escritorio suele ser más caro por m2
-        if self.forma.lower() == "esquinero":
+    # Campos que usa la fórmula de precio, en el orden de _precio. calcular_precio
+    # y el motor por lote (services.precios) los leen con este attrgetter.
+    _valores_precio = attrgetter('_precio_base', '_area_superficie', '_forma', '_tiene_cajones',
+                                 '_cantidad_cajones', '_tiene_iluminacion', '_altura')
+
+    @staticmethod
+    def _precio(precio_base, area_superficie, forma, tiene_cajones, cantidad_cajones,
+                tiene_iluminacion, altura) -> float:
+        """Fórmula de precio del escritorio a partir de sus campos."""
+        precio = precio_base
+        precio += area_superficie * 120  # escritorio suele ser más caro por m2
+        if forma.clave == "esquinero":
             precio += 200
-        if self.tiene_cajones:
-            precio += 80 * self.cantidad_cajones
-        if self.tiene_iluminacion:
+        if tiene_cajones:
+            precio += 80 * cantidad_cajones
+        if tiene_iluminacion:
             precio += 150
-        if self.altura > 80:
+        if altura > 80:
             precio += 40
         return round(precio, 2)
 
+    @precio_memorizado
+    def calcular_precio(self) -> float:
+        """
+        Calcula el precio del escritorio según sus características.
+        """
+        return Escritorio._precio(*Escritorio._valores_precio(self))
+
     def obtener_descripcion(self) -> str:
         """
         Devuelve la descripción completa del escritorio.
@@ -1,10 +1,14 @@
 """
 Clase concreta Mesa.
 """
+from operator import attrgetter
 from models.categorias.superficies import Superficie
+from models.mueble import precio_memorizado
 
 
 class Mesa(Superficie):
+    __slots__ = ('_capacidad_personas', '_extensible')
+
     def __init__(self, nombre: str, material: str, color: str, precio_base: float,
                  forma: str = "rectangular", capacidad_personas: int = 4, area_superficie: float = 1.5, extensible: bool = False):
         super().__init__(nombre, material, color, precio_base, forma, area_superficie)
@@ -20,6 +24,7 @@ class Mesa(Superficie):
         if value < 1:
             raise ValueError("La mesa debe tener capacidad para al menos 1 persona")
         self._capacidad_personas = value
+        self._precio_modificado()
 
     @property
     def extensible(self) -> bool:
@@ -29,22 +34,34 @@ class Mesa(Superficie):
     @extensible.setter
     def extensible(self, value: bool) -> None:
         self._extensible = bool(value)
+        self._precio_modificado()
 
-    def calcular_precio(self) -> float:
-        """
-        Calcula el precio de la mesa según sus características.
-        """
-        precio = self.precio_base
-        precio += self.area_superficie * 100  # precio por m2
-        if self.forma.lower() in ["circular", "redonda"]:
+    # Campos que usa la fórmula de precio, en el orden de _precio. calcular_precio
+    # y el motor por lote (services.precios) los leen con este attrgetter.
+    _valores_precio = attrgetter('_precio_base', '_area_superficie', '_forma', '_extensible',
+                                 '_capacidad_personas')
+
+    @staticmethod
+    def _precio(precio_base, area_superficie, forma, extensible, capacidad_personas) -> float:
+        """Fórmula de precio de la mesa a partir de sus campos."""
+        precio = precio_base
+        precio += area_superficie * 100  # precio por m2
+        if forma.clave in ("circular", "redonda"):
             precio += 150
-        if self.extensible:
+        if extensible:
             precio += 200
         # Capacidad: cada persona extra suma 50
-        if self.capacidad_personas > 4:
-            precio += 50 * (self.capacidad_personas - 4)
+        if capacidad_personas > 4:
+            precio += 50 * (capacidad_personas - 4)
         return round(precio, 2)
 
+    @precio_memorizado
+    def calcular_precio(self) -> float:
+        """
+        Calcula el precio de la mesa según sus características.
+        """
+        return Mesa._precio(*Mesa._valores_precio(self))
+
     def obtener_descripcion(self) -> str:
         """
         Devuelve la descripción completa de la mesa.
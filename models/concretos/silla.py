@@ -2,8 +2,10 @@
 Clase concreta Silla.
 Implementa un mueble de asiento específico para una persona.
 """
+from operator import attrgetter
 # Importar la clase padre Asiento
 from models.categorias.asientos import Asiento
+from models.mueble import precio_memorizado
 
 class Silla(Asiento):
     """
@@ -17,6 +19,9 @@ class Silla(Asiento):
     - Polimorfismo: Implementa métodos abstractos de manera específica
     - Encapsulación: Protege atributos específicos de la silla
     """
+
+    __slots__ = ('_altura_regulable', '_tiene_ruedas', '_altura_actual')
+    _CAMPOS_ESTADO = ('_altura_actual',)
     
     def __init__(self, nombre: str, material: str, color: str, precio_base: float,
                  tiene_respaldo: bool = True, material_tapizado: str = None,
@@ -46,6 +51,7 @@ class Silla(Asiento):
     def altura_regulable(self, value: bool) -> None:
         """Setter para altura regulable."""
         self._altura_regulable = bool(value)
+        self._precio_modificado()
 
     @property
     def tiene_ruedas(self) -> bool:
@@ -56,6 +62,7 @@ class Silla(Asiento):
     def tiene_ruedas(self, value: bool) -> None:
         """Setter para si tiene ruedas."""
         self._tiene_ruedas = bool(value)
+        self._precio_modificado()
 
     @property
     def altura_actual(self) -> int:
@@ -69,6 +76,28 @@ class Silla(Asiento):
             raise ValueError("La altura debe estar entre 35 y 60 cm")
         self._altura_actual = value
 
+    # Campos que usa la fórmula de precio, en el orden de _precio. calcular_precio
+    # y el motor por lote (services.precios) los leen con este attrgetter.
+    _valores_precio = attrgetter('_precio_base', '_tiene_respaldo', '_material_tapizado',
+                                 '_capacidad_personas', '_altura_regulable', '_tiene_ruedas')
+
+    @staticmethod
+    def _precio(precio_base, tiene_respaldo, material_tapizado, capacidad_personas,
+                altura_regulable, tiene_ruedas) -> float:
+        """Fórmula de precio de la silla a partir de sus campos."""
+        precio = precio_base
+        precio *= Asiento._factor_comodidad(tiene_respaldo, material_tapizado, capacidad_personas)
+        if material_tapizado and material_tapizado.clave == "cuero":
+            precio += 150
+        elif material_tapizado and material_tapizado.clave == "tela":
+            precio += 50
+        if altura_regulable:
+            precio += 80
+        if tiene_ruedas:
+            precio += 60
+        return round(precio, 2)
+
+    @precio_memorizado
     def calcular_precio(self) -> float:
         """
         Implementa el cálculo de precio específico para sillas.
@@ -76,17 +105,7 @@ class Silla(Asiento):
         Returns:
             float: Precio final de la silla
         """
-        precio = self.precio_base
-        precio *= self.calcular_factor_comodidad()
-        if self.material_tapizado and self.material_tapizado.lower() == "cuero":
-            precio += 150
-        elif self.material_tapizado and self.material_tapizado.lower() == "tela":
-            precio += 50
-        if self.altura_regulable:
-            precio += 80
-        if self.tiene_ruedas:
-            precio += 60
-        return round(precio, 2)
+        return Silla._precio(*Silla._valores_precio(self))
     
     def obtener_descripcion(self) -> str:
         """
@@ -2,14 +2,19 @@
 Clase concreta Sillón.
 Hereda de Asiento y representa un sillón individual.
 """
+from operator import attrgetter
 
 from models.categorias.asientos import Asiento
+from models.mueble import precio_memorizado
 
 
 class Sillon(Asiento):
     """
     Clase concreta para sillón individual.
     """
+
+    __slots__ = ('_es_reclinable', '_tiene_reposapies')
+
     def __init__(self, nombre: str, material: str, color: str, precio_base: float,
                  tiene_respaldo: bool = True, material_tapizado: str = "tela",
                  es_reclinable: bool = False, tiene_reposapies: bool = False):
@@ -24,6 +29,7 @@ class Sillon(Asiento):
     @es_reclinable.setter
     def es_reclinable(self, value: bool) -> None:
         self._es_reclinable = bool(value)
+        self._precio_modificado()
 
     @property
     def tiene_reposapies(self) -> bool:
@@ -32,25 +38,38 @@ class Sillon(Asiento):
     @tiene_reposapies.setter
     def tiene_reposapies(self, value: bool) -> None:
         self._tiene_reposapies = bool(value)
+        self._precio_modificado()
 
-    def calcular_precio(self) -> float:
-        """
-        Calcula el precio del sillón según sus características.
-        """
-        precio = self.precio_base
-        precio *= self.calcular_factor_comodidad()
-        if self.material_tapizado and self.material_tapizado.lower() == "cuero":
+    # Campos que usa la fórmula de precio, en el orden de _precio. calcular_precio
+    # y el motor por lote (services.precios) los leen con este attrgetter.
+    _valores_precio = attrgetter('_precio_base', '_tiene_respaldo', '_material_tapizado',
+                                 '_capacidad_personas', '_es_reclinable', '_tiene_reposapies')
+
+    @staticmethod
+    def _precio(precio_base, tiene_respaldo, material_tapizado, capacidad_personas, es_reclinable,
+                tiene_reposapies) -> float:
+        """Fórmula de precio del sillón a partir de sus campos."""
+        precio = precio_base
+        precio *= Asiento._factor_comodidad(tiene_respaldo, material_tapizado, capacidad_personas)
+        if material_tapizado and material_tapizado.clave == "cuero":
             precio += 300
-        elif self.material_tapizado and self.material_tapizado.lower() == "tela":
+        elif material_tapizado and material_tapizado.clave == "tela":
             precio += 100
-        if self.tiene_respaldo:
+        if tiene_respaldo:
             precio += 50
-        if self.es_reclinable:
+        if es_reclinable:
             precio += 200
-        if self.tiene_reposapies:
+        if tiene_reposapies:
             precio += 100
         return round(precio, 2)
 
+    @precio_memorizado
+    def calcular_precio(self) -> float:
+        """
+        Calcula el precio del sillón según sus características.
+        """
+        return Sillon._precio(*Sillon._valores_precio(self))
+
     def obtener_descripcion(self) -> str:
         """
         Devuelve la descripción completa del sillón.
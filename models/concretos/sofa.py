@@ -2,13 +2,18 @@
 Clase concreta Sofa.
 Hereda de Asiento y representa un sofá tradicional.
 """
+from operator import attrgetter
 from models.categorias.asientos import Asiento
+from models.mueble import precio_memorizado
 
 
 class Sofa(Asiento):
     """
     Clase concreta para sofá.
     """
+
+    __slots__ = ('_es_modular', '_incluye_cojines')
+
     def __init__(self, nombre: str, material: str, color: str, precio_base: float,
                  capacidad_personas: int = 3, tiene_respaldo: bool = True, material_tapizado: str = "tela",
                  es_modular: bool = False, incluye_cojines: bool = False):
@@ -23,6 +28,7 @@ class Sofa(Asiento):
     @es_modular.setter
     def es_modular(self, value: bool) -> None:
         self._es_modular = bool(value)
+        self._precio_modificado()
 
     @property
     def incluye_cojines(self) -> bool:
@@ -31,25 +37,38 @@ class Sofa(Asiento):
     @incluye_cojines.setter
     def incluye_cojines(self, value: bool) -> None:
         self._incluye_cojines = bool(value)
+        self._precio_modificado()
 
-    def calcular_precio(self) -> float:
-        """
-        Calcula el precio del sofá según sus características.
-        """
-        precio = self.precio_base
-        precio *= self.calcular_factor_comodidad()
-        if self.material_tapizado and self.material_tapizado.lower() == "cuero":
+    # Campos que usa la fórmula de precio, en el orden de _precio. calcular_precio
+    # y el motor por lote (services.precios) los leen con este attrgetter.
+    _valores_precio = attrgetter('_precio_base', '_tiene_respaldo', '_material_tapizado',
+                                 '_capacidad_personas', '_es_modular', '_incluye_cojines')
+
+    @staticmethod
+    def _precio(precio_base, tiene_respaldo, material_tapizado, capacidad_personas, es_modular,
+                incluye_cojines) -> float:
+        """Fórmula de precio del sofá a partir de sus campos."""
+        precio = precio_base
+        precio *= Asiento._factor_comodidad(tiene_respaldo, material_tapizado, capacidad_personas)
+        if material_tapizado and material_tapizado.clave == "cuero":
             precio += 500
-        elif self.material_tapizado and self.material_tapizado.lower() == "tela":
+        elif material_tapizado and material_tapizado.clave == "tela":
             precio += 200
-        if self.capacidad_personas > 3:
-            precio += 150 * (self.capacidad_personas - 3)
-        if self.es_modular:
+        if capacidad_personas > 3:
+            precio += 150 * (capacidad_personas - 3)
+        if es_modular:
             precio += 400
-        if self.incluye_cojines:
+        if incluye_cojines:
             precio += 100
         return round(precio, 2)
 
+    @precio_memorizado
+    def calcular_precio(self) -> float:
+        """
+        Calcula el precio del sofá según sus características.
+        """
+        return Sofa._precio(*Sofa._valores_precio(self))
+
     def obtener_descripcion(self) -> str:
         """
         Devuelve la descripción completa del sofá.
@@ -1,12 +1,22 @@
+from operator import attrgetter
 # TODO: Importar las clases padre
 from models.concretos.sofa import Sofa
-from models.concretos.cama import Cama
+from models.concretos.cama import Cama, CamaBase
+from models.categorico import categorico
+from models.categorias.asientos import Asiento
+from models.mueble import precio_memorizado
 
-class SofaCama(Sofa, Cama):
+class SofaCama(Sofa, CamaBase):
     """
     Clase que implementa herencia múltiple heredando de Sofa y Cama.
     """
 
+    # CamaBase no tiene slots (ver models/concretos/cama.py): los campos de la
+    # cama se repiten aquí junto con los propios del sofá cama.
+    __slots__ = ('_tamaño', '_incluye_colchon', '_tiene_cabecera',
+                 '_mecanismo_conversion', '_tamaño_cama', '_modo_actual')
+    _CAMPOS_ESTADO = ('_modo_actual',)
+
     def __init__(self, nombre: str, material: str, color: str, precio_base: float,
                  capacidad_personas: int = 3, material_tapizado: str = "tela",
                  tamaño_cama: str = "matrimonial", incluye_colchon: bool = True,
@@ -14,10 +24,10 @@ class SofaCama(Sofa, Cama):
         # Inicializa Sofa (que a su vez inicializa Mueble)
         super().__init__(nombre, material, color, precio_base, capacidad_personas, True, material_tapizado)
         # Inicializa atributos específicos de cama
-        self._tamaño_cama = tamaño_cama
+        self._tamaño_cama = categorico(tamaño_cama)
         self._incluye_colchon = incluye_colchon
         # Inicializa atributos únicos del sofá-cama
-        self._mecanismo_conversion = mecanismo_conversion
+        self._mecanismo_conversion = categorico(mecanismo_conversion)
         self._modo_actual = "sofa"  # Puede ser "sofa" o "cama"
 
     @property
@@ -29,7 +39,8 @@ class SofaCama(Sofa, Cama):
     def mecanismo_conversion(self, value: str) -> None:
         if not value or not value.strip():
             raise ValueError("El mecanismo de conversión no puede estar vacío")
-        self._mecanismo_conversion = value.strip()
+        self._mecanismo_conversion = categorico(value.strip())
+        self._precio_modificado()
 
     @property
     def modo_actual(self) -> str:
@@ -45,7 +56,8 @@ class SofaCama(Sofa, Cama):
     def tamaño_cama(self, value: str) -> None:
         if not value or not value.strip():
             raise ValueError("El tamaño de cama no puede estar vacío")
-        self._tamaño_cama = value.strip()
+        self._tamaño_cama = categorico(value.strip())
+        self._notificar("tamaño_cama")
 
     @property
     def incluye_colchon(self) -> bool:
@@ -55,6 +67,7 @@ class SofaCama(Sofa, Cama):
     @incluye_colchon.setter
     def incluye_colchon(self, value: bool) -> None:
         self._incluye_colchon = bool(value)
+        self._precio_modificado()
 
     def convertir_a_cama(self) -> str:
         """Convierte el sofá en cama."""
@@ -70,23 +83,35 @@ class SofaCama(Sofa, Cama):
         self._modo_actual = "sofa"
         return f"Cama convertida a sofá usando mecanismo {self.mecanismo_conversion}"
 
-    def calcular_precio(self) -> float:
-        """
-        Calcula el precio combinando las funcionalidades de sofá y cama.
-        """
-        precio = self.precio_base
-        precio *= self.calcular_factor_comodidad()
+    # Campos que usa la fórmula de precio, en el orden de _precio. calcular_precio
+    # y el motor por lote (services.precios) los leen con este attrgetter.
+    _valores_precio = attrgetter('_precio_base', '_tiene_respaldo', '_material_tapizado',
+                                 '_capacidad_personas', '_mecanismo_conversion', '_incluye_colchon')
+
+    @staticmethod
+    def _precio(precio_base, tiene_respaldo, material_tapizado, capacidad_personas,
+                mecanismo_conversion, incluye_colchon) -> float:
+        """Fórmula de precio del sofá cama a partir de sus campos."""
+        precio = precio_base
+        precio *= Asiento._factor_comodidad(tiene_respaldo, material_tapizado, capacidad_personas)
         precio *= 1.5  # 50% más caro por ser dual
-        if self.mecanismo_conversion.lower() == "electrico":
+        if mecanismo_conversion.clave == "electrico":
             precio += 200
-        elif self.mecanismo_conversion.lower() == "hidraulico":
+        elif mecanismo_conversion.clave == "hidraulico":
             precio += 150
         else:  # manual/plegable
             precio += 100
-        if self.incluye_colchon:
+        if incluye_colchon:
             precio += 300
         return round(precio, 2)
 
+    @precio_memorizado
+    def calcular_precio(self) -> float:
+        """
+        Calcula el precio combinando las funcionalidades de sofá y cama.
+        """
+        return SofaCama._precio(*SofaCama._valores_precio(self))
+
     def obtener_descripcion(self) -> str:
         """
         Descripción que combina características de sofá y cama.
@@ -122,4 +147,8 @@ class SofaCama(Sofa, Cama):
         """
         Representación en cadena del sofá-cama.
         """
-        return f"Sofá-cama {self.nombre} (modo: {self.modo_actual})"
\ No newline at end of file
+        return f"Sofá-cama {self.nombre} (modo: {self.modo_actual})"
+
+
+# SofaCama hereda el comportamiento de CamaBase y no la clase Cama, pero es una cama
+Cama.register(SofaCama)
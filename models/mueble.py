@@ -6,8 +6,58 @@ Este es el punto de partida de nuestra jerarquía de clases.
 # TODO: Importar ABC y abstractmethod del módulo abc
 # Estos son necesarios para crear clases y métodos abstractos
 from abc import ABC, abstractmethod
+from functools import wraps
+from models.observable import Observable
+from models.categorico import categorico
 
-class Mueble(ABC):
+# Campos que definen la configuración de cada clase (se calculan una vez por clase)
+_CAMPOS_CONFIGURACION = {}
+# Slots que se serializan de cada clase: todos menos los observadores
+_CAMPOS_SERIALIZABLES = {}
+
+
+def precio_memorizado(calcular_precio):
+    """
+    Decorador que guarda en la instancia el resultado de calcular_precio().
+
+    Mientras no cambie ningún atributo que afecte el precio, leer el precio
+    es solo leer un campo. Los setters invalidan el valor guardado llamando
+    a _precio_modificado().
+    """
+    @wraps(calcular_precio)
+    def envoltura(self) -> float:
+        precio = self._precio_cache
+        if precio is None:
+            precio = calcular_precio(self)
+            self._precio_cache = precio
+        return precio
+    return envoltura
+
+
+def jerarquia(clase: type) -> tuple:
+    """
+    Clases de las que `clase` es un caso, de la más específica a la más general.
+
+    Es el MRO de la clase, salvo que un mixin de comportamiento que declara
+    _CLASE_CONCRETA va seguido de esa clase: SofaCama hereda de CamaBase y
+    no de Cama, pero para las búsquedas por tipo y los descuentos es una cama.
+
+    Args:
+        clase: Clase de un mueble
+
+    Returns:
+        tuple: Clases en orden de especificidad
+    """
+    clases = []
+    for base in clase.__mro__:
+        clases.append(base)
+        concreta = base.__dict__.get('_CLASE_CONCRETA')
+        if concreta is not None and concreta not in clase.__mro__:
+            clases.append(concreta)
+    return tuple(clases)
+
+
+class Mueble(Observable, ABC):
     """
     Clase abstracta base para todos los muebles.
     
@@ -17,7 +67,14 @@ class Mueble(ABC):
     Conceptos OOP aplicados:
     - Abstracción: Define una interfaz común sin implementación específica
     - Encapsulación: Usa atributos privados con getters/setters
+    - Observador: Notifica los cambios a quien mantenga índices sobre el mueble
     """
+
+    # Atributos en slots: sin __dict__ por instancia. _precio_cache guarda el
+    # precio calculado más reciente (None si debe recalcularse).
+    __slots__ = ('_nombre', '_material', '_color', '_precio_base', '_observadores', '_precio_cache')
+    # Campos de estado que no forman parte de la configuración del mueble
+    _CAMPOS_ESTADO = ('_observadores', '_precio_cache')
     
     def __init__(self, nombre: str, material: str, color: str, precio_base: float):
         """
@@ -33,9 +90,12 @@ class Mueble(ABC):
         # Ejemplo: self._nombre = nombre
         # Esto implementa encapsulación, ocultando los datos internos
         self._nombre = nombre
-        self._material = material
-        self._color = color
+        self._material = categorico(material)
+        self._color = categorico(color)
         self._precio_base = precio_base
+        # Los slots no tienen valor por defecto: se inicializan siempre aquí
+        self._observadores = ()
+        self._precio_cache = None
     
     # TODO: Implementar las propiedades (getters) para cada atributo
     # Usa el decorador @property para crear getters
@@ -86,6 +146,7 @@ class Mueble(ABC):
         if not value or not value.strip():
             raise ValueError("El nombre no puede estar vacío")
         self._nombre = value.strip()
+        self._notificar("nombre")
 
     @material.setter
     def material(self) -> str:
@@ -96,7 +157,8 @@ class Mueble(ABC):
         """Setter para el material con validación."""
         if not value or not value.strip():
             raise ValueError("El material no puede estar vacío")
-        self._material = value.strip()
+        self._material = categorico(value.strip())
+        self._notificar("material")
 
     @color.setter
     def color(self) -> str:
@@ -107,7 +169,8 @@ class Mueble(ABC):
         """Setter para el color con validación."""
         if not value or not value.strip():
             raise ValueError("El color no puede estar vacío")
-        self._color = value.strip()
+        self._color = categorico(value.strip())
+        self._notificar("color")
 
     @precio_base.setter
     def precio_base(self) -> float:
@@ -119,6 +182,79 @@ class Mueble(ABC):
         if value < 0:
             raise ValueError("El precio base no puede ser negativo")
         self._precio_base = value
+        self._precio_modificado()
+
+    def _precio_modificado(self) -> None:
+        """
+        Avisa que cambió un atributo que interviene en calcular_precio().
+        Todos los setters que afectan el precio deben llamarlo: invalida el
+        precio memorizado y notifica a los observadores.
+        """
+        self._precio_cache = None
+        self._notificar("precio")
+
+    def clave_configuracion(self) -> tuple:
+        """
+        Obtiene una clave que identifica la configuración del mueble.
+
+        Dos muebles de la misma clase con los mismos atributos (sin contar
+        estado como la altura actual o los observadores) tienen la misma
+        clave y representan la misma referencia de catálogo (SKU).
+
+        Returns:
+            tuple: Clase seguida de los valores de sus atributos
+        """
+        clase = type(self)
+        campos = _CAMPOS_CONFIGURACION.get(clase)
+        if campos is None:
+            estado = set()
+            nombres = []
+            for base in reversed(clase.__mro__):
+                estado.update(base.__dict__.get('_CAMPOS_ESTADO', ()))
+                nombres.extend(base.__dict__.get('__slots__', ()))
+            campos = _CAMPOS_CONFIGURACION[clase] = tuple(n for n in nombres if n not in estado)
+        clave = (clase,) + tuple(getattr(self, campo) for campo in campos)
+        atributos = getattr(self, '__dict__', None)  # subclases sin __slots__
+        if atributos:
+            clave += tuple(sorted(atributos.items()))
+        return clave
+
+    def __getstate__(self) -> tuple:
+        """
+        Estado para pickle y copy.
+
+        Omite los observadores: suelen ser métodos de la tienda (con índices
+        que no se pueden serializar) y una copia no debe notificar a quien
+        observa al original. El precio memorizado sí viaja, porque la
+        configuración viaja con él.
+
+        Returns:
+            tuple: (__dict__ o None, diccionario de slots)
+        """
+        clase = type(self)
+        campos = _CAMPOS_SERIALIZABLES.get(clase)
+        if campos is None:
+            campos = _CAMPOS_SERIALIZABLES[clase] = tuple(
+                nombre for base in reversed(clase.__mro__)
+                for nombre in base.__dict__.get('__slots__', ()) if nombre != '_observadores')
+        slots = {}
+        for campo in campos:
+            try:
+                slots[campo] = getattr(self, campo)
+            except AttributeError:
+                pass  # slot sin asignar
+        return (getattr(self, '__dict__', None) or None, slots)
+
+    def __setstate__(self, estado: tuple) -> None:
+        """Restaura el estado serializado; la copia empieza sin observadores."""
+        atributos, slots = estado
+        # Con setattr, un atributo que antes vivía en el __dict__ (como los de
+        # Cama en copias anteriores a sus slots) se restaura en su slot
+        for campo, valor in (atributos or {}).items():
+            setattr(self, campo, valor)
+        for campo, valor in slots.items():
+            setattr(self, campo, valor)
+        self._observadores = ()
     
     # TODO: Implementar método abstracto calcular_precio()
     # Este método debe ser implementado por todas las clases hijas
@@ -0,0 +1,88 @@
+"""
+Mixin Observable.
+Permite que otros objetos (por ejemplo la tienda) se enteren de los cambios
+de un mueble sin que el mueble conozca a quién le interesa.
+"""
+
+import weakref
+from types import MethodType
+
+
+class MetodoDebil:
+    """
+    Observador que es un método ligado, guardado sin mantener vivo a su dueño.
+
+    Un objeto observado no debe impedir que se libere quien lo observa (un
+    comedor descartado, un catálogo que ya no se usa): cuando el dueño del
+    método desaparece, llamar al observador no hace nada y la referencia se
+    descarta en la próxima suscripción.
+    Un mismo MetodoDebil puede compartirse entre muchos objetos observados.
+    """
+
+    __slots__ = ('_dueño', '_funcion')
+
+    def __init__(self, metodo: MethodType):
+        self._dueño = weakref.ref(metodo.__self__)
+        self._funcion = metodo.__func__
+
+    @property
+    def vivo(self) -> bool:
+        """Indica si el dueño del método sigue existiendo."""
+        return self._dueño() is not None
+
+    def __call__(self, objeto, atributo: str) -> None:
+        dueño = self._dueño()
+        if dueño is not None:
+            self._funcion(dueño, objeto, atributo)
+
+    def __eq__(self, otro) -> bool:
+        if isinstance(otro, MetodoDebil):
+            return self._funcion is otro._funcion and self._dueño() is otro._dueño()
+        if isinstance(otro, MethodType):
+            return self._funcion is otro.__func__ and self._dueño() is otro.__self__
+        return NotImplemented
+
+    __hash__ = None
+
+
+class Observable:
+    """
+    Mixin que implementa un patrón observador mínimo.
+
+    Los observadores son funciones que reciben (objeto, atributo) y se llaman
+    cada vez que un setter modifica un atributo relevante. Los métodos
+    ligados se guardan como MetodoDebil: observar un objeto no mantiene
+    vivo al observador.
+
+    Conceptos OOP aplicados:
+    - Encapsulación: La lista de observadores es privada
+    - Bajo acoplamiento: El objeto observado no conoce a sus observadores
+    """
+
+    __slots__ = ()
+
+    # Tupla vacía compartida: los objetos sin observadores no reservan memoria extra.
+    # Las clases con __slots__ deben declarar su propio slot _observadores.
+    _observadores = ()
+
+    def _suscribir(self, observador) -> None:
+        """Registra un observador que será notificado en cada cambio."""
+        if isinstance(observador, MethodType):
+            observador = MetodoDebil(observador)
+        # Se aprovecha para descartar los observadores cuyo dueño ya no existe
+        vigentes = tuple(o for o in self._observadores if not isinstance(o, MetodoDebil) or o.vivo)
+        self._observadores = vigentes + (observador,)
+
+    def _desuscribir(self, observador) -> None:
+        """Elimina un observador previamente registrado."""
+        self._observadores = tuple(o for o in self._observadores if o != observador)
+
+    def _notificar(self, atributo: str) -> None:
+        """
+        Avisa a todos los observadores que cambió un atributo.
+
+        Args:
+            atributo: Nombre del atributo modificado
+        """
+        for observador in self._observadores:
+            observador(self, atributo)
@@ -0,0 +1,415 @@
+"""
+Capa de almacenamiento de las búsquedas del inventario.
+La tienda delega en un almacén los índices de nombre, material, color,
+tipo y precio. Hay dos implementaciones con los mismos resultados:
+- AlmacenMemoria: los índices de services.indices (por defecto).
+- AlmacenSQLite: una tabla de sqlite3 con índices sobre tipo, material,
+  color y precio, a la que se le delegan las consultas como SQL.
+"""
+
+import sqlite3
+from abc import ABC, abstractmethod
+from itertools import islice
+from typing import Dict, Iterable, List, Optional
+
+from models.mueble import Mueble, jerarquia
+from services.indices import IndiceHash, IndiceNgramas, IndiceOrdenado, IndiceTipos, normalizar
+
+
+class Almacen(ABC):
+    """
+    Interfaz de un almacén de búsquedas del inventario.
+
+    Los resultados conservan el orden de los índices en memoria: por
+    precio (y, a igual precio, por el momento en que se registró el
+    precio), por clase concreta según el orden en que apareció cada clase,
+    y para nombre, material y color según el orden de alta de los muebles,
+    aunque después se editen.
+    """
+
+    @abstractmethod
+    def agregar(self, mueble: Mueble) -> None:
+        """Registra un mueble en el almacén."""
+        pass
+
+    @abstractmethod
+    def agregar_lote(self, muebles: List[Mueble]) -> None:
+        """Registra muchos muebles en una sola operación."""
+        pass
+
+    @abstractmethod
+    def quitar(self, mueble: Mueble) -> None:
+        """Quita un mueble del almacén si está presente."""
+        pass
+
+    @abstractmethod
+    def actualizar(self, mueble: Mueble, atributo: str) -> None:
+        """
+        Refleja el cambio de un atributo de un mueble registrado.
+
+        Args:
+            mueble: Mueble modificado
+            atributo: "nombre", "material", "color" o "precio" (los demás se ignoran)
+        """
+        pass
+
+    @abstractmethod
+    def buscar_por_nombre(self, consulta: str) -> List[Mueble]:
+        """Muebles cuyo nombre contiene la consulta (case-insensitive)."""
+        pass
+
+    @abstractmethod
+    def buscar_por_material(self, material: str) -> List[Mueble]:
+        """Muebles del material dado (normalizado)."""
+        pass
+
+    @abstractmethod
+    def buscar_por_color(self, color: str) -> List[Mueble]:
+        """Muebles del color dado (normalizado)."""
+        pass
+
+    @abstractmethod
+    def buscar_por_tipo(self, clase: type) -> List[Mueble]:
+        """Muebles que son instancia de la clase dada, agrupados por clase concreta."""
+        pass
+
+    @abstractmethod
+    def contar_por_tipo(self, clase: type) -> int:
+        """Cantidad de muebles que son instancia de la clase dada."""
+        pass
+
+    @abstractmethod
+    def rango_precio(self, minimo: float, maximo: float) -> List[Mueble]:
+        """Muebles con precio en [minimo, maximo], en orden de alta."""
+        pass
+
+    @abstractmethod
+    def mas_baratos(self, cantidad: int) -> List[Mueble]:
+        """Los `cantidad` muebles de menor precio, de menor a mayor."""
+        pass
+
+    @abstractmethod
+    def mas_caros(self, cantidad: int) -> List[Mueble]:
+        """Los `cantidad` muebles de mayor precio, de mayor a menor."""
+        pass
+
+    def diferir(self, muebles: List[Mueble]) -> None:
+        """
+        Registra muebles restaurados de una instantánea. Una implementación
+        puede postergar el trabajo hasta la primera consulta.
+        """
+        self.agregar_lote(muebles)
+
+    def cerrar(self) -> None:
+        """Libera los recursos del almacén."""
+        pass
+
+
+class AlmacenMemoria(Almacen):
+    """
+    Almacén con los índices en memoria de services.indices.
+
+    Con diferir() cada índice se construye recién la primera vez que se
+    consulta o se modifica. El de nombres, el más caro de construir, se
+    arma de a trozos: cada búsqueda indexa TROZO_NOMBRES muebles más y
+    recorre el resto, hasta que el índice queda completo.
+
+    Mientras tanto la búsqueda por nombre es O(n): compara la consulta con
+    el nombre de cada mueble todavía sin indexar. Con n muebles restaurados
+    eso dura unas n / TROZO_NOMBRES búsquedas; a partir de ahí se responde
+    con el índice de n-gramas.
+    """
+
+    # Índices del almacén; los que quedan pendientes tras diferir() se construyen en __getattr__
+    _INDICES = ("_indice_material", "_indice_color", "_indice_tipos", "_indice_precios", "_indice_nombres")
+    # Muebles restaurados que indexa cada búsqueda por nombre mientras el índice está incompleto
+    TROZO_NOMBRES = 50_000
+
+    def __init__(self):
+        """Constructor del almacén."""
+        # Índices hash normalizados para filtrar sin recorrer todo el inventario
+        self._indice_material = IndiceHash(lambda mueble: mueble.material)
+        self._indice_color = IndiceHash(lambda mueble: mueble.color)
+        self._indice_tipos = IndiceTipos()
+        # Índice ordenado por precio para consultas por rango con bisect
+        self._indice_precios = IndiceOrdenado(lambda mueble: mueble.calcular_precio())
+        # Índice de n-gramas para la búsqueda parcial por nombre
+        self._indice_nombres = IndiceNgramas(lambda mueble: mueble.nombre)
+
+    def __getattr__(self, nombre: str):
+        """Construye un índice diferido con los muebles restaurados la primera vez que se lo usa."""
+        pendientes = self.__dict__.get("_pendientes")
+        if not pendientes or nombre not in pendientes:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{nombre}'")
+        indice = pendientes.pop(nombre)
+        # El índice de nombres puede estar construido en parte (ver _buscar_mientras_se_indexa)
+        indexados = len(indice) if nombre == "_indice_nombres" else 0
+        indice.agregar_lote(islice(self._restaurados, indexados, None))
+        setattr(self, nombre, indice)
+        if not pendientes:
+            del self._restaurados
+        return indice
+
+    def diferir(self, muebles: List[Mueble]) -> None:
+        """
+        Posterga la construcción de cada índice hasta su primer uso.
+        Toda alta, baja o modificación pasa primero por el índice (lo que
+        dispara su construcción) y después lo actualiza, así que partir de
+        los muebles restaurados deja el índice al día.
+        """
+        self._pendientes = {nombre: self.__dict__.pop(nombre) for nombre in self._INDICES}
+        self._restaurados = muebles
+
+    def agregar(self, mueble: Mueble) -> None:
+        self._indice_material.agregar(mueble)
+        self._indice_color.agregar(mueble)
+        self._indice_tipos.agregar(mueble)
+        self._indice_precios.agregar(mueble)
+        self._indice_nombres.agregar(mueble)
+
+    def agregar_lote(self, muebles: List[Mueble]) -> None:
+        # Cada índice se actualiza con una sola pasada sobre el lote
+        self._indice_material.agregar_lote(muebles)
+        self._indice_color.agregar_lote(muebles)
+        self._indice_tipos.agregar_lote(muebles)
+        self._indice_precios.agregar_lote(muebles)
+        self._indice_nombres.agregar_lote(muebles)
+
+    def quitar(self, mueble: Mueble) -> None:
+        self._indice_material.quitar(mueble)
+        self._indice_color.quitar(mueble)
+        self._indice_tipos.quitar(mueble)
+        self._indice_precios.quitar(mueble)
+        self._indice_nombres.quitar(mueble)
+
+    def actualizar(self, mueble: Mueble, atributo: str) -> None:
+        if atributo == "nombre":
+            self._indice_nombres.actualizar(mueble)
+        elif atributo == "material":
+            self._indice_material.actualizar(mueble)
+        elif atributo == "color":
+            self._indice_color.actualizar(mueble)
+        elif atributo == "precio":
+            self._indice_precios.actualizar(mueble)
+
+    def buscar_por_nombre(self, consulta: str) -> List[Mueble]:
+        pendientes = self.__dict__.get("_pendientes")
+        if pendientes and "_indice_nombres" in pendientes:
+            return self._buscar_mientras_se_indexa(consulta)
+        return self._indice_nombres.buscar(consulta)
+
+    def _buscar_mientras_se_indexa(self, consulta: str) -> List[Mueble]:
+        """
+        Busca por nombre con el índice construido en parte.
+
+        Indexa el siguiente trozo de muebles restaurados; los ya indexados
+        (un prefijo del inventario) se buscan en el índice y el resto se
+        recorre comparando nombres, así el resultado sale en el mismo
+        orden que con el índice completo. Mientras tanto el índice no
+        recibe otros cambios: cualquier alta, baja o edición lo completa
+        antes (ver __getattr__).
+        """
+        indice = self._pendientes["_indice_nombres"]
+        restaurados = self._restaurados
+        indexados = len(indice) + self.TROZO_NOMBRES
+        if indexados >= len(restaurados):
+            return self._indice_nombres.buscar(consulta)  # completa el índice
+        indice.agregar_lote(islice(restaurados, len(indice), indexados))
+        resultados = indice.buscar(consulta)
+        consulta = consulta.lower().strip()
+        if consulta:
+            resultados.extend(mueble for mueble in islice(restaurados, indexados, None)
+                              if consulta in mueble.nombre.lower())
+        return resultados
+
+    def buscar_por_material(self, material: str) -> List[Mueble]:
+        return self._indice_material.buscar(material)
+
+    def buscar_por_color(self, color: str) -> List[Mueble]:
+        return self._indice_color.buscar(color)
+
+    def buscar_por_tipo(self, clase: type) -> List[Mueble]:
+        return self._indice_tipos.buscar(clase)
+
+    def contar_por_tipo(self, clase: type) -> int:
+        return self._indice_tipos.contar(clase)
+
+    def rango_precio(self, minimo: float, maximo: float) -> List[Mueble]:
+        return self._indice_precios.rango_en_orden(minimo, maximo)
+
+    def mas_baratos(self, cantidad: int) -> List[Mueble]:
+        return self._indice_precios.primeros(cantidad)
+
+    def mas_caros(self, cantidad: int) -> List[Mueble]:
+        return self._indice_precios.ultimos(cantidad)
+
+
+class AlmacenSQLite(Almacen):
+    """
+    Almacén respaldado por una base sqlite3.
+
+    Cada mueble es una fila con su clase, nombre, material y color
+    normalizados y su precio, y las búsquedas se resuelven con consultas
+    SQL sobre los índices de la tabla. Los objetos siguen en memoria (la
+    tienda los observa y los devuelve); la base guarda la clave de cada uno.
+    La columna alta guarda el orden de registro y orden_precio cuándo se
+    registró el precio por última vez, para devolver los resultados en el
+    mismo orden que AlmacenMemoria.
+    """
+
+    _ESQUEMA = """
+        CREATE TABLE IF NOT EXISTS muebles (
+            clave INTEGER PRIMARY KEY,
+            clase INTEGER NOT NULL,
+            alta INTEGER NOT NULL,
+            nombre TEXT NOT NULL,
+            material TEXT NOT NULL,
+            color TEXT NOT NULL,
+            precio REAL,
+            orden_precio INTEGER
+        );
+        CREATE INDEX IF NOT EXISTS muebles_por_clase ON muebles (clase, alta);
+        CREATE INDEX IF NOT EXISTS muebles_por_material ON muebles (material, alta);
+        CREATE INDEX IF NOT EXISTS muebles_por_color ON muebles (color, alta);
+        CREATE INDEX IF NOT EXISTS muebles_por_precio ON muebles (precio, orden_precio);
+    """
+
+    def __init__(self, ruta: str = ":memory:"):
+        """
+        Abre (o crea) la base del almacén.
+
+        Args:
+            ruta: Archivo de la base, o ":memory:" para una base en memoria.
+                Las filas de una sesión anterior se descartan: los objetos
+                que representan solo existen en esta sesión.
+        """
+        self._conexion = sqlite3.connect(ruta)
+        with self._conexion:
+            self._conexion.executescript(self._ESQUEMA)
+            self._conexion.execute("DELETE FROM muebles")
+        self._muebles: Dict[int, Mueble] = {}  # clave -> mueble
+        self._orden = 0
+        # Código de cada clase concreta (en orden de aparición) y clausura de subclases por MRO
+        self._codigos: Dict[type, int] = {}
+        self._clausura: Dict[type, List[int]] = {}
+
+    def _siguiente(self) -> int:
+        """Siguiente número de orden."""
+        self._orden += 1
+        return self._orden
+
+    def _codigo(self, clase: type) -> int:
+        """Código de una clase concreta; la primera vez la registra en sus ancestros."""
+        codigo = self._codigos.get(clase)
+        if codigo is None:
+            codigo = self._codigos[clase] = len(self._codigos)
+            for ancestro in jerarquia(clase):
+                self._clausura.setdefault(ancestro, []).append(codigo)
+        return codigo
+
+    @staticmethod
+    def _precio(mueble: Mueble) -> Optional[float]:
+        """Precio del mueble, o None si no se puede calcular (queda fuera de los rangos)."""
+        try:
+            return mueble.calcular_precio()
+        except Exception:
+            return None
+
+    def _fila(self, mueble: Mueble) -> tuple:
+        """Fila de la tabla para un mueble nuevo."""
+        orden = self._siguiente()
+        precio = self._precio(mueble)
+        return (id(mueble), self._codigo(type(mueble)), orden,
+                mueble.nombre.lower(), normalizar(mueble.material),
+                normalizar(mueble.color), precio, orden if precio is not None else None)
+
+    def agregar(self, mueble: Mueble) -> None:
+        self.agregar_lote((mueble,))
+
+    def agregar_lote(self, muebles: Iterable[Mueble]) -> None:
+        filas = []
+        for mueble in muebles:
+            filas.append(self._fila(mueble))
+            self._muebles[id(mueble)] = mueble
+        with self._conexion:
+            self._conexion.executemany(
+                "INSERT INTO muebles VALUES (?, ?, ?, ?, ?, ?, ?, ?)", filas)
+
+    def quitar(self, mueble: Mueble) -> None:
+        if self._muebles.pop(id(mueble), None) is None:
+            return
+        with self._conexion:
+            self._conexion.execute("DELETE FROM muebles WHERE clave = ?", (id(mueble),))
+
+    def actualizar(self, mueble: Mueble, atributo: str) -> None:
+        if id(mueble) not in self._muebles:
+            return
+        if atributo == "nombre":
+            cambios = "nombre = ?", (mueble.nombre.lower(),)
+        elif atributo == "material":
+            cambios = "material = ?", (normalizar(mueble.material),)
+        elif atributo == "color":
+            cambios = "color = ?", (normalizar(mueble.color),)
+        elif atributo == "precio":
+            precio = self._precio(mueble)
+            cambios = "precio = ?, orden_precio = ?", (precio, self._siguiente() if precio is not None else None)
+        else:
+            return
+        columnas, valores = cambios
+        with self._conexion:
+            self._conexion.execute(f"UPDATE muebles SET {columnas} WHERE clave = ?", valores + (id(mueble),))
+
+    def _muebles_de(self, consulta: str, parametros: tuple = ()) -> List[Mueble]:
+        """Ejecuta una consulta que devuelve claves y las traduce a muebles."""
+        muebles = self._muebles
+        return [muebles[clave] for (clave,) in self._conexion.execute(consulta, parametros)]
+
+    def buscar_por_nombre(self, consulta: str) -> List[Mueble]:
+        consulta = consulta.lower().strip()
+        if not consulta:
+            return []
+        return self._muebles_de(
+            "SELECT clave FROM muebles WHERE instr(nombre, ?) > 0 ORDER BY alta", (consulta,))
+
+    def buscar_por_material(self, material: str) -> List[Mueble]:
+        return self._muebles_de(
+            "SELECT clave FROM muebles WHERE material = ? ORDER BY alta", (normalizar(material),))
+
+    def buscar_por_color(self, color: str) -> List[Mueble]:
+        return self._muebles_de(
+            "SELECT clave FROM muebles WHERE color = ? ORDER BY alta", (normalizar(color),))
+
+    def buscar_por_tipo(self, clase: type) -> List[Mueble]:
+        codigos = self._clausura.get(clase)
+        if not codigos:
+            return []
+        marcas = ", ".join("?" * len(codigos))
+        return self._muebles_de(
+            f"SELECT clave FROM muebles WHERE clase IN ({marcas}) ORDER BY clase, alta", tuple(codigos))
+
+    def contar_por_tipo(self, clase: type) -> int:
+        codigos = self._clausura.get(clase)
+        if not codigos:
+            return 0
+        marcas = ", ".join("?" * len(codigos))
+        return self._conexion.execute(
+            f"SELECT COUNT(*) FROM muebles WHERE clase IN ({marcas})", tuple(codigos)).fetchone()[0]
+
+    def rango_precio(self, minimo: float, maximo: float) -> List[Mueble]:
+        return self._muebles_de(
+            "SELECT clave FROM muebles WHERE precio BETWEEN ? AND ? ORDER BY alta",
+            (minimo, maximo))
+
+    def mas_baratos(self, cantidad: int) -> List[Mueble]:
+        return self._muebles_de(
+            "SELECT clave FROM muebles WHERE precio IS NOT NULL ORDER BY precio, orden_precio LIMIT ?",
+            (max(cantidad, 0),))
+
+    def mas_caros(self, cantidad: int) -> List[Mueble]:
+        return self._muebles_de(
+            "SELECT clave FROM muebles WHERE precio IS NOT NULL ORDER BY precio DESC, orden_precio DESC LIMIT ?",
+            (max(cantidad, 0),))
+
+    def cerrar(self) -> None:
+        """Cierra la conexión con la base."""
+        self._conexion.close()
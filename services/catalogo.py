@@ -5,6 +5,8 @@ Permite listar, buscar y filtrar muebles disponibles en la tienda.
 
 from typing import List, Optional
 from models.mueble import Mueble
+from models.observable import MetodoDebil
+from services.indices import IndiceHash, IndiceNgramas, IndiceOrdenado
 
 class Catalogo:
 	"""
@@ -12,11 +14,33 @@ class Catalogo:
 	"""
 	def __init__(self, muebles: Optional[List[Mueble]] = None):
 		self._muebles = muebles if muebles is not None else []
+		self._indice_material = IndiceHash(lambda m: m.material)
+		self._indice_precios = IndiceOrdenado(lambda m: m.calcular_precio())
+		self._indice_nombres = IndiceNgramas(lambda m: m.nombre)
+		# Un solo observador para todos los muebles, que no mantiene vivo al catálogo
+		self._observador = MetodoDebil(self._al_modificar_mueble)
+		for m in self._muebles:
+			self._indexar(m)
+
+	def _indexar(self, mueble: Mueble) -> None:
+		self._indice_material.agregar(mueble)
+		self._indice_precios.agregar(mueble)
+		self._indice_nombres.agregar(mueble)
+		mueble._suscribir(self._observador)
+
+	def _al_modificar_mueble(self, mueble: Mueble, atributo: str) -> None:
+		if atributo == "nombre":
+			self._indice_nombres.actualizar(mueble)
+		elif atributo == "material":
+			self._indice_material.actualizar(mueble)
+		elif atributo == "precio":
+			self._indice_precios.actualizar(mueble)
 
 	def agregar_mueble(self, mueble: Mueble) -> str:
 		if not isinstance(mueble, Mueble):
 			return "Solo se pueden agregar objetos de tipo Mueble."
 		self._muebles.append(mueble)
+		self._indexar(mueble)
 		return f"Mueble '{mueble.nombre}' agregado al catálogo."
 
 	def listar_muebles(self) -> List[Mueble]:
@@ -25,25 +49,21 @@ class Catalogo:
 	def buscar_por_nombre(self, nombre: str) -> List[Mueble]:
 		if not nombre or not nombre.strip():
 			return []
-		nombre_lower = nombre.lower().strip()
-		return [m for m in self._muebles if nombre_lower in m.nombre.lower()]
+		return self._indice_nombres.buscar(nombre)
 
 	def filtrar_por_material(self, material: str) -> List[Mueble]:
 		if not material or not material.strip():
 			return []
-		material_lower = material.lower().strip()
-		return [m for m in self._muebles if m.material.lower() == material_lower]
+		return self._indice_material.buscar(material)
 
 	def filtrar_por_precio(self, precio_min: float = 0, precio_max: float = float('inf')) -> List[Mueble]:
-		resultados = []
-		for m in self._muebles:
-			try:
-				precio = m.calcular_precio()
-				if precio_min <= precio <= precio_max:
-					resultados.append(m)
-			except Exception:
-				continue
-		return resultados
+		return self._indice_precios.rango_en_orden(precio_min, precio_max)
+
+	def obtener_mas_baratos(self, cantidad: int) -> List[Mueble]:
+		return self._indice_precios.primeros(cantidad)
+
+	def obtener_mas_caros(self, cantidad: int) -> List[Mueble]:
+		return self._indice_precios.ultimos(cantidad)
 
 	def obtener_descripciones(self) -> List[str]:
 		return [m.obtener_descripcion() for m in self._muebles]
\ No newline at end of file
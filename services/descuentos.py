@@ -0,0 +1,246 @@
+"""
+Motor de descuentos por jerarquía de clases.
+Resuelve las reglas de descuento por categoría a lo largo del MRO de cada
+clase de mueble y guarda la tasa efectiva de cada clase ya resuelta.
+Las reglas pueden ser permanentes o tener una ventana de vigencia.
+"""
+
+import datetime
+from bisect import bisect_right, insort
+from operator import methodcaller, mul
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from models.mueble import jerarquia
+
+
+class LineaTiempo:
+    """
+    Valor escalonado en el tiempo.
+
+    `cortes` es una lista ordenada de instantes; el valor i rige desde
+    cortes[i-1] (inclusive) hasta cortes[i] (exclusive). valores[0] rige antes
+    del primer corte y el último valor después del último corte, por lo que
+    hay un valor más que cortes. Consultar el valor en un instante es una
+    búsqueda binaria.
+    """
+
+    __slots__ = ('cortes', 'valores')
+
+    def __init__(self, cortes: List[datetime.datetime], valores: List[Optional[float]]):
+        self.cortes = cortes
+        self.valores = valores
+
+    def valor_en(self, momento: datetime.datetime) -> Optional[float]:
+        """Obtiene el valor vigente en un instante (O(log n))."""
+        return self.valores[bisect_right(self.cortes, momento)]
+
+
+class MotorDescuentos:
+    """
+    Reglas de descuento por categoría con una tabla de tasas efectivas.
+
+    Una categoría es el nombre de cualquier clase de la jerarquía en
+    minúsculas ("silla", "asiento", "cama", "mueble", ...). Para una clase
+    concreta se recorre su MRO y gana la regla de la clase más específica:
+    un SofaCama toma la regla de "sofacama" si existe, si no la de "sofa",
+    luego "asiento", "cama" y por último "mueble".
+
+    Cada categoría puede tener una regla permanente y cualquier cantidad de
+    reglas programadas con ventana [inicio, fin). Si varias reglas de la
+    misma categoría se superponen, rige la tasa mayor.
+
+    Cada vez que cambian las reglas se precalcula, para cada clase conocida,
+    una línea de tiempo con su tasa efectiva. Consultar la tasa de una clase
+    en un instante es una búsqueda binaria sobre los cortes de esa línea (y
+    un acceso a diccionario si no hay reglas programadas).
+    """
+
+    def __init__(self):
+        """Constructor del motor sin reglas."""
+        self._reglas: Dict[str, float] = {}  # categoría -> tasa permanente
+        self._programadas: Dict[str, List[Tuple[datetime.datetime, datetime.datetime, float]]] = {}
+        self._lineas_categoria: Dict[str, LineaTiempo] = {}
+        self._lineas: Dict[type, LineaTiempo] = {}  # clase concreta -> tasa efectiva en el tiempo
+
+    def aplicar(self, categoria: str, tasa: float) -> None:
+        """
+        Registra (o reemplaza) la regla permanente de una categoría y recalcula la tabla.
+
+        Args:
+            categoria: Nombre de la clase a la que aplica la regla
+            tasa: Tasa de descuento entre 0 y 1
+        """
+        categoria = categoria.lower().strip()
+        self._reglas[categoria] = tasa
+        self._recalcular(categoria)
+
+    def programar(self, categoria: str, tasa: float, inicio: datetime.datetime, fin: datetime.datetime) -> None:
+        """
+        Registra una regla que solo rige entre inicio (inclusive) y fin (exclusive).
+
+        Args:
+            categoria: Nombre de la clase a la que aplica la regla
+            tasa: Tasa de descuento entre 0 y 1
+            inicio: Comienzo de la vigencia
+            fin: Fin de la vigencia (posterior a inicio)
+        """
+        categoria = categoria.lower().strip()
+        self._programadas.setdefault(categoria, []).append((inicio, fin, tasa))
+        self._recalcular(categoria)
+
+    def quitar(self, categoria: str) -> bool:
+        """
+        Elimina todas las reglas (permanente y programadas) de una categoría.
+
+        Returns:
+            bool: True si había alguna regla
+        """
+        categoria = categoria.lower().strip()
+        existia = self._reglas.pop(categoria, None) is not None
+        existia = self._programadas.pop(categoria, None) is not None or existia
+        if existia:
+            self._recalcular(categoria)
+        return existia
+
+    def quitar_vencidas(self, momento: datetime.datetime = None) -> int:
+        """
+        Elimina las reglas programadas cuya vigencia ya terminó.
+
+        Returns:
+            int: Cantidad de reglas eliminadas
+        """
+        momento = momento or datetime.datetime.now()
+        eliminadas = 0
+        for categoria in list(self._programadas):
+            reglas = self._programadas[categoria]
+            vigentes = [regla for regla in reglas if regla[1] > momento]
+            if len(vigentes) != len(reglas):
+                eliminadas += len(reglas) - len(vigentes)
+                if vigentes:
+                    self._programadas[categoria] = vigentes
+                else:
+                    del self._programadas[categoria]
+                self._recalcular(categoria)
+        return eliminadas
+
+    def reglas(self) -> Dict[str, float]:
+        """Obtiene una copia de las reglas permanentes (categoría -> tasa)."""
+        return dict(self._reglas)
+
+    def reglas_activas(self, momento: datetime.datetime = None) -> Dict[str, float]:
+        """
+        Obtiene la tasa vigente de cada categoría con alguna regla activa.
+
+        Args:
+            momento: Instante a consultar (por defecto, ahora)
+
+        Returns:
+            Dict[str, float]: Categoría -> tasa vigente
+        """
+        momento = momento or datetime.datetime.now()
+        activas = {}
+        for categoria, linea in self._lineas_categoria.items():
+            tasa = linea.valor_en(momento)
+            if tasa is not None:
+                activas[categoria] = tasa
+        return activas
+
+    def __len__(self) -> int:
+        """Retorna la cantidad de categorías con alguna regla registrada."""
+        return len(self._lineas_categoria)
+
+    def tasa(self, clase: type, momento: datetime.datetime = None) -> float:
+        """
+        Obtiene la tasa efectiva (0 a 1) para una clase de mueble.
+
+        Args:
+            clase: Clase concreta del mueble
+            momento: Instante a consultar (por defecto, ahora)
+
+        Returns:
+            float: Tasa de la regla más específica de su MRO vigente en ese momento, o 0
+        """
+        linea = self._lineas.get(clase)
+        if linea is None:
+            linea = self._resolver(clase)  # primera consulta de esta clase
+        if not linea.cortes:
+            return linea.valores[0]
+        return linea.valor_en(momento or datetime.datetime.now())
+
+    def precios_con_descuento(self, muebles: Iterable, precios: Iterable[float] = None,
+                              momento: datetime.datetime = None) -> List[float]:
+        """
+        Calcula el precio final de muchos muebles a la vez.
+
+        Args:
+            muebles: Muebles a cotizar
+            precios: Precio de lista de cada mueble (por defecto calcular_precio())
+            momento: Instante cuyas reglas se aplican (por defecto, ahora)
+
+        Returns:
+            List[float]: Precio con descuento, redondeado a 2 decimales, en el mismo orden
+        """
+        momento = momento or datetime.datetime.now()
+        muebles = list(muebles)
+        if precios is None:
+            precios = map(methodcaller("calcular_precio"), muebles)
+        clases = list(map(type, muebles))
+        factores = {clase: 1 - self.tasa(clase, momento) for clase in set(clases)}
+        finales = map(mul, precios, map(factores.__getitem__, clases))
+        return [round(precio, 2) for precio in finales]
+
+    def _linea_categoria(self, categoria: str) -> Optional[LineaTiempo]:
+        """
+        Construye la línea de tiempo de una categoría: en cada tramo, la mayor
+        tasa entre la permanente y las programadas vigentes (None si no hay).
+        """
+        permanente = self._reglas.get(categoria)
+        programadas = self._programadas.get(categoria, ())
+        if permanente is None and not programadas:
+            return None
+        eventos: Dict[datetime.datetime, List[Tuple[int, float]]] = {}
+        for inicio, fin, tasa in programadas:
+            eventos.setdefault(inicio, []).append((1, tasa))
+            eventos.setdefault(fin, []).append((-1, tasa))
+        vigentes: List[float] = [] if permanente is None else [permanente]
+        cortes = sorted(eventos)
+        valores = [vigentes[-1] if vigentes else None]
+        for corte in cortes:
+            for signo, tasa in eventos[corte]:
+                if signo > 0:
+                    insort(vigentes, tasa)
+                else:
+                    del vigentes[bisect_right(vigentes, tasa) - 1]
+            valores.append(vigentes[-1] if vigentes else None)
+        return LineaTiempo(cortes, valores)
+
+    def _resolver(self, clase: type) -> LineaTiempo:
+        """
+        Combina las líneas de las categorías de la jerarquía de una clase (la
+        más específica con regla vigente gana en cada tramo) y la guarda en la tabla.
+        """
+        lineas = [self._lineas_categoria[base.__name__.lower()] for base in jerarquia(clase)
+                  if base.__name__.lower() in self._lineas_categoria]
+        cortes = sorted({corte for linea in lineas for corte in linea.cortes})
+        valores = []
+        for posicion in range(len(cortes) + 1):
+            tasa = 0
+            for linea in lineas:
+                # Tramo que empieza en cortes[posicion - 1] (o el inicial)
+                valor = linea.valor_en(cortes[posicion - 1]) if posicion else linea.valores[0]
+                if valor is not None:
+                    tasa = valor
+                    break
+            valores.append(tasa)
+        linea = self._lineas[clase] = LineaTiempo(cortes, valores)
+        return linea
+
+    def _recalcular(self, categoria: str) -> None:
+        """Reconstruye la línea de una categoría y la tasa de todas las clases conocidas."""
+        linea = self._linea_categoria(categoria)
+        if linea is None:
+            self._lineas_categoria.pop(categoria, None)
+        else:
+            self._lineas_categoria[categoria] = linea
+        for clase in list(self._lineas):
+            self._resolver(clase)
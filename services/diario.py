@@ -0,0 +1,290 @@
+"""
+Diario de ventas de escritura anticipada (write-ahead).
+Cada venta se escribe en el diario antes de aplicarse a la tienda, así que
+después de una caída se pueden reproducir las ventas confirmadas sobre el
+último estado guardado.
+
+Formato del archivo:
+- Firma de 8 bytes.
+- Registros de largo prefijado: largo y CRC-32 del contenido, seguidos del
+  contenido (número de secuencia, ID de la referencia, fecha en segundos,
+  unidades, precios y los textos de cliente y mueble).
+
+Un registro cortado o con el CRC incorrecto marca el final del diario: lo
+que sigue se descarta al reabrirlo.
+"""
+
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Iterable, List, Tuple
+
+_FIRMA = b"VENTAS02"
+_ENCABEZADO = struct.Struct("<II")  # largo del contenido, CRC-32
+# Secuencia, ID, fecha (segundos), cantidad, precio original, descuento, precio final, total
+_VENTA = struct.Struct("<qqqqdddd")
+_TEXTO = struct.Struct("<I")
+
+
+def _codificar(secuencia: int, id_sku: int, fila: Tuple) -> bytes:
+    """Arma el registro binario (encabezado y contenido) de una venta."""
+    momento, cliente, mueble, cantidad, precio_original, descuento, precio_final, total = fila
+    partes = [_VENTA.pack(secuencia, id_sku, momento, cantidad, precio_original,
+                          descuento, precio_final, total)]
+    for texto in (cliente, mueble):
+        texto = texto.encode("utf-8")
+        partes.append(_TEXTO.pack(len(texto)))
+        partes.append(texto)
+    contenido = b"".join(partes)
+    return _ENCABEZADO.pack(len(contenido), zlib.crc32(contenido)) + contenido
+
+
+def _decodificar(contenido: bytes) -> Tuple[int, int, Tuple]:
+    """Reconstruye (secuencia, ID, fila de la venta) a partir del contenido de un registro."""
+    secuencia, id_sku, momento, cantidad, precio_original, descuento, precio_final, total = \
+        _VENTA.unpack_from(contenido)
+    posicion = _VENTA.size
+    textos = []
+    for _ in range(2):
+        (largo,) = _TEXTO.unpack_from(contenido, posicion)
+        posicion += _TEXTO.size
+        textos.append(contenido[posicion:posicion + largo].decode("utf-8"))
+        posicion += largo
+    if posicion != len(contenido):
+        raise ValueError("Registro de venta con bytes sobrantes")
+    cliente, mueble = textos
+    return secuencia, id_sku, (momento, cliente, mueble, cantidad, precio_original,
+                               descuento, precio_final, total)
+
+
+def leer_diario(datos: bytes) -> Tuple[List[Tuple[int, int, Tuple]], int]:
+    """
+    Lee los registros válidos de un diario.
+
+    Args:
+        datos: Contenido completo del archivo
+
+    Returns:
+        Tuple: (registros (secuencia, ID, fila de la venta) en orden, bytes
+            válidos desde el inicio del archivo)
+
+    Raises:
+        ValueError: Si el archivo no es un diario de ventas
+    """
+    if len(datos) < len(_FIRMA):
+        # Caída durante la creación: el diario todavía no tenía registros
+        if _FIRMA.startswith(datos):
+            return [], 0
+        raise ValueError("El archivo no es un diario de ventas")
+    if datos[:len(_FIRMA)] != _FIRMA:
+        raise ValueError("El archivo no es un diario de ventas")
+    registros = []
+    posicion = len(_FIRMA)
+    while posicion + _ENCABEZADO.size <= len(datos):
+        largo, crc = _ENCABEZADO.unpack_from(datos, posicion)
+        inicio = posicion + _ENCABEZADO.size
+        contenido = datos[inicio:inicio + largo]
+        if len(contenido) < largo or zlib.crc32(contenido) != crc:
+            break
+        try:
+            registros.append(_decodificar(contenido))
+        except (struct.error, UnicodeDecodeError, ValueError):
+            break
+        posicion = inicio + largo
+    return registros, posicion
+
+
+class DiarioVentas:
+    """
+    Diario de ventas en disco con confirmación en grupo (group commit).
+
+    Cada registro se pasa al sistema operativo en cuanto se escribe, de modo
+    que una caída del proceso no pierde ventas. La sincronización con el
+    disco (fsync), que es lo caro, se hace una vez por grupo: cuando se
+    juntan `tamaño_grupo` registros sin sincronizar o cuando el más antiguo
+    lleva `espera_maxima` segundos esperando, aunque no llegue otra venta:
+    un hilo vigilante duerme hasta que empieza un grupo y lo sincroniza al
+    vencer el plazo. sincronizar() y cerrar() fuerzan el grupo en curso. La
+    condición del vigilante también ordena las operaciones sobre el archivo
+    entre ese hilo y quien escribe. Con tamaño_grupo=1 cada venta queda en
+    disco antes de confirmarse; con grupos más grandes una caída del equipo
+    puede perder, como máximo, el último grupo sin sincronizar.
+    """
+
+    def __init__(self, ruta: str, tamaño_grupo: int = 32, espera_maxima: float = 0.05):
+        """
+        Abre (o crea) un diario y descarta la cola cortada de una caída anterior.
+
+        Args:
+            ruta: Archivo del diario
+            tamaño_grupo: Registros por sincronización (1 = sincronizar cada venta)
+            espera_maxima: Segundos que un registro puede esperar su sincronización,
+                aunque no lleguen más ventas (None = solo por tamaño de grupo)
+
+        Raises:
+            ValueError: Si el archivo existe y no es un diario de ventas
+        """
+        if tamaño_grupo < 1:
+            raise ValueError("El tamaño de grupo debe ser al menos 1")
+        self._ruta = ruta
+        self.tamaño_grupo = tamaño_grupo
+        self.espera_maxima = espera_maxima
+        self._descriptor = os.open(ruta, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            with open(self._descriptor, "rb", closefd=False) as archivo:
+                datos = archivo.read()
+            self._registros, validos = leer_diario(datos)
+            self.bytes_descartados = len(datos) - validos
+            if validos == 0:
+                os.ftruncate(self._descriptor, 0)
+                os.lseek(self._descriptor, 0, os.SEEK_SET)
+                os.write(self._descriptor, _FIRMA)
+                validos = len(_FIRMA)
+                os.fsync(self._descriptor)
+            elif validos < len(datos):
+                os.ftruncate(self._descriptor, validos)
+                os.fsync(self._descriptor)
+            os.lseek(self._descriptor, validos, os.SEEK_SET)
+            self._fin = validos
+        except Exception:
+            os.close(self._descriptor)
+            raise
+        self._secuencia = self._registros[-1][0] if self._registros else 0
+        self._sin_sincronizar = 0
+        self._vence = 0.0
+        self._dormido = False
+        self._condicion = threading.Condition(threading.RLock())
+        self.sincronizaciones = 0
+        if espera_maxima is not None:
+            threading.Thread(target=self._vigilar, name=f"diario {ruta}", daemon=True).start()
+
+    @property
+    def ruta(self) -> str:
+        """Archivo del diario."""
+        return self._ruta
+
+    @property
+    def secuencia(self) -> int:
+        """Número de secuencia del último registro escrito."""
+        return self._secuencia
+
+    @property
+    def pendientes(self) -> int:
+        """Registros escritos que todavía no se sincronizaron con el disco."""
+        return self._sin_sincronizar
+
+    def recuperar(self) -> List[Tuple[int, int, Tuple]]:
+        """
+        Entrega los registros válidos encontrados al abrir el diario (una sola vez).
+
+        Returns:
+            List[Tuple]: Registros (secuencia, ID de referencia, fila de la venta)
+                en orden (la fila tiene la forma de RegistroVentas.agregar)
+        """
+        registros, self._registros = self._registros, []
+        return registros
+
+    def adelantar(self, secuencia: int) -> None:
+        """Hace que los próximos registros numeren después de `secuencia`."""
+        self._secuencia = max(self._secuencia, secuencia)
+
+    def registrar(self, ventas: Iterable[Tuple[int, Tuple]]) -> int:
+        """
+        Escribe un lote de ventas con una sola llamada al sistema.
+
+        Args:
+            ventas: Pares (ID de referencia, fila de la venta como en RegistroVentas.agregar)
+
+        Returns:
+            int: Secuencia del último registro escrito
+        """
+        with self._condicion:
+            secuencia = self._secuencia
+            registros = []
+            for id_sku, fila in ventas:
+                secuencia += 1
+                registros.append(_codificar(secuencia, id_sku, fila))
+            if not registros:
+                return secuencia
+            datos = b"".join(registros)
+            try:
+                escritos = os.write(self._descriptor, datos)
+                while escritos < len(datos):
+                    escritos += os.write(self._descriptor, datos[escritos:])
+            except OSError:
+                # Un lote escrito a medias no debe quedar delante de los siguientes
+                os.ftruncate(self._descriptor, self._fin)
+                os.lseek(self._descriptor, self._fin, os.SEEK_SET)
+                raise
+            self._fin += len(datos)
+            self._secuencia = secuencia
+            empieza_grupo = not self._sin_sincronizar
+            self._sin_sincronizar += len(registros)
+            if self._sin_sincronizar >= self.tamaño_grupo:
+                self.sincronizar()
+            elif empieza_grupo and self.espera_maxima is not None:
+                self._vence = time.monotonic() + self.espera_maxima
+                if self._dormido:
+                    self._condicion.notify()
+            return secuencia
+
+    def sincronizar(self) -> None:
+        """Lleva al disco todos los registros escritos (fsync del grupo)."""
+        with self._condicion:
+            if self._sin_sincronizar:
+                os.fsync(self._descriptor)
+                self.sincronizaciones += 1
+                self._sin_sincronizar = 0
+
+    def _vigilar(self) -> None:
+        """
+        Hilo vigilante: sincroniza cada grupo cuando vence espera_maxima.
+
+        Mientras llegan ventas se despierta en cada vencimiento y no en cada
+        grupo; solo cuando no hay nada pendiente se duerme hasta que
+        registrar() le avise. Termina al cerrar el diario.
+        """
+        with self._condicion:
+            while self._descriptor is not None:
+                if self._sin_sincronizar:
+                    restante = self._vence - time.monotonic()
+                    if restante > 0:
+                        self._condicion.wait(restante)
+                        continue
+                    try:
+                        self.sincronizar()
+                        continue
+                    except OSError:
+                        pass  # el error reaparece en la próxima sincronización del grupo
+                self._dormido = True
+                self._condicion.wait()
+                self._dormido = False
+
+    def vaciar(self) -> None:
+        """Descarta todos los registros (después de guardar el estado completo)."""
+        with self._condicion:
+            self._fin = len(_FIRMA)
+            os.ftruncate(self._descriptor, self._fin)
+            os.lseek(self._descriptor, self._fin, os.SEEK_SET)
+            os.fsync(self._descriptor)
+            self._sin_sincronizar = 0
+
+    def cerrar(self) -> None:
+        """Sincroniza lo pendiente y cierra el archivo."""
+        with self._condicion:
+            if self._descriptor is not None:
+                try:
+                    self.sincronizar()
+                finally:
+                    os.close(self._descriptor)
+                    self._descriptor = None
+                    self._condicion.notify_all()  # el vigilante termina
+
+    def __enter__(self) -> 'DiarioVentas':
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
+
@@ -0,0 +1,634 @@
+"""
+Estructuras de índices para acelerar las búsquedas del inventario.
+Evitan recorrer todos los muebles en cada consulta.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from models.categorico import ValorCategorico
+from models.mueble import jerarquia
+
+
+def normalizar(valor: str) -> str:
+    """
+    Normaliza un valor de texto para usarlo como clave de índice.
+
+    Args:
+        valor: Texto a normalizar
+
+    Returns:
+        str: Texto en minúsculas y sin espacios en los extremos
+    """
+    if type(valor) is ValorCategorico:
+        return valor.clave  # ya normalizado al asignarse
+    return valor.lower().strip()
+
+
+class _IndiceCubetas:
+    """
+    Base de los índices hash: cada clave tiene una cubeta {secuencia: elemento}.
+
+    Un elemento recibe su secuencia la primera vez que se indexa y la
+    conserva aunque cambien sus claves, así que las cubetas devuelven los
+    elementos en orden de inserción sin importar cuántas veces se editaron.
+    Si un elemento editado cae en medio de una cubeta, esa cubeta se
+    reordena recién en la siguiente búsqueda.
+    """
+
+    def __init__(self):
+        """Constructor de las cubetas vacías."""
+        self._cubetas: Dict[str, Dict[int, Any]] = {}
+        self._desordenadas: set = set()  # claves de las cubetas a reordenar antes de leerlas
+        self._secuencia = 0
+
+    def _insertar(self, clave: str, secuencia: int, elemento: Any) -> None:
+        """Agrega un elemento a una cubeta, anotándola si queda fuera de orden."""
+        cubeta = self._cubetas.get(clave)
+        if cubeta is None:
+            self._cubetas[clave] = {secuencia: elemento}
+            return
+        if secuencia < next(reversed(cubeta)):
+            self._desordenadas.add(clave)
+        cubeta[secuencia] = elemento
+
+    def _retirar(self, clave: str, secuencia: int) -> None:
+        """Quita un elemento de una cubeta y borra la cubeta si queda vacía."""
+        cubeta = self._cubetas[clave]
+        del cubeta[secuencia]
+        if not cubeta:
+            del self._cubetas[clave]
+            self._desordenadas.discard(clave)
+
+    def _cubeta(self, clave: str) -> Dict[int, Any]:
+        """Obtiene la cubeta de una clave en orden de inserción."""
+        cubeta = self._cubetas.get(clave)
+        if cubeta is None:
+            return {}
+        if clave in self._desordenadas:
+            # Las secuencias son únicas, así que ordenar los pares nunca compara elementos
+            cubeta = self._cubetas[clave] = dict(sorted(cubeta.items()))
+            self._desordenadas.discard(clave)
+        return cubeta
+
+
+class IndiceHash(_IndiceCubetas):
+    """
+    Índice hash que agrupa elementos por una clave de texto normalizada.
+
+    Cada cubeta conserva el orden de inserción, por lo que las búsquedas
+    devuelven los elementos en el mismo orden en que fueron agregados,
+    aunque después se les haya cambiado la clave.
+    Una búsqueda cuesta O(k), donde k es el tamaño del resultado.
+    """
+
+    def __init__(self, clave: Callable[[Any], str]):
+        """
+        Constructor del índice.
+
+        Args:
+            clave: Función que obtiene el valor a indexar de cada elemento
+        """
+        super().__init__()
+        self._clave = clave
+        self._claves: Dict[int, Tuple[str, int]] = {}  # id(elemento) -> (clave, secuencia)
+
+    def agregar(self, elemento: Any) -> None:
+        """Agrega un elemento a la cubeta de su clave."""
+        if id(elemento) in self._claves:
+            return
+        clave = normalizar(self._clave(elemento))
+        self._secuencia += 1
+        self._insertar(clave, self._secuencia, elemento)
+        self._claves[id(elemento)] = (clave, self._secuencia)
+
+    def agregar_lote(self, elementos: Iterable[Any]) -> None:
+        """Agrega muchos elementos en una sola pasada."""
+        cubetas = self._cubetas
+        claves = self._claves
+        clave_de = self._clave
+        secuencia = self._secuencia
+        for elemento in elementos:
+            if id(elemento) in claves:
+                continue
+            clave = normalizar(clave_de(elemento))
+            secuencia += 1
+            cubeta = cubetas.get(clave)
+            if cubeta is None:
+                cubeta = cubetas[clave] = {}
+            # Las secuencias nuevas son las mayores: van al final de la cubeta
+            cubeta[secuencia] = elemento
+            claves[id(elemento)] = (clave, secuencia)
+        self._secuencia = secuencia
+
+    def quitar(self, elemento: Any) -> None:
+        """Quita un elemento del índice si está presente."""
+        registro = self._claves.pop(id(elemento), None)
+        if registro is not None:
+            self._retirar(*registro)
+
+    def actualizar(self, elemento: Any) -> None:
+        """Reubica un elemento cuya clave pudo haber cambiado, sin cambiar su orden."""
+        registro = self._claves.get(id(elemento))
+        if registro is None:
+            return
+        clave_previa, secuencia = registro
+        clave = normalizar(self._clave(elemento))
+        if clave == clave_previa:
+            return
+        self._retirar(clave_previa, secuencia)
+        self._insertar(clave, secuencia, elemento)
+        self._claves[id(elemento)] = (clave, secuencia)
+
+    def buscar(self, valor: str) -> List[Any]:
+        """
+        Obtiene los elementos cuya clave coincide con el valor dado.
+
+        Args:
+            valor: Valor a buscar (se normaliza antes de buscar)
+
+        Returns:
+            List: Elementos de la cubeta correspondiente, en orden de inserción
+        """
+        return list(self._cubeta(normalizar(valor)).values())
+
+    def __len__(self) -> int:
+        """Retorna el número de elementos indexados."""
+        return len(self._claves)
+
+
+class IndiceMultiple(_IndiceCubetas):
+    """
+    Índice hash donde cada elemento puede tener varias claves de texto
+    (por ejemplo, el conjunto de materiales de un comedor).
+
+    Un elemento figura en la cubeta de cada una de sus claves normalizadas,
+    en su orden de inserción; una búsqueda cuesta O(k), donde k es el
+    tamaño del resultado.
+    """
+
+    def __init__(self, claves: Callable[[Any], Iterable[str]]):
+        """
+        Constructor del índice.
+
+        Args:
+            claves: Función que obtiene los valores a indexar de cada elemento
+        """
+        super().__init__()
+        self._claves_de = claves
+        # id(elemento) -> (claves, secuencia)
+        self._claves: Dict[int, Tuple[Tuple[str, ...], int]] = {}
+
+    def agregar(self, elemento: Any) -> None:
+        """Agrega un elemento a la cubeta de cada una de sus claves."""
+        if id(elemento) in self._claves:
+            return
+        self._secuencia += 1
+        self._registrar(elemento, self._secuencia)
+
+    def _registrar(self, elemento: Any, secuencia: int) -> None:
+        """Inserta un elemento con la secuencia dada en las cubetas de sus claves actuales."""
+        claves = tuple({normalizar(valor) for valor in self._claves_de(elemento)})
+        for clave in claves:
+            self._insertar(clave, secuencia, elemento)
+        self._claves[id(elemento)] = (claves, secuencia)
+
+    def quitar(self, elemento: Any) -> None:
+        """Quita un elemento de todas sus cubetas si está presente."""
+        claves, secuencia = self._claves.pop(id(elemento), ((), 0))
+        for clave in claves:
+            self._retirar(clave, secuencia)
+
+    def actualizar(self, elemento: Any) -> None:
+        """Reubica un elemento cuyas claves pudieron haber cambiado, sin cambiar su orden."""
+        registro = self._claves.get(id(elemento))
+        if registro is None:
+            return
+        claves_previas, secuencia = registro
+        if {normalizar(valor) for valor in self._claves_de(elemento)} == set(claves_previas):
+            return
+        self.quitar(elemento)
+        self._registrar(elemento, secuencia)
+
+    def buscar(self, valor: str) -> List[Any]:
+        """
+        Obtiene los elementos que tienen el valor dado entre sus claves.
+
+        Args:
+            valor: Valor a buscar (se normaliza antes de buscar)
+
+        Returns:
+            List: Elementos de la cubeta correspondiente, en orden de inserción
+        """
+        return list(self._cubeta(normalizar(valor)).values())
+
+    def __len__(self) -> int:
+        """Retorna el número de elementos indexados."""
+        return len(self._claves)
+
+
+class IndiceTipos:
+    """
+    Índice que agrupa elementos por su clase concreta.
+
+    Además mantiene una clausura de subclases construida a partir de la
+    jerarquía de cada clase (su MRO, ver models.mueble.jerarquia):
+    para cada clase (abstracta o concreta) guarda las clases concretas
+    indexadas que heredan de ella. Así, consultar por `Asiento` solo visita
+    las cubetas de `Silla`, `Sillon`, `Sofa` y `SofaCama`, y un `SofaCama`
+    aparece también al consultar por `Cama`.
+    """
+
+    def __init__(self):
+        """Constructor del índice."""
+        self._cubetas: Dict[type, Dict[int, Any]] = {}
+        self._clausura: Dict[type, List[type]] = {}
+
+    def agregar(self, elemento: Any) -> None:
+        """Agrega un elemento a la cubeta de su clase concreta."""
+        clase = type(elemento)
+        cubeta = self._cubetas.get(clase)
+        if cubeta is None:
+            cubeta = self._cubetas[clase] = {}
+            # Primera vez que aparece la clase: se registra en todos sus ancestros
+            for ancestro in jerarquia(clase):
+                self._clausura.setdefault(ancestro, []).append(clase)
+        cubeta[id(elemento)] = elemento
+
+    def agregar_lote(self, elementos: Iterable[Any]) -> None:
+        """Agrega muchos elementos en una sola pasada."""
+        cubetas = self._cubetas
+        for elemento in elementos:
+            cubeta = cubetas.get(type(elemento))
+            if cubeta is None:
+                self.agregar(elemento)
+            else:
+                cubeta[id(elemento)] = elemento
+
+    def quitar(self, elemento: Any) -> None:
+        """Quita un elemento de su cubeta si está presente."""
+        cubeta = self._cubetas.get(type(elemento))
+        if cubeta is not None:
+            cubeta.pop(id(elemento), None)
+
+    def buscar(self, clase: type) -> List[Any]:
+        """
+        Obtiene los elementos que son instancia de la clase dada.
+
+        Args:
+            clase: Clase concreta, abstracta o base de herencia múltiple
+
+        Returns:
+            List: Elementos agrupados por clase concreta
+        """
+        resultados = []
+        for concreta in self._clausura.get(clase, ()):
+            resultados.extend(self._cubetas[concreta].values())
+        return resultados
+
+    def contar(self, clase: type) -> int:
+        """Cuenta los elementos que son instancia de la clase dada."""
+        return sum(len(self._cubetas[concreta]) for concreta in self._clausura.get(clase, ()))
+
+    def conteo_por_clase(self) -> Dict[str, int]:
+        """
+        Cuenta los elementos de cada clase concreta.
+
+        Returns:
+            Dict[str, int]: Nombre de la clase y cantidad de elementos
+        """
+        conteo = {}
+        for clase, cubeta in self._cubetas.items():
+            if cubeta:
+                conteo[clase.__name__] = conteo.get(clase.__name__, 0) + len(cubeta)
+        return conteo
+
+
+class IndiceOrdenado:
+    """
+    Índice ordenado por una clave numérica (por ejemplo, el precio).
+
+    Guarda un arreglo de claves (valor, secuencia) ordenado y un arreglo
+    paralelo con los elementos. Las consultas por rango usan búsqueda
+    binaria (bisect) y cuestan O(log n + k). La secuencia desempata
+    valores iguales respetando el orden de inserción.
+
+    Cada elemento conserva además la secuencia de su primera alta, aunque
+    su clave cambie: rango_en_orden ordena el tramo del rango por ella y
+    devuelve los elementos en orden de inserción en O(log n + k log k).
+    """
+
+    def __init__(self, clave: Callable[[Any], float]):
+        """
+        Constructor del índice.
+
+        Args:
+            clave: Función que obtiene el valor numérico de cada elemento
+        """
+        self._clave = clave
+        self._claves: List[Tuple[float, int]] = []
+        self._elementos: List[Any] = []
+        # Clave actual de cada elemento registrado (None si su clave falló)
+        self._registrados: Dict[int, Optional[Tuple[float, int]]] = {}
+        self._altas: Dict[int, int] = {}  # id(elemento) -> secuencia de su primera alta
+        self._secuencia = 0
+
+    def agregar(self, elemento: Any) -> None:
+        """
+        Inserta un elemento en su posición ordenada.
+        Los elementos cuya clave lanza una excepción quedan registrados
+        pero fuera del orden hasta que se actualicen.
+        """
+        self._secuencia += 1
+        self._altas.setdefault(id(elemento), self._secuencia)
+        try:
+            valor = self._clave(elemento)
+        except Exception:
+            self._registrados[id(elemento)] = None
+            return
+        clave = (valor, self._secuencia)
+        posicion = bisect_right(self._claves, clave)
+        self._claves.insert(posicion, clave)
+        self._elementos.insert(posicion, elemento)
+        self._registrados[id(elemento)] = clave
+
+    def agregar_lote(self, elementos: Iterable[Any]) -> None:
+        """
+        Inserta muchos elementos a la vez.
+        Calcula las claves, las agrega al final y reordena una sola vez,
+        en lugar de pagar una inserción ordenada por elemento.
+        """
+        nuevos = []
+        altas = self._altas
+        for elemento in elementos:
+            self._secuencia += 1
+            altas.setdefault(id(elemento), self._secuencia)
+            try:
+                valor = self._clave(elemento)
+            except Exception:
+                self._registrados[id(elemento)] = None
+                continue
+            clave = (valor, self._secuencia)
+            self._registrados[id(elemento)] = clave
+            nuevos.append((clave, elemento))
+        if not nuevos:
+            return
+        # Las claves son únicas (llevan la secuencia), así que ordenar los pares
+        # nunca llega a comparar los elementos
+        pares = list(zip(self._claves, self._elementos)) if self._claves else []
+        pares.extend(nuevos)
+        pares.sort()
+        self._claves = [clave for clave, _ in pares]
+        self._elementos = [elemento for _, elemento in pares]
+
+    def quitar(self, elemento: Any) -> None:
+        """Quita un elemento del índice si está presente."""
+        if id(elemento) not in self._registrados:
+            return
+        del self._altas[id(elemento)]
+        clave = self._registrados.pop(id(elemento))
+        if clave is None:
+            return
+        posicion = bisect_left(self._claves, clave)
+        del self._claves[posicion]
+        del self._elementos[posicion]
+
+    def actualizar(self, elemento: Any) -> None:
+        """Reubica un elemento cuya clave pudo haber cambiado; conserva su lugar en el orden de alta."""
+        if id(elemento) in self._registrados:
+            alta = self._altas[id(elemento)]
+            self.quitar(elemento)
+            self.agregar(elemento)
+            self._altas[id(elemento)] = alta
+
+    def rango(self, minimo: float, maximo: float) -> List[Any]:
+        """
+        Obtiene los elementos con clave en [minimo, maximo].
+
+        Returns:
+            List: Elementos ordenados de menor a mayor clave
+        """
+        inicio, fin = self._limites(minimo, maximo)
+        return self._elementos[inicio:fin]
+
+    def rango_en_orden(self, minimo: float, maximo: float) -> List[Any]:
+        """
+        Obtiene los elementos con clave en [minimo, maximo] en orden de inserción.
+
+        Returns:
+            List: Elementos en el orden en que se agregaron al índice
+        """
+        inicio, fin = self._limites(minimo, maximo)
+        altas = self._altas
+        return sorted(self._elementos[inicio:fin], key=lambda elemento: altas[id(elemento)])
+
+    def _limites(self, minimo: float, maximo: float) -> Tuple[int, int]:
+        """Posiciones [inicio, fin) de las claves dentro de [minimo, maximo]."""
+        inicio = bisect_left(self._claves, (minimo,))
+        fin = bisect_right(self._claves, (maximo, float('inf')))
+        return inicio, fin
+
+    def primeros(self, n: int) -> List[Any]:
+        """Obtiene los n elementos de menor clave, de menor a mayor."""
+        return self._elementos[:max(n, 0)]
+
+    def ultimos(self, n: int) -> List[Any]:
+        """Obtiene los n elementos de mayor clave, de mayor a menor."""
+        if n <= 0:
+            return []
+        return self._elementos[:-n - 1:-1]
+
+    def __len__(self) -> int:
+        """Retorna el número de elementos ordenados."""
+        return len(self._elementos)
+
+
+class IndiceNgramas:
+    """
+    Índice invertido de n-gramas para búsquedas parciales de texto.
+
+    Cada texto se normaliza a minúsculas, se rodea con una marca de borde y
+    se descompone en sus n-gramas (trigramas por defecto). Una consulta de
+    n o más caracteres intersecta las listas de sus n-gramas y solo
+    verifica los candidatos. Una consulta más corta se resuelve con el
+    vocabulario de n-gramas que la contienen, sin tocar los textos.
+
+    Como en los índices hash, cada elemento conserva la secuencia con la
+    que se indexó y las listas se ordenan por ella, así que los resultados
+    salen en orden de inserción aunque los textos se editen.
+    """
+
+    _MARCA = "\x00"
+
+    def __init__(self, clave: Callable[[Any], str], n: int = 3):
+        """
+        Constructor del índice.
+
+        Args:
+            clave: Función que obtiene el texto a indexar de cada elemento
+            n: Longitud de los fragmentos indexados
+        """
+        self._clave = clave
+        self._n = n
+        self._listas: Dict[str, Dict[int, Any]] = {}  # n-grama -> {secuencia: elemento}
+        self._textos: Dict[int, str] = {}  # secuencia -> texto normalizado
+        self._secuencias: Dict[int, int] = {}  # id(elemento) -> secuencia
+        self._desordenadas: set = set()  # n-gramas cuya lista hay que reordenar antes de leerla
+        self._secuencia = 0
+        # Fragmento corto -> n-gramas del vocabulario que lo contienen
+        self._vocabulario: Dict[str, Dict[str, None]] = {}
+
+    def _fragmentos(self, texto: str) -> set:
+        """Obtiene los n-gramas distintos de un texto rodeado por marcas de borde."""
+        n = self._n
+        texto = self._MARCA + texto + self._MARCA
+        return {texto[i:i + n] for i in range(len(texto) - n + 1)}
+
+    def _nueva_lista(self, fragmento: str) -> Dict[int, Any]:
+        """Crea la lista de un n-grama nuevo y lo registra en el vocabulario."""
+        lista = self._listas[fragmento] = {}
+        self._registrar_vocabulario(fragmento)
+        return lista
+
+    def _registrar_vocabulario(self, fragmento: str) -> None:
+        """Registra un n-grama bajo cada uno de sus fragmentos más cortos."""
+        for largo in range(1, self._n):
+            for i in range(self._n - largo + 1):
+                self._vocabulario.setdefault(fragmento[i:i + largo], {})[fragmento] = None
+
+    def _borrar_lista(self, fragmento: str) -> None:
+        """Elimina la lista vacía de un n-grama y lo quita del vocabulario."""
+        del self._listas[fragmento]
+        self._desordenadas.discard(fragmento)
+        for largo in range(1, self._n):
+            for i in range(self._n - largo + 1):
+                corto = fragmento[i:i + largo]
+                fragmentos = self._vocabulario.get(corto)
+                if fragmentos is not None:
+                    fragmentos.pop(fragmento, None)
+                    if not fragmentos:
+                        del self._vocabulario[corto]
+
+    def _lista(self, fragmento: str) -> Dict[int, Any]:
+        """Obtiene la lista de un n-grama en orden de inserción."""
+        lista = self._listas[fragmento]
+        if fragmento in self._desordenadas:
+            lista = self._listas[fragmento] = dict(sorted(lista.items()))
+            self._desordenadas.discard(fragmento)
+        return lista
+
+    def agregar(self, elemento: Any) -> None:
+        """Indexa el texto de un elemento."""
+        self.agregar_lote((elemento,))
+
+    def agregar_lote(self, elementos: Iterable[Any]) -> None:
+        """
+        Indexa el texto de muchos elementos en una sola pasada.
+        Los n-gramas se generan en línea y los que aparecen por primera vez
+        se registran en el vocabulario una sola vez, al final del lote.
+        """
+        listas = self._listas
+        textos = self._textos
+        secuencias = self._secuencias
+        clave_de = self._clave
+        n = self._n
+        marca = self._MARCA
+        secuencia = self._secuencia
+        nuevos = []
+        for elemento in elementos:
+            if id(elemento) in secuencias:
+                continue
+            texto = clave_de(elemento).lower()
+            secuencia += 1
+            secuencias[id(elemento)] = secuencia
+            textos[secuencia] = texto
+            marcado = marca + texto + marca
+            for fragmento in {marcado[i:i + n] for i in range(len(marcado) - n + 1)}:
+                # Las secuencias nuevas son las mayores: van al final de la lista
+                try:
+                    listas[fragmento][secuencia] = elemento
+                except KeyError:
+                    listas[fragmento] = {secuencia: elemento}
+                    nuevos.append(fragmento)
+        self._secuencia = secuencia
+        for fragmento in nuevos:
+            self._registrar_vocabulario(fragmento)
+
+    def quitar(self, elemento: Any) -> None:
+        """Quita un elemento del índice si está presente."""
+        secuencia = self._secuencias.pop(id(elemento), None)
+        if secuencia is None:
+            return
+        for fragmento in self._fragmentos(self._textos.pop(secuencia)):
+            self._retirar(fragmento, secuencia)
+
+    def _retirar(self, fragmento: str, secuencia: int) -> None:
+        """Quita una secuencia de la lista de un n-grama."""
+        lista = self._listas[fragmento]
+        del lista[secuencia]
+        if not lista:
+            self._borrar_lista(fragmento)
+
+    def actualizar(self, elemento: Any) -> None:
+        """
+        Reindexa un elemento cuyo texto pudo haber cambiado. Solo se tocan
+        los n-gramas que aparecen o desaparecen, y el elemento mantiene su
+        lugar en el orden de inserción.
+        """
+        secuencia = self._secuencias.get(id(elemento))
+        if secuencia is None:
+            return
+        texto = self._clave(elemento).lower()
+        previo = self._textos[secuencia]
+        if texto == previo:
+            return
+        anteriores, actuales = self._fragmentos(previo), self._fragmentos(texto)
+        for fragmento in anteriores - actuales:
+            self._retirar(fragmento, secuencia)
+        for fragmento in actuales - anteriores:
+            lista = self._listas.get(fragmento)
+            if lista is None:
+                lista = self._nueva_lista(fragmento)
+            elif secuencia < next(reversed(lista)):
+                self._desordenadas.add(fragmento)
+            lista[secuencia] = elemento
+        self._textos[secuencia] = texto
+
+    def buscar(self, consulta: str) -> List[Any]:
+        """
+        Busca los elementos cuyo texto contiene la consulta (case-insensitive).
+
+        Args:
+            consulta: Texto a buscar
+
+        Returns:
+            List: Elementos que contienen la consulta, en orden de inserción
+        """
+        consulta = consulta.lower().strip()
+        if not consulta:
+            return []
+        if len(consulta) < self._n:
+            # Todo n-grama del vocabulario que contiene la consulta corresponde a textos que la contienen
+            # Las listas se unen por secuencia y se ordenan para devolver el orden de inserción
+            resultados: Dict[int, Any] = {}
+            for fragmento in self._vocabulario.get(consulta, ()):
+                resultados.update(self._listas[fragmento])
+            return [resultados[secuencia] for secuencia in sorted(resultados)]
+        listas = []
+        for i in range(len(consulta) - self._n + 1):
+            fragmento = consulta[i:i + self._n]
+            lista = self._listas.get(fragmento)
+            if lista is None:
+                return []
+            listas.append((len(lista), fragmento))
+        listas.sort()
+        # La lista más corta se recorre en orden; las demás solo se consultan
+        menor = self._lista(listas[0][1])
+        resto = [self._listas[fragmento] for _, fragmento in listas[1:]]
+        textos = self._textos
+        return [elemento for secuencia, elemento in menor.items()
+                if all(secuencia in lista for lista in resto) and consulta in textos[secuencia]]
+
+    def __len__(self) -> int:
+        """Retorna el número de elementos indexados."""
+        return len(self._secuencias)
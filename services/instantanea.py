@@ -0,0 +1,164 @@
+"""
+Instantánea columnar del inventario para consultas analíticas.
+Guarda los atributos de los muebles en columnas compactas (módulo array)
+para recorrer millones de filas sin visitar los objetos Python.
+"""
+
+import math
+from array import array
+from collections import Counter
+from itertools import compress
+from operator import and_, eq, mul
+from typing import Dict, Iterable, List, Tuple
+
+from models.mueble import Mueble
+from services.indices import normalizar
+
+
+class ColumnaCategorica:
+    """
+    Columna de valores de texto codificados como enteros.
+
+    Cada valor distinto (normalizado a minúsculas) recibe un código; la
+    columna guarda solo los códigos en un array de enteros sin signo.
+    """
+
+    def __init__(self):
+        """Constructor de la columna vacía."""
+        self.codigos = array('I')
+        self.categorias: List[str] = []
+        self._por_valor: Dict[str, int] = {}
+
+    def agregar(self, valor: str) -> None:
+        """Agrega una fila con el valor dado."""
+        clave = normalizar(valor)
+        codigo = self._por_valor.get(clave)
+        if codigo is None:
+            codigo = self._por_valor[clave] = len(self.categorias)
+            self.categorias.append(valor)
+        self.codigos.append(codigo)
+
+    def codigo_de(self, valor: str) -> int:
+        """Obtiene el código de un valor, o -1 si no aparece en la columna."""
+        return self._por_valor.get(normalizar(valor), -1)
+
+    def mascara_igual(self, valor: str) -> Iterable[bool]:
+        """Máscara perezosa (evaluada en C) de las filas con el valor dado."""
+        return map(self.codigo_de(valor).__eq__, self.codigos)
+
+    def conteo(self, pesos: Iterable[int] = None) -> Dict[str, int]:
+        """
+        Cuenta las filas de cada categoría, en orden de aparición.
+
+        Args:
+            pesos: Columna opcional con lo que aporta cada fila (por defecto 1)
+        """
+        if pesos is None:
+            conteo = Counter(self.codigos)
+            return {categoria: conteo[codigo] for codigo, categoria in enumerate(self.categorias)}
+        return {categoria: sum(compress(pesos, map(codigo.__eq__, self.codigos)))
+                for codigo, categoria in enumerate(self.categorias)}
+
+
+class InstantaneaColumnar:
+    """
+    Copia columnar e inmutable del inventario de una tienda.
+
+    Cada fila es una referencia (SKU) del inventario. Columnas numéricas
+    (array de float o int): existencias, precio_base, precio,
+    area_superficie, capacidad_personas y altura. Los atributos que un
+    tipo de mueble no tiene se guardan como NaN (float) o 0 (int).
+    Columnas categóricas: tipo, material y color.
+
+    Las consultas combinan máscaras con map/compress, que se evalúan en C
+    sin crear objetos intermedios por fila.
+    """
+
+    def __init__(self, muebles: Iterable[Tuple[int, Mueble, int]], valor_comedores: float = 0.0,
+                 conteo_comedores: Dict[str, int] = None):
+        """
+        Construye la instantánea a partir de tuplas (ID, mueble, existencias).
+
+        Args:
+            muebles: Tuplas (ID de inventario, mueble, existencias) en el orden deseado
+            valor_comedores: Valor total de los comedores al momento de la instantánea
+            conteo_comedores: Conteo por tipo de los comedores
+        """
+        nan = math.nan
+        self.ids = array('q')
+        self.existencias = array('q')
+        self.precio_base = array('d')
+        self.precio = array('d')
+        self.area_superficie = array('d')
+        self.capacidad_personas = array('i')
+        self.altura = array('d')
+        self.tipo = ColumnaCategorica()
+        self.material = ColumnaCategorica()
+        self.color = ColumnaCategorica()
+        self._muebles: List[Mueble] = []
+        self._valor_comedores = valor_comedores
+        self._conteo_comedores = dict(conteo_comedores or {})
+
+        for id_mueble, mueble, existencias in muebles:
+            try:
+                precio = mueble.calcular_precio()
+            except Exception:
+                precio = nan
+            self.ids.append(id_mueble)
+            self.existencias.append(existencias)
+            self.precio_base.append(mueble.precio_base)
+            self.precio.append(precio)
+            self.area_superficie.append(getattr(mueble, 'area_superficie', nan))
+            self.capacidad_personas.append(getattr(mueble, 'capacidad_personas', 0))
+            self.altura.append(getattr(mueble, 'altura', nan))
+            self.tipo.agregar(type(mueble).__name__)
+            self.material.agregar(mueble.material)
+            self.color.agregar(mueble.color)
+            self._muebles.append(mueble)
+
+    def __len__(self) -> int:
+        """Retorna el número de filas."""
+        return len(self.ids)
+
+    def seleccionar(self, mascara: Iterable[bool]) -> List[Mueble]:
+        """Obtiene los muebles de las filas marcadas por la máscara."""
+        return list(compress(self._muebles, mascara))
+
+    def mascara_precio(self, precio_min: float = 0, precio_max: float = float('inf')) -> Iterable[bool]:
+        """Máscara perezosa de las filas con precio en [precio_min, precio_max]."""
+        return map(and_, map(precio_min.__le__, self.precio), map(precio_max.__ge__, self.precio))
+
+    def filtrar_por_precio(self, precio_min: float = 0, precio_max: float = float('inf')) -> List[Mueble]:
+        """
+        Equivalente columnar de TiendaMuebles.filtrar_por_precio.
+
+        Returns:
+            List[Mueble]: Muebles en el rango, en orden de inventario
+        """
+        if precio_min < 0:
+            precio_min = 0
+        return self.seleccionar(self.mascara_precio(float(precio_min), float(precio_max)))
+
+    def filtrar_por_material(self, material: str) -> List[Mueble]:
+        """
+        Equivalente columnar de TiendaMuebles.filtrar_por_material.
+
+        Returns:
+            List[Mueble]: Muebles del material, en orden de inventario
+        """
+        if not material or not material.strip():
+            return []
+        return self.seleccionar(self.material.mascara_igual(material))
+
+    def calcular_valor_inventario(self) -> float:
+        """Equivalente columnar de TiendaMuebles.calcular_valor_inventario."""
+        # eq(p, p) es falso solo para NaN: las filas sin precio no suman
+        valor = math.fsum(compress(map(mul, self.precio, self.existencias), map(eq, self.precio, self.precio)))
+        return round(valor + self._valor_comedores, 2)
+
+    def contar_tipos_muebles(self) -> Dict[str, int]:
+        """Equivalente columnar de TiendaMuebles._contar_tipos_muebles."""
+        conteo = self.tipo.conteo(self.existencias)
+        for tipo, cantidad in self._conteo_comedores.items():
+            conteo[tipo] = conteo.get(tipo, 0) + cantidad
+        return conteo
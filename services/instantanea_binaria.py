@@ -0,0 +1,428 @@
+"""
+Instantánea binaria de una tienda para arranques rápidos.
+Guarda el inventario en columnas tipadas (una por atributo y por clase) que
+se leen con mmap y se decodifican en bloque, más los comedores, los
+descuentos y el historial de ventas.
+
+Formato del archivo:
+- Encabezado de 24 bytes: firma, desplazamiento y largo del directorio.
+- Secciones alineadas a 8 bytes con el contenido crudo de un array (en el
+  orden de bytes indicado en el directorio), texto UTF-8 o pickle. En la
+  sección de comedores los muebles que también están en el inventario se
+  guardan como su ID, así al leer vuelven a ser el mismo objeto.
+- Directorio JSON al final con la ubicación de cada sección y la
+  descripción de las columnas de cada clase.
+"""
+
+import gc
+import io
+import json
+import mmap
+import os
+import pickle
+import struct
+import sys
+from array import array
+from collections import deque
+from importlib import import_module
+from itertools import repeat
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from models.categorico import ValorCategorico, categorico
+
+_FIRMA = b"MUEBLES1"
+_ENCABEZADO = struct.Struct("<8sQQ")
+_VERSION = 4  # 2: historial de ventas en columnas; 3: con tipo de mueble y resúmenes; 4: comedores con IDs
+# Separador de los textos de una columna: no puede aparecer en nombres (IndiceNgramas lo usa de marca)
+_SEPARADOR = "\x00"
+_ENTERO_MIN, _ENTERO_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+def _ruta_clase(clase: type) -> str:
+    """Nombre importable de una clase ("modulo:Clase"), o '' si no se puede importar."""
+    modulo = sys.modules.get(clase.__module__)
+    if modulo is None or getattr(modulo, clase.__qualname__, None) is not clase:
+        return ""
+    return f"{clase.__module__}:{clase.__qualname__}"
+
+
+def _importar_clase(ruta: str) -> type:
+    modulo, nombre = ruta.split(":")
+    return getattr(import_module(modulo), nombre)
+
+
+def _descriptor_slot(clase: type, nombre: str):
+    """Descriptor del slot `nombre` en el MRO de la clase."""
+    for base in clase.__mro__:
+        if nombre in base.__dict__.get('__slots__', ()):
+            return base.__dict__[nombre]
+    raise AttributeError(nombre)
+
+
+def _tipo_columna(valores: List[Any]) -> str:
+    """
+    Elige la codificación de una columna conservando los tipos exactos:
+    'b' bool, 'q' entero, 'd' float, 's' texto, 'c' categórico (o None),
+    'o' cualquier otra combinación (pickle).
+    """
+    tipos = set(map(type, valores))
+    if tipos == {bool}:
+        return 'b'
+    if tipos == {int}:
+        return 'q' if _ENTERO_MIN <= min(valores) and max(valores) <= _ENTERO_MAX else 'o'
+    if tipos == {float}:
+        return 'd'
+    if tipos <= {ValorCategorico, type(None)}:
+        return 'c'
+    if tipos == {str} and not any(_SEPARADOR in valor for valor in valores):
+        return 's'
+    return 'o'
+
+
+class _Escritor:
+    """Escribe secciones alineadas y recuerda su ubicación."""
+
+    def __init__(self, archivo):
+        self._archivo = archivo
+        self.secciones: Dict[str, Tuple[int, int]] = {}
+
+    def seccion(self, nombre: str, datos) -> None:
+        posicion = self._archivo.tell()
+        relleno = -posicion % 8
+        if relleno:
+            self._archivo.write(b"\0" * relleno)
+            posicion += relleno
+        datos = memoryview(datos).cast('B')
+        self._archivo.write(datos)
+        self.secciones[nombre] = (posicion, len(datos))
+
+    def columna(self, nombre: str, tipo: str, valores: List[Any]) -> None:
+        if tipo == 'b':
+            self.seccion(nombre, array('b', valores))
+        elif tipo in 'qd':
+            self.seccion(nombre, array(tipo, valores))
+        elif tipo == 's':
+            self.seccion(nombre, _SEPARADOR.join(valores).encode("utf-8"))
+        elif tipo == 'c':
+            codigos: Dict[Any, int] = {None: 0}  # el código 0 representa None
+            columna = array('i', [codigos.setdefault(valor, len(codigos)) for valor in valores])
+            self.seccion(nombre, columna)
+            textos = [str(valor) for valor in codigos if valor is not None]
+            self.seccion(nombre + ".categorias", _SEPARADOR.join(textos).encode("utf-8"))
+        else:
+            self.seccion(nombre, pickle.dumps(valores, pickle.HIGHEST_PROTOCOL))
+
+
+class _PicklerReferencias(pickle.Pickler):
+    """Pickler que guarda los muebles del inventario como su ID de inventario."""
+
+    def __init__(self, archivo, ids: Dict[int, int]):
+        super().__init__(archivo, pickle.HIGHEST_PROTOCOL)
+        self._ids = ids  # id(mueble) -> ID de inventario
+
+    def persistent_id(self, objeto):
+        return self._ids.get(id(objeto))
+
+
+class _UnpicklerReferencias(pickle.Unpickler):
+    """Unpickler que resuelve los IDs de inventario con los muebles ya restaurados."""
+
+    def __init__(self, archivo, resolver: Callable[[int], Any]):
+        super().__init__(archivo)
+        self._resolver = resolver
+
+    def persistent_load(self, id_mueble):
+        mueble = self._resolver(id_mueble)
+        if mueble is None:
+            raise pickle.UnpicklingError(f"El comedor refiere a un mueble inexistente: {id_mueble}")
+        return mueble
+
+
+def _columnas_del_grupo(muebles: List[Any]):
+    """
+    Estado de cada mueble de una clase reunido por atributo.
+
+    Returns:
+        Lista de (nombre, lugar, valores) con lugar "slot" o "dict", o None si
+        los muebles no comparten los mismos atributos.
+    """
+    estados = [mueble.__getstate__() for mueble in muebles]
+    atributos, slots = estados[0]
+    nombres_slots = tuple(slots)
+    nombres_dict = tuple(atributos or ())
+    for atributos, slots in estados:
+        if tuple(slots) != nombres_slots or tuple(atributos or ()) != nombres_dict:
+            return None
+    columnas = [(nombre, "slot", [estado[1][nombre] for estado in estados]) for nombre in nombres_slots]
+    columnas += [(nombre, "dict", [estado[0][nombre] for estado in estados]) for nombre in nombres_dict]
+    return columnas
+
+
+def escribir_instantanea(ruta: str, nombre: str, referencias: Iterable[Tuple[int, Any, int]],
+                         siguiente_id: int, comedores: List[Any], descuentos: Any,
+                         ventas: Any, resumen: Dict[str, Any] = None,
+                         secuencia_diario: int = 0) -> None:
+    """
+    Escribe la instantánea binaria de una tienda.
+
+    El archivo se escribe primero con otro nombre, se sincroniza con el
+    disco y se reemplaza al final, así una falla a mitad de camino no deja
+    una instantánea corrupta.
+
+    Args:
+        ruta: Archivo de destino
+        nombre: Nombre de la tienda
+        referencias: Tuplas (ID, mueble, existencias) en orden de inventario
+        siguiente_id: Próximo ID de inventario
+        comedores: Comedores de la tienda
+        descuentos: Motor de descuentos
+        ventas: Historial de ventas (RegistroVentas)
+        resumen: Totales serializables en JSON que se leen sin decodificar nada
+        secuencia_diario: Última venta del diario incluida en la instantánea
+    """
+    ids = array('q')
+    ids_por_objeto: Dict[int, int] = {}  # id(mueble) -> ID, para los comedores
+    existencias = array('q')
+    codigos_grupo = array('H')
+    grupos: Dict[type, List[Any]] = {}
+    indices_grupo: Dict[type, int] = {}
+    for id_mueble, mueble, cantidad in referencias:
+        clase = type(mueble)
+        if clase not in indices_grupo:
+            indices_grupo[clase] = len(indices_grupo)
+            grupos[clase] = []
+        try:
+            mueble.calcular_precio()  # el precio memorizado viaja en la instantánea
+        except Exception:
+            pass
+        ids.append(id_mueble)
+        ids_por_objeto[id(mueble)] = id_mueble
+        existencias.append(cantidad)
+        codigos_grupo.append(indices_grupo[clase])
+        grupos[clase].append(mueble)
+
+    temporal = ruta + ".tmp"
+    with open(temporal, "wb") as archivo:
+        archivo.write(b"\0" * _ENCABEZADO.size)
+        escritor = _Escritor(archivo)
+        escritor.seccion("ids", ids)
+        escritor.seccion("existencias", existencias)
+        escritor.seccion("grupos", codigos_grupo)
+        descripcion_grupos = []
+        for numero, (clase, muebles) in enumerate(grupos.items()):
+            prefijo = f"g{numero}"
+            ruta_clase = _ruta_clase(clase)
+            columnas = _columnas_del_grupo(muebles) if ruta_clase else None
+            if columnas is None:
+                # Clases no importables o con atributos irregulares: se guardan con pickle
+                escritor.seccion(prefijo, pickle.dumps(muebles, pickle.HIGHEST_PROTOCOL))
+                descripcion_grupos.append({"clase": ruta_clase, "filas": len(muebles), "formato": "pickle"})
+                continue
+            campos = []
+            for nombre_campo, lugar, valores in columnas:
+                tipo = _tipo_columna(valores)
+                escritor.columna(f"{prefijo}.{nombre_campo}", tipo, valores)
+                campos.append([nombre_campo, lugar, tipo])
+            descripcion_grupos.append({"clase": ruta_clase, "filas": len(muebles),
+                                       "formato": "columnas", "campos": campos})
+        # Las sillas y mesas que también son referencias del inventario viajan como su ID
+        buffer = io.BytesIO()
+        _PicklerReferencias(buffer, ids_por_objeto).dump(list(comedores))
+        escritor.seccion("comedores", buffer.getbuffer())
+        escritor.seccion("descuentos", pickle.dumps(descuentos, pickle.HIGHEST_PROTOCOL))
+        escritor.seccion("ventas", pickle.dumps(ventas, pickle.HIGHEST_PROTOCOL))
+        directorio = json.dumps({
+            "version": _VERSION,
+            "orden_bytes": sys.byteorder,
+            "nombre": nombre,
+            "siguiente_id": siguiente_id,
+            "filas": len(ids),
+            "resumen": resumen or {},
+            "secuencia_diario": secuencia_diario,
+            "grupos": descripcion_grupos,
+            "secciones": escritor.secciones,
+        }).encode("utf-8")
+        posicion = archivo.tell()
+        archivo.write(directorio)
+        archivo.seek(0)
+        archivo.write(_ENCABEZADO.pack(_FIRMA, posicion, len(directorio)))
+        archivo.flush()
+        os.fsync(archivo.fileno())
+    os.replace(temporal, ruta)
+
+
+class InstantaneaBinaria:
+    """
+    Lector de una instantánea binaria.
+
+    Abrir la instantánea solo proyecta el archivo en memoria (mmap) y lee
+    el directorio; cada sección se decodifica en bloque recién cuando se
+    pide. Las columnas numéricas se copian del mapa a un array con una sola
+    operación y los textos se separan con un único split.
+    """
+
+    def __init__(self, ruta: str):
+        """
+        Abre una instantánea.
+
+        Args:
+            ruta: Archivo escrito por escribir_instantanea
+
+        Raises:
+            ValueError: Si el archivo no es una instantánea válida
+        """
+        self._archivo = open(ruta, "rb")
+        try:
+            self._mapa = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ)
+            if len(self._mapa) < _ENCABEZADO.size:
+                raise ValueError("El archivo no es una instantánea de tienda")
+            firma, posicion, largo = _ENCABEZADO.unpack_from(self._mapa)
+            if firma != _FIRMA:
+                raise ValueError("El archivo no es una instantánea de tienda")
+            self._directorio = json.loads(self._mapa[posicion:posicion + largo].decode("utf-8"))
+        except Exception:
+            self.cerrar()
+            raise
+        if self._directorio.get("version") != _VERSION:
+            self.cerrar()
+            raise ValueError(f"Versión de instantánea no soportada: {self._directorio.get('version')}")
+        self._invertir = self._directorio["orden_bytes"] != sys.byteorder
+
+    @property
+    def nombre(self) -> str:
+        """Nombre de la tienda guardada."""
+        return self._directorio["nombre"]
+
+    @property
+    def siguiente_id(self) -> int:
+        """Próximo ID de inventario al momento de guardar."""
+        return self._directorio["siguiente_id"]
+
+    @property
+    def resumen(self) -> Dict[str, Any]:
+        """Totales guardados junto con la instantánea (se leen del directorio)."""
+        return self._directorio["resumen"]
+
+    @property
+    def secuencia_diario(self) -> int:
+        """Última venta del diario incluida en la instantánea (0 si no había diario)."""
+        return self._directorio.get("secuencia_diario", 0)
+
+    def __len__(self) -> int:
+        """Retorna la cantidad de referencias del inventario."""
+        return self._directorio["filas"]
+
+    def _bytes(self, seccion: str) -> bytes:
+        posicion, largo = self._directorio["secciones"][seccion]
+        return self._mapa[posicion:posicion + largo]
+
+    def _arreglo(self, seccion: str, tipo: str) -> array:
+        posicion, largo = self._directorio["secciones"][seccion]
+        columna = array(tipo)
+        with memoryview(self._mapa) as vista:
+            columna.frombytes(vista[posicion:posicion + largo])
+        if self._invertir:
+            columna.byteswap()
+        return columna
+
+    def _textos(self, seccion: str) -> List[str]:
+        return self._bytes(seccion).decode("utf-8").split(_SEPARADOR)
+
+    def ids(self) -> array:
+        """Columna de IDs de inventario."""
+        return self._arreglo("ids", 'q')
+
+    def existencias(self) -> array:
+        """Columna de existencias de cada referencia."""
+        return self._arreglo("existencias", 'q')
+
+    def _columna(self, seccion: str, tipo: str) -> Iterable[Any]:
+        if tipo == 'b':
+            return map(bool, self._arreglo(seccion, 'b'))
+        if tipo in 'qd':
+            return self._arreglo(seccion, tipo)
+        if tipo == 's':
+            return self._textos(seccion)
+        if tipo == 'c':
+            categorias = [None] + list(map(categorico, self._textos(seccion + ".categorias")))
+            return map(categorias.__getitem__, self._arreglo(seccion, 'i'))
+        return pickle.loads(self._bytes(seccion))
+
+    def _grupo(self, numero: int, grupo: Dict, observadores: tuple) -> List[Any]:
+        """Reconstruye los muebles de una clase asignando cada columna en bloque."""
+        prefijo = f"g{numero}"
+        if grupo["formato"] == "pickle":
+            muebles = pickle.loads(self._bytes(prefijo))
+            for mueble in muebles:
+                mueble._observadores = observadores
+            return muebles
+        clase = _importar_clase(grupo["clase"])
+        # Sin pasar por __init__: cada atributo se asigna con map sobre la columna entera
+        muebles = list(map(object.__new__, repeat(clase, grupo["filas"])))
+        for nombre, lugar, tipo in grupo["campos"]:
+            valores = self._columna(f"{prefijo}.{nombre}", tipo)
+            if lugar == "slot":
+                deque(map(_descriptor_slot(clase, nombre).__set__, muebles, valores), maxlen=0)
+            else:
+                deque(map(setattr, muebles, repeat(nombre), valores), maxlen=0)
+        deque(map(_descriptor_slot(clase, "_observadores").__set__, muebles, repeat(observadores)), maxlen=0)
+        return muebles
+
+    def muebles(self, observadores: tuple = ()) -> List[Any]:
+        """
+        Reconstruye los muebles del inventario.
+
+        Args:
+            observadores: Observadores con que nace cada mueble
+
+        Returns:
+            List: Muebles en orden de inventario (paralelo a ids() y existencias())
+        """
+        # Crear millones de objetos dispara el recolector de ciclos una y otra
+        # vez sin que haya nada que liberar: se pausa durante la decodificación
+        recolector_activo = gc.isenabled()
+        gc.disable()
+        try:
+            grupos = [iter(self._grupo(numero, grupo, observadores))
+                      for numero, grupo in enumerate(self._directorio["grupos"])]
+            # Se toma, fila por fila, el siguiente mueble del grupo que corresponde
+            return list(map(next, map(grupos.__getitem__, self._arreglo("grupos", 'H'))))
+        finally:
+            if recolector_activo:
+                gc.enable()
+
+    def comedores(self, resolver: Callable[[int], Any]) -> List[Any]:
+        """
+        Reconstruye los comedores guardados.
+
+        Args:
+            resolver: Devuelve el mueble restaurado con un ID de inventario
+                (por ejemplo Inventario.obtener); los componentes que eran
+                referencias del inventario vuelven a ser esos mismos objetos
+
+        Returns:
+            List: Comedores en el orden en que se guardaron
+        """
+        return _UnpicklerReferencias(io.BytesIO(self._bytes("comedores")), resolver).load()
+
+    def descuentos(self) -> Any:
+        """Motor de descuentos guardado."""
+        return pickle.loads(self._bytes("descuentos"))
+
+    def ventas(self) -> Any:
+        """Historial de ventas guardado (RegistroVentas)."""
+        return pickle.loads(self._bytes("ventas"))
+
+    def cerrar(self) -> None:
+        """Libera el mapa y el archivo."""
+        mapa = getattr(self, "_mapa", None)
+        if mapa is not None:
+            mapa.close()
+            self._mapa = None
+        self._archivo.close()
+
+    def __enter__(self) -> 'InstantaneaBinaria':
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
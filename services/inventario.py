@@ -0,0 +1,239 @@
+"""
+Contenedor del inventario de muebles indexado por ID.
+Reemplaza a la lista simple para que pertenencia y remoción sean O(1).
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from models.mueble import Mueble
+
+
+class Inventario:
+    """
+    Colección de referencias (SKU) donde cada una recibe un ID entero estable.
+
+    Cada referencia guarda un mueble representativo y la cantidad de
+    unidades en existencia. Los muebles idénticos (misma clave de
+    configuración) pueden agruparse en una sola referencia: buscar() la
+    encuentra y sumar() aumenta su existencia, de modo que 500 sillas
+    iguales ocupan un solo objeto.
+
+    Internamente usa un diccionario ID -> mueble, que conserva el orden de
+    inserción, un diccionario auxiliar por identidad de objeto y otro por
+    clave de configuración, para responder `mueble in inventario` sin
+    recorrer la colección.
+
+    Conceptos OOP aplicados:
+    - Encapsulación: Oculta las estructuras internas detrás de una interfaz de colección
+    - Polimorfismo: Implementa los métodos especiales de contenedor de Python
+    """
+
+    def __init__(self):
+        """Constructor del inventario vacío."""
+        self._muebles: Dict[int, Mueble] = {}
+        self._existencias: Dict[int, int] = {}
+        self._ids: Dict[int, int] = {}  # id(mueble) -> ID de inventario
+        # clave de configuración -> IDs con esa configuración (en orden de alta).
+        # None mientras no se haya construido (inventarios restaurados en bloque).
+        self._por_configuracion: Optional[Dict[tuple, Dict[int, None]]] = {}
+        self._configuraciones: Optional[Dict[int, tuple]] = {}  # ID -> clave registrada
+        self._total_existencias = 0
+        self._siguiente_id = 1
+
+    @classmethod
+    def desde_columnas(cls, ids: Iterable[int], muebles: List[Mueble], existencias: Iterable[int],
+                       siguiente_id: int) -> 'Inventario':
+        """
+        Construye un inventario completo a partir de columnas paralelas.
+
+        Los diccionarios se arman en bloque y el índice por configuración se
+        posterga hasta la primera búsqueda que lo necesite, de modo que
+        restaurar un inventario grande no calcula ninguna clave.
+
+        Args:
+            ids: ID de cada referencia, en orden de inventario
+            muebles: Mueble representativo de cada referencia
+            existencias: Unidades de cada referencia
+            siguiente_id: Próximo ID a asignar
+
+        Returns:
+            Inventario: Inventario con las referencias dadas
+        """
+        inventario = cls()
+        ids = list(ids)
+        inventario._muebles = dict(zip(ids, muebles))
+        inventario._existencias = dict(zip(ids, existencias))
+        inventario._ids = dict(zip(map(id, muebles), ids))
+        inventario._por_configuracion = None
+        inventario._configuraciones = None
+        inventario._total_existencias = sum(inventario._existencias.values())
+        inventario._siguiente_id = siguiente_id
+        return inventario
+
+    def posponer_configuracion(self) -> None:
+        """
+        Descarta el índice por configuración; se reconstruye en la próxima
+        búsqueda que lo necesite. Antes de una carga masiva que no agrupa
+        evita calcular la clave de cada mueble en el alta.
+        """
+        self._por_configuracion = None
+        self._configuraciones = None
+
+    @property
+    def siguiente_id(self) -> int:
+        """Próximo ID que recibirá una referencia nueva."""
+        return self._siguiente_id
+
+    def agregar(self, mueble: Mueble, cantidad: int = 1) -> int:
+        """
+        Agrega un mueble como una referencia nueva y le asigna un ID.
+
+        Args:
+            mueble: Mueble a agregar
+            cantidad: Unidades en existencia de la nueva referencia
+
+        Returns:
+            int: ID asignado (el existente si el mueble ya estaba)
+        """
+        id_existente = self._ids.get(id(mueble))
+        if id_existente is not None:
+            return id_existente
+        id_mueble = self._siguiente_id
+        self._siguiente_id += 1
+        self._muebles[id_mueble] = mueble
+        self._existencias[id_mueble] = cantidad
+        self._ids[id(mueble)] = id_mueble
+        if self._por_configuracion is not None:
+            self._registrar_configuracion(id_mueble, mueble.clave_configuracion())
+        self._total_existencias += cantidad
+        return id_mueble
+
+    def sumar(self, id_mueble: int, cantidad: int = 1) -> int:
+        """
+        Suma unidades a una referencia existente.
+
+        Args:
+            id_mueble: ID de la referencia
+            cantidad: Unidades a sumar
+
+        Returns:
+            int: Unidades en existencia después de sumar
+        """
+        self._existencias[id_mueble] += cantidad
+        self._total_existencias += cantidad
+        return self._existencias[id_mueble]
+
+    def descontar(self, id_mueble: int, cantidad: int = 1) -> int:
+        """
+        Resta unidades de una referencia. No la quita aunque llegue a cero.
+
+        Args:
+            id_mueble: ID de la referencia
+            cantidad: Unidades a restar (no más que las existentes)
+
+        Returns:
+            int: Unidades que quedan
+        """
+        restantes = self._existencias[id_mueble] - cantidad
+        if restantes < 0:
+            raise ValueError("No hay existencias suficientes")
+        self._existencias[id_mueble] = restantes
+        self._total_existencias -= cantidad
+        return restantes
+
+    def quitar(self, mueble: Mueble) -> Optional[int]:
+        """
+        Quita la referencia de un mueble del inventario, con todas sus unidades.
+
+        Args:
+            mueble: Mueble representativo de la referencia
+
+        Returns:
+            Optional[int]: ID que tenía el mueble, o None si no estaba
+        """
+        id_mueble = self._ids.pop(id(mueble), None)
+        if id_mueble is not None:
+            del self._muebles[id_mueble]
+            self._total_existencias -= self._existencias.pop(id_mueble)
+            if self._por_configuracion is not None:
+                self._olvidar_configuracion(id_mueble)
+        return id_mueble
+
+    def reindexar(self, mueble: Mueble) -> None:
+        """Actualiza la clave de configuración de un mueble que fue modificado."""
+        id_mueble = self._ids.get(id(mueble))
+        if id_mueble is None or self._por_configuracion is None:
+            return  # sin índice construido no hay nada que mover
+        clave = mueble.clave_configuracion()
+        if clave != self._configuraciones[id_mueble]:
+            self._olvidar_configuracion(id_mueble)
+            self._registrar_configuracion(id_mueble, clave)
+
+    def _indice_configuracion(self) -> Dict[tuple, Dict[int, None]]:
+        """Obtiene el índice por configuración, construyéndolo si estaba postergado."""
+        if self._por_configuracion is None:
+            self._por_configuracion = {}
+            self._configuraciones = {}
+            for id_mueble, mueble in self._muebles.items():
+                self._registrar_configuracion(id_mueble, mueble.clave_configuracion())
+        return self._por_configuracion
+
+    def _registrar_configuracion(self, id_mueble: int, clave: tuple) -> None:
+        self._configuraciones[id_mueble] = clave
+        self._por_configuracion.setdefault(clave, {})[id_mueble] = None
+
+    def _olvidar_configuracion(self, id_mueble: int) -> None:
+        clave = self._configuraciones.pop(id_mueble)
+        ids = self._por_configuracion[clave]
+        del ids[id_mueble]
+        if not ids:
+            del self._por_configuracion[clave]
+
+    def obtener(self, id_mueble: int) -> Optional[Mueble]:
+        """Obtiene el mueble con el ID dado, o None si no existe."""
+        return self._muebles.get(id_mueble)
+
+    def id_de(self, mueble: Mueble) -> Optional[int]:
+        """Obtiene el ID de un mueble (por identidad), o None si no está en el inventario."""
+        return self._ids.get(id(mueble))
+
+    def buscar(self, mueble: Mueble) -> Optional[int]:
+        """
+        Obtiene el ID de la referencia de un mueble: la del propio objeto o,
+        si no está, la primera con la misma configuración.
+        """
+        id_mueble = self._ids.get(id(mueble))
+        if id_mueble is None and isinstance(mueble, Mueble):
+            ids = self._indice_configuracion().get(mueble.clave_configuracion())
+            if ids:
+                id_mueble = next(iter(ids))
+        return id_mueble
+
+    def existencias(self, id_mueble: int) -> int:
+        """Obtiene las unidades en existencia de una referencia (0 si no existe)."""
+        return self._existencias.get(id_mueble, 0)
+
+    @property
+    def total_existencias(self) -> int:
+        """Total de unidades entre todas las referencias."""
+        return self._total_existencias
+
+    def items(self) -> Iterator[Tuple[int, Mueble]]:
+        """Itera pares (ID, mueble) en orden de inserción."""
+        return iter(self._muebles.items())
+
+    def referencias(self) -> Iterator[Tuple[int, Mueble, int]]:
+        """Itera tuplas (ID, mueble, existencias) en orden de inserción."""
+        existencias = self._existencias
+        return ((id_mueble, mueble, existencias[id_mueble]) for id_mueble, mueble in self._muebles.items())
+
+    def __contains__(self, mueble: object) -> bool:
+        """Indica si el mueble (o uno con la misma configuración) está en el inventario."""
+        return self.buscar(mueble) is not None
+
+    def __iter__(self) -> Iterator[Mueble]:
+        """Itera los muebles representativos en orden de inserción."""
+        return iter(self._muebles.values())
+
+    def __len__(self) -> int:
+        """Retorna la cantidad de referencias en el inventario."""
+        return len(self._muebles)
@@ -0,0 +1,107 @@
+"""
+Motor de precios por lote.
+Cotiza muchos muebles a la vez con la misma fórmula que usa calcular_precio:
+cada clase concreta define su fórmula una sola vez (el método estático
+_precio) junto con el attrgetter de los campos que la alimentan
+(_valores_precio). El motor lee esos campos de todo el grupo de una clase
+y aplica la fórmula fila por fila sin pasar por las propiedades ni por la
+memoria de precios de cada objeto.
+"""
+
+from itertools import compress, repeat, starmap
+from operator import attrgetter, is_
+from typing import Iterable, List, Optional
+
+from models.mueble import Mueble
+from models.categorias.asientos import Asiento
+
+_CAMPOS_COMODIDAD = attrgetter('_tiene_respaldo', '_material_tapizado', '_capacidad_personas')
+
+
+def _clase_con_formula(clase: type) -> Optional[type]:
+    """
+    Clase de la MRO que define el calcular_precio de `clase`, si esa misma
+    clase define la fórmula _precio. Una subclase que redefine
+    calcular_precio sin redefinir _precio no puede usar la fórmula heredada.
+    """
+    for base in clase.__mro__:
+        if "calcular_precio" in vars(base):
+            return base if "_precio" in vars(base) else None
+    return None
+
+
+def calcular_precios(muebles: Iterable[Mueble]) -> List[float]:
+    """
+    Calcula el precio de muchos muebles a la vez.
+
+    Agrupa los muebles por clase y aplica a cada grupo la fórmula _precio
+    de su clase. El resultado es idéntico al de llamar a calcular_precio en
+    cada mueble, pero no usa ni modifica la memoria de precios de los objetos.
+
+    Args:
+        muebles: Muebles a cotizar
+
+    Returns:
+        List[float]: Precio de cada mueble, en el mismo orden de entrada
+    """
+    muebles = list(muebles)
+    tipos = list(map(type, muebles))
+    clases = set(tipos)
+    if len(clases) == 1:
+        # Caso habitual al recotizar una sola clase: no hace falta agrupar
+        return _precios_grupo(tipos[0], muebles)
+
+    # Se cotiza cada clase por separado y luego se intercalan los resultados
+    # tomando, fila por fila, el siguiente precio de la clase que corresponde.
+    resultados = {}
+    for clase in clases:
+        grupo = list(compress(muebles, map(is_, tipos, repeat(clase))))
+        resultados[clase] = iter(_precios_grupo(clase, grupo))
+    return list(map(next, map(resultados.__getitem__, tipos)))
+
+
+def _precios_grupo(clase: type, grupo: List[Mueble]) -> List[float]:
+    """Precios de muebles de una misma clase (con el método escalar si no tiene fórmula)."""
+    formula = _clase_con_formula(clase)
+    if formula is None:
+        return [mueble.calcular_precio() for mueble in grupo]
+    return list(starmap(formula._precio, map(formula._valores_precio, grupo)))
+
+
+def calcular_factores_comodidad(asientos: Iterable[Asiento]) -> List[float]:
+    """
+    Equivalente por lote de Asiento.calcular_factor_comodidad.
+
+    Args:
+        asientos: Muebles de la jerarquía Asiento
+
+    Returns:
+        List[float]: Factor de comodidad de cada asiento, en el mismo orden
+    """
+    return list(starmap(Asiento._factor_comodidad, map(_CAMPOS_COMODIDAD, asientos)))
+
+
+def cotizar(muebles: Iterable[Mueble]) -> List[float]:
+    """
+    Precio de cada mueble, recalculando por lote los que lo necesitan.
+
+    Los muebles con el precio memorizado lo devuelven tal cual; los demás
+    (nuevos, o con la memoria invalidada por un setter, por ejemplo tras
+    cambiar precio_base) se cotizan juntos con calcular_precios y su precio
+    queda memorizado, como si se hubiera llamado a calcular_precio.
+
+    Args:
+        muebles: Muebles a cotizar
+
+    Returns:
+        List[float]: Precio de cada mueble, en el mismo orden de entrada
+    """
+    muebles = list(muebles)
+    precios = list(map(attrgetter('_precio_cache'), muebles))
+    faltantes = [posicion for posicion, precio in enumerate(precios) if precio is None]
+    if faltantes:
+        pendientes = [muebles[posicion] for posicion in faltantes]
+        for posicion, mueble, precio in zip(faltantes, pendientes, calcular_precios(pendientes)):
+            mueble._precio_cache = precio
+            precios[posicion] = precio
+    return precios
@@ -0,0 +1,122 @@
+"""
+Renderizado de descripciones en paralelo.
+Reparte el trabajo de obtener_descripcion() / obtener_descripcion_completa()
+entre varios procesos y devuelve los textos en el orden original.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
+
+from models.composicion.comedor import Comedor
+
+# Por debajo de esta cantidad de objetos serializarlos y enviarlos a otros
+# procesos cuesta más de lo que se gana repartiendo las descripciones
+MINIMO_PARALELO = 20_000
+
+
+def describir(objeto) -> str:
+    """
+    Obtiene la descripción de un mueble o de un comedor.
+
+    Args:
+        objeto: Mueble (usa obtener_descripcion) o Comedor (usa obtener_descripcion_completa)
+
+    Returns:
+        str: Descripción del objeto
+    """
+    if isinstance(objeto, Comedor):
+        return objeto.obtener_descripcion_completa()
+    return objeto.obtener_descripcion()
+
+
+def _describir_trozo(trozo: List) -> List[str]:
+    """Describe un trozo de objetos dentro de un proceso trabajador."""
+    return [describir(objeto) for objeto in trozo]
+
+
+def _trozos(objetos: Iterator, tamaño: int) -> Iterator[List]:
+    """Parte un iterador en listas de hasta `tamaño` elementos."""
+    while True:
+        trozo = list(islice(objetos, tamaño))
+        if not trozo:
+            return
+        yield trozo
+
+
+def procesos_efectivos(procesos: Optional[int], cantidad: int) -> int:
+    """
+    Procesos que conviene usar para describir `cantidad` objetos.
+
+    Nunca más que los núcleos disponibles (en una sola CPU los procesos
+    solo suman el costo de serializar), y uno solo, es decir en serie, por
+    debajo de MINIMO_PARALELO objetos.
+
+    Args:
+        procesos: Procesos pedidos (None: uno por núcleo)
+        cantidad: Objetos a describir
+
+    Returns:
+        int: Procesos a usar (1 significa en serie)
+    """
+    nucleos = os.cpu_count() or 1
+    if cantidad < MINIMO_PARALELO:
+        return 1
+    return max(1, min(procesos or nucleos, nucleos))
+
+
+def grupo_de_procesos(procesos: int):
+    """
+    Grupo de procesos para compartir entre varias llamadas a
+    describir_en_paralelo, o un contexto vacío (None) si procesos es 1.
+    """
+    if procesos == 1:
+        return nullcontext()
+    return ProcessPoolExecutor(max_workers=procesos)
+
+
+def describir_en_paralelo(objetos: Iterable, procesos: int = None, tamaño_trozo: int = 256,
+                          ejecutor: Optional[ProcessPoolExecutor] = None) -> Iterator[str]:
+    """
+    Describe muchos muebles y comedores usando un grupo de procesos.
+
+    Los objetos se envían por trozos (se serializan con pickle, sin sus
+    observadores) y las descripciones se devuelven en el mismo orden de
+    entrada, idénticas a las del recorrido en serie. Solo hay
+    2 * procesos trozos en vuelo a la vez, así que la memoria no crece con
+    el tamaño de la entrada.
+
+    Args:
+        objetos: Muebles y comedores a describir (cualquier iterable)
+        procesos: Cantidad de procesos trabajadores (por defecto, uno por núcleo)
+        tamaño_trozo: Objetos por envío a un trabajador
+        ejecutor: Grupo de procesos ya abierto (ver grupo_de_procesos); si
+            no se da, se abre uno solo para esta llamada
+
+    Yields:
+        str: Descripción de cada objeto, en orden
+    """
+    procesos = procesos or os.cpu_count() or 1
+    if procesos == 1:
+        yield from map(describir, objetos)
+        return
+    if ejecutor is not None:
+        yield from _repartir(ejecutor, objetos, procesos, tamaño_trozo)
+        return
+    with ProcessPoolExecutor(max_workers=procesos) as propio:
+        yield from _repartir(propio, objetos, procesos, tamaño_trozo)
+
+
+def _repartir(ejecutor: ProcessPoolExecutor, objetos: Iterable, procesos: int,
+              tamaño_trozo: int) -> Iterator[str]:
+    """Envía los trozos al grupo y devuelve las descripciones en orden."""
+    pendientes = deque()
+    for trozo in _trozos(iter(objetos), tamaño_trozo):
+        pendientes.append(ejecutor.submit(_describir_trozo, trozo))
+        if len(pendientes) >= 2 * procesos:
+            yield from pendientes.popleft().result()
+    while pendientes:
+        yield from pendientes.popleft().result()
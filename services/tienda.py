@@ -3,8 +3,13 @@ Servicio de la tienda que maneja la lógica de negocio.
 Esta clase implementa el patrón de servicio para separar la lógica de negocio de la UI.
 """
 
-from typing import List, Dict, Optional, Union
+import datetime
+import pickle
+from itertools import repeat, tee
+from operator import itemgetter, methodcaller, mul
+from typing import Iterable, Iterator, List, Dict, Optional, TextIO, Union
 from models.mueble import Mueble
+from models.observable import MetodoDebil
 from models.composicion.comedor import Comedor
 from models.concretos.silla import Silla
 from models.concretos.sillon import Sillon
@@ -18,6 +23,42 @@ from models.concretos.cajonera import Cajonera
 from models.categorias.almacenamiento import Almacenamiento
 from models.categorias.asientos import Asiento
 from models.categorias.superficies import Superficie
+from services.descuentos import MotorDescuentos
+from services.diario import DiarioVentas
+from services.almacen import Almacen, AlmacenMemoria
+from services.indices import IndiceMultiple, IndiceNgramas, IndiceOrdenado
+from services.instantanea import InstantaneaColumnar
+from services.instantanea_binaria import InstantaneaBinaria, escribir_instantanea
+from services.renderizado import describir, describir_en_paralelo, grupo_de_procesos, procesos_efectivos
+from services.ventas import (GRANULARIDADES, RegistroVentas, VentaRegistrada,
+                             formatear_fecha, segundos_desde_epoca)
+from services.inventario import Inventario
+from services.precios import cotizar
+
+
+def _diferido(nombre: str, asegurar) -> property:
+    """
+    Propiedad de un atributo de TiendaMuebles que una tienda cargada desde
+    una instantánea construye recién al primer uso.
+
+    Args:
+        nombre: Nombre del atributo; el valor se guarda en la instancia
+        asegurar: Método que construye el atributo si todavía no existe
+
+    Returns:
+        property: Propiedad de lectura y escritura del atributo
+    """
+    def leer(tienda):
+        try:
+            return tienda.__dict__[nombre]
+        except KeyError:
+            asegurar(tienda)
+            return tienda.__dict__[nombre]
+
+    def escribir(tienda, valor):
+        tienda.__dict__[nombre] = valor
+
+    return property(leer, escribir)
 
 
 class TiendaMuebles:
@@ -36,19 +77,71 @@ class TiendaMuebles:
     - Composición: Contiene colecciones de muebles
     """
     
-    def __init__(self, nombre_tienda: str = "Mueblería OOP"):
+    def __init__(self, nombre_tienda: str = "Mueblería OOP", almacen: Optional[Almacen] = None):
         """
         Constructor de la tienda.
         
         Args:
             nombre_tienda: Nombre de la tienda
+            almacen: Almacén de las búsquedas del inventario (por defecto,
+                índices en memoria; AlmacenSQLite las resuelve con sqlite3)
         """
         self._nombre = nombre_tienda
 
+        self._inventario = Inventario()
         self._comedores: List[Comedor] = []
-        self._ventas_realizadas: List[Dict] = []
-        self._descuentos_activos: Dict[str, float] = {}
-        pass
+        # Historial de ventas en columnas; cada venta se consulta como un diccionario de solo lectura
+        self._ventas_realizadas = RegistroVentas()
+        # Reglas de descuento por categoría resueltas sobre la jerarquía de clases
+        self._descuentos = MotorDescuentos()
+        # Búsquedas por nombre, material, color, tipo y precio sin recorrer todo el inventario
+        self._almacen = almacen if almacen is not None else AlmacenMemoria()
+        # Índices de los comedores: se consultan junto con los de muebles sin recorrer la lista
+        self._comedores_por_nombre = IndiceNgramas(lambda comedor: comedor.nombre)
+        self._comedores_por_precio = IndiceOrdenado(lambda comedor: comedor.calcular_precio_total())
+        self._comedores_por_capacidad = IndiceOrdenado(lambda comedor: comedor.cantidad_sillas)
+        self._comedores_por_material = IndiceMultiple(lambda comedor: comedor._obtener_materiales_unicos())
+        # Acumulados que se actualizan en O(1) con cada alta, venta o cambio de precio.
+        # Los valores se guardan en centavos para que la suma no acumule error.
+        self._valor_centavos = 0
+        self._total_unidades = 0
+        self._conteo_tipos: Dict[str, int] = {}
+        self._acumulados: Dict[int, tuple] = {}  # id(objeto) -> (centavos, unidades)
+        # Observador de los muebles del inventario: uno solo, compartido por todos,
+        # que no mantiene viva a la tienda
+        self._observador_muebles = MetodoDebil(self._al_modificar_mueble)
+        # Diario de ventas en disco (opcional) y secuencia de la última venta aplicada
+        self._diario: Optional[DiarioVentas] = None
+        self._secuencia_diario = 0
+
+    # Una tienda cargada con cargar_instantanea deja sin construir el estado
+    # que sale de la instantánea hasta que se lo usa. Cada grupo tiene su
+    # método _asegurar_*, y las propiedades de más abajo lo llaman antes de
+    # devolver el valor, que se guarda en la instancia con el mismo nombre.
+
+    def _asegurar_inventario(self) -> None:
+        """Decodifica el inventario y los comedores si todavía no se usaron."""
+        if "_inventario" not in self.__dict__:
+            self._restaurar_inventario()
+
+    def _asegurar_ventas(self) -> None:
+        """Decodifica el historial de ventas si todavía no se usó."""
+        if "_ventas_realizadas" not in self.__dict__:
+            self._restaurar_ventas()
+
+    def _asegurar_almacen(self) -> None:
+        """Carga el almacén con los muebles restaurados si todavía no se usó."""
+        if "_almacen" not in self.__dict__:
+            self._restaurar_almacen()
+
+    _inventario = _diferido("_inventario", _asegurar_inventario)
+    _comedores = _diferido("_comedores", _asegurar_inventario)
+    _acumulados = _diferido("_acumulados", _asegurar_inventario)
+    _valor_centavos = _diferido("_valor_centavos", _asegurar_inventario)
+    _total_unidades = _diferido("_total_unidades", _asegurar_inventario)
+    _conteo_tipos = _diferido("_conteo_tipos", _asegurar_inventario)
+    _ventas_realizadas = _diferido("_ventas_realizadas", _asegurar_ventas)
+    _almacen = _diferido("_almacen", _asegurar_almacen)
     
     @property
     def nombre(self) -> str:
@@ -57,36 +150,296 @@ class TiendaMuebles:
 
     @property
     def total_muebles(self) -> int:
-        """Retorna el total de muebles en inventario (muebles + comedores)."""
-        total = 0
-        if hasattr(self, '_inventario'):
-            total += len(self._inventario)
-        total += sum(len(comedor.sillas) + 1 for comedor in self._comedores)  # mesa + sillas por comedor
-        return total
+        """Retorna el total de unidades en inventario (existencias + mesa y sillas de cada comedor)."""
+        return self._total_unidades
     
-    def agregar_mueble(self, mueble: 'Mueble') -> str:
+    def agregar_mueble(self, mueble: 'Mueble', cantidad: int = 1) -> str:
         """
-        Agrega un mueble al inventario de la tienda.
+        Agrega un mueble al inventario de la tienda como una referencia nueva.
         
         Args:
             mueble: Objeto mueble a agregar
+            cantidad: Unidades en existencia de la referencia
             
         Returns:
             str: Mensaje de confirmación
         """
-        # Implementación real
-        if not hasattr(self, '_inventario'):
-            self._inventario = []
+        if not isinstance(cantidad, int) or cantidad < 1:
+            return "Error: La cantidad debe ser un entero mayor a 0"
+        error = self._validar_mueble(mueble)
+        if error:
+            return f"Error: {error}"
+        self._inventario.agregar(mueble, cantidad)
+        self._registrar_en_indices(mueble)
+        return f"Mueble {mueble.nombre} agregado exitosamente al inventario"
+
+    def agregar_existencias(self, mueble: 'Mueble', cantidad: int = 1) -> str:
+        """
+        Suma unidades a la referencia (SKU) de un mueble.
+
+        Si ya hay en inventario un mueble con la misma configuración, solo
+        aumenta su existencia y el objeto recibido no se guarda; si no, el
+        mueble se agrega como una referencia nueva.
+
+        Args:
+            mueble: Mueble (o uno idéntico) cuyas unidades se agregan
+            cantidad: Unidades a sumar
+
+        Returns:
+            str: Mensaje de confirmación
+        """
+        if not isinstance(cantidad, int) or cantidad < 1:
+            return "Error: La cantidad debe ser un entero mayor a 0"
         if not isinstance(mueble, Mueble):
             return "Error: Solo se pueden agregar objetos de tipo Mueble"
+        id_sku = self._inventario.buscar(mueble)
+        if id_sku is None:
+            return self.agregar_mueble(mueble, cantidad)
+        existencias = self._cambiar_existencias(id_sku, cantidad)
+        return f"Se agregaron {cantidad} unidades de {mueble.nombre} (existencia: {existencias})"
+
+    def obtener_existencias(self, mueble: 'Mueble') -> int:
+        """
+        Obtiene las unidades en existencia de la referencia de un mueble.
+
+        Args:
+            mueble: Mueble (o uno idéntico) a consultar
+
+        Returns:
+            int: Unidades disponibles, 0 si no está en inventario
+        """
+        id_sku = self._inventario.buscar(mueble)
+        return self._inventario.existencias(id_sku) if id_sku is not None else 0
+
+    def _cambiar_existencias(self, id_sku: int, cantidad: int) -> int:
+        """
+        Suma (o resta, si cantidad es negativa) unidades a una referencia y
+        ajusta los acumulados. Al llegar a cero la referencia se retira.
+        Método privado auxiliar.
+
+        Returns:
+            int: Unidades que quedan
+        """
+        mueble = self._inventario.obtener(id_sku)
+        if cantidad >= 0:
+            existencias = self._inventario.sumar(id_sku, cantidad)
+        else:
+            existencias = self._inventario.descontar(id_sku, -cantidad)
+        if existencias == 0:
+            self._inventario.quitar(mueble)
+            self._retirar_de_indices(mueble)
+        else:
+            self._actualizar_acumulados(mueble)
+            self._sumar_tipo(mueble, cantidad)
+        return existencias
+
+    def agregar_muebles_lote(self, muebles: Iterable['Mueble'], agrupar: bool = False) -> Dict:
+        """
+        Agrega muchos muebles al inventario en una sola pasada.
+
+        Acepta cualquier iterable (incluso generadores). Cada mueble se valida
+        y se cotiza una vez; el índice de precios se reordena una sola vez al
+        final en lugar de insertar mueble por mueble.
+
+        Con agrupar=True cada mueble cuenta como una unidad de su configuración:
+        los idénticos a una referencia existente (o a uno anterior del lote)
+        solo suman existencia y no se guardan.
+
+        Args:
+            muebles: Iterable de muebles a agregar
+            agrupar: Si se agrupan los muebles idénticos en una referencia
+
+        Returns:
+            Dict: Resumen con la cantidad de referencias agregadas, las unidades
+                agrupadas en referencias ya existentes y la lista de
+                rechazados (posición en el iterable y motivo)
+        """
+        agregados = []
+        rechazados = []
+        sumados: Dict[int, int] = {}  # ID de referencia previa al lote -> unidades sumadas
+        agrupados = 0
+        nuevos = set()
+        inventario = self._inventario
+        if not agrupar and not len(inventario):
+            # Carga inicial: las claves de configuración se calculan recién si alguien las busca
+            inventario.posponer_configuracion()
+        for posicion, mueble in enumerate(muebles):
+            if agrupar and isinstance(mueble, Mueble):
+                id_sku = inventario.buscar(mueble)
+                if id_sku is not None:
+                    inventario.sumar(id_sku)
+                    agrupados += 1
+                    if id_sku not in nuevos:
+                        sumados[id_sku] = sumados.get(id_sku, 0) + 1
+                    continue
+            error = self._validar_mueble(mueble)
+            if error:
+                rechazados.append({"posicion": posicion, "motivo": error})
+                continue
+            nuevos.add(inventario.agregar(mueble))
+            agregados.append(mueble)
+        # Cada estructura derivada se actualiza con una sola pasada sobre el lote
+        self._almacen.agregar_lote(agregados)
+        acumulados = self._acumulados
+        conteo = {}
+        valor_centavos = 0
+        unidades_total = 0
+        observador = self._observador_muebles
+        for mueble in agregados:
+            unidades = inventario.existencias(inventario.id_de(mueble)) if agrupar else 1
+            centavos = round(mueble.calcular_precio() * 100) * unidades
+            acumulados[id(mueble)] = (centavos, unidades)
+            valor_centavos += centavos
+            unidades_total += unidades
+            tipo = type(mueble).__name__
+            conteo[tipo] = conteo.get(tipo, 0) + unidades
+            mueble._suscribir(observador)
+        self._valor_centavos += valor_centavos
+        self._total_unidades += unidades_total
+        for tipo, cantidad in conteo.items():
+            self._conteo_tipos[tipo] = self._conteo_tipos.get(tipo, 0) + cantidad
+        for id_sku, cantidad in sumados.items():
+            mueble = inventario.obtener(id_sku)
+            self._actualizar_acumulados(mueble)
+            self._sumar_tipo(mueble, cantidad)
+        return {"agregados": len(agregados), "agrupados": agrupados, "rechazados": rechazados}
+
+    def _validar_mueble(self, mueble: 'Mueble') -> Optional[str]:
+        """
+        Verifica que un mueble pueda agregarse al inventario.
+        Método privado auxiliar.
+
+        Returns:
+            Optional[str]: Motivo del rechazo, o None si el mueble es válido
+        """
+        if not isinstance(mueble, Mueble):
+            return "Solo se pueden agregar objetos de tipo Mueble"
+        if self._inventario.id_de(mueble) is not None:
+            return "El mueble ya está en el inventario"
         try:
             precio = mueble.calcular_precio()
-            if precio <= 0:
-                return "Error: El mueble debe tener un precio válido mayor a 0"
         except Exception as e:
-            return f"Error al calcular precio del mueble: {str(e)}"
-        self._inventario.append(mueble)
-        return f"Mueble {mueble.nombre} agregado exitosamente al inventario"
+            return f"No se pudo calcular el precio del mueble: {str(e)}"
+        if precio <= 0:
+            return "El mueble debe tener un precio válido mayor a 0"
+        return None
+
+    def _registrar_en_indices(self, mueble: 'Mueble') -> None:
+        """
+        Agrega un mueble a todos los índices y se suscribe a sus cambios.
+        Método privado auxiliar.
+        """
+        self._almacen.agregar(mueble)
+        self._actualizar_acumulados(mueble)
+        self._sumar_tipo(mueble, self._acumulados[id(mueble)][1])
+        mueble._suscribir(self._observador_muebles)
+
+    def _retirar_de_indices(self, mueble: 'Mueble') -> None:
+        """
+        Quita un mueble de todos los índices y cancela la suscripción.
+        Método privado auxiliar.
+        """
+        self._almacen.quitar(mueble)
+        self._sumar_tipo(mueble, -self._descontar_acumulados(mueble))
+        mueble._desuscribir(self._observador_muebles)
+
+    def _al_modificar_mueble(self, mueble: 'Mueble', atributo: str) -> None:
+        """
+        Mantiene los índices al día cuando cambia un atributo de un mueble.
+        Método privado auxiliar (observador de los muebles del inventario).
+
+        Args:
+            mueble: Mueble que fue modificado
+            atributo: Nombre del atributo que cambió
+        """
+        self._inventario.reindexar(mueble)
+        self._almacen.actualizar(mueble, atributo)
+        if atributo == "precio":
+            self._actualizar_acumulados(mueble)
+
+    def _al_modificar_comedor(self, comedor: 'Comedor', atributo: str) -> None:
+        """
+        Mantiene los acumulados al día cuando cambia un comedor o sus componentes.
+        Método privado auxiliar (observador de los comedores).
+        """
+        if atributo in ("precio", "sillas"):
+            self._actualizar_acumulados(comedor)
+            self._comedores_por_precio.actualizar(comedor)
+        if atributo == "sillas":
+            self._comedores_por_capacidad.actualizar(comedor)
+        # Un cambio de precio puede venir de un tapizado nuevo, que cuenta como material
+        if atributo in ("precio", "sillas", "materiales"):
+            self._comedores_por_material.actualizar(comedor)
+
+    def _sumar_tipo(self, objeto, cantidad: int) -> None:
+        """
+        Suma (o resta) unidades al conteo por tipo.
+        Método privado auxiliar.
+        """
+        tipo = type(objeto).__name__
+        total = self._conteo_tipos.get(tipo, 0) + cantidad
+        if total:
+            self._conteo_tipos[tipo] = total
+        else:
+            del self._conteo_tipos[tipo]
+
+    def _actualizar_acumulados(self, objeto) -> None:
+        """
+        Registra el valor y las unidades actuales de un mueble o comedor,
+        ajustando los totales por la diferencia con lo registrado antes.
+        Un mueble aporta su precio por cada unidad en existencia.
+        Método privado auxiliar.
+        """
+        if isinstance(objeto, Comedor):
+            unidades, copias, calcular = len(objeto), 1, objeto.calcular_precio_total
+        else:
+            unidades = self._inventario.existencias(self._inventario.id_de(objeto))
+            copias, calcular = unidades, objeto.calcular_precio
+        try:
+            centavos = round(calcular() * 100) * copias
+        except Exception:
+            centavos = 0  # Los muebles con errores de precio no suman valor
+        centavos_previos, unidades_previas = self._acumulados.get(id(objeto), (0, 0))
+        self._acumulados[id(objeto)] = (centavos, unidades)
+        self._valor_centavos += centavos - centavos_previos
+        self._total_unidades += unidades - unidades_previas
+
+    def _descontar_acumulados(self, objeto) -> int:
+        """
+        Quita de los totales el valor y las unidades registradas de un objeto.
+        Método privado auxiliar.
+
+        Returns:
+            int: Unidades que se descontaron
+        """
+        centavos, unidades = self._acumulados.pop(id(objeto), (0, 0))
+        self._valor_centavos -= centavos
+        self._total_unidades -= unidades
+        return unidades
+    
+    def obtener_id(self, mueble: 'Mueble') -> Optional[int]:
+        """
+        Obtiene el ID estable asignado a un mueble al agregarlo al inventario.
+
+        Args:
+            mueble: Mueble a consultar
+
+        Returns:
+            Optional[int]: ID del mueble, o None si no está en inventario
+        """
+        return self._inventario.id_de(mueble)
+
+    def obtener_mueble_por_id(self, id_mueble: int) -> Optional['Mueble']:
+        """
+        Obtiene un mueble del inventario a partir de su ID.
+
+        Args:
+            id_mueble: ID asignado al agregar el mueble
+
+        Returns:
+            Optional[Mueble]: Mueble correspondiente, o None si no existe
+        """
+        return self._inventario.obtener(id_mueble)
     
     def agregar_comedor(self, comedor: 'Comedor') -> str:
         """
@@ -101,119 +454,174 @@ class TiendaMuebles:
         if not isinstance(comedor, Comedor):
             return "Error: Solo se pueden agregar objetos de tipo Comedor"
         self._comedores.append(comedor)
+        self._sumar_tipo(comedor, 1)
+        self._actualizar_acumulados(comedor)
+        self._comedores_por_nombre.agregar(comedor)
+        self._comedores_por_precio.agregar(comedor)
+        self._comedores_por_capacidad.agregar(comedor)
+        self._comedores_por_material.agregar(comedor)
+        comedor._suscribir(self._al_modificar_comedor)
         return f"Comedor {comedor.nombre} agregado exitosamente"
     
-    def buscar_muebles_por_nombre(self, nombre: str) -> List['Mueble']:
+    def buscar_muebles_por_nombre(self, nombre: str,
+                                  incluir_comedores: bool = False) -> List[Union['Mueble', 'Comedor']]:
         """
         Busca muebles por nombre (búsqueda parcial, case-insensitive).
         
         Args:
             nombre: Nombre o parte del nombre a buscar
+            incluir_comedores: Si también se buscan comedores (van después de los muebles)
             
         Returns:
-            List[Mueble]: Lista de muebles que coinciden con la búsqueda
+            List[Union[Mueble, Comedor]]: Lista de muebles (y comedores) que coinciden con la búsqueda
         """
-        if not hasattr(self, '_inventario') or not nombre or not nombre.strip():
+        if not nombre or not nombre.strip():
             return []
-        nombre_lower = nombre.lower().strip()
-        resultados = []
-        for mueble in self._inventario:
-            if nombre_lower in mueble.nombre.lower():
-                resultados.append(mueble)
+        resultados = self._almacen.buscar_por_nombre(nombre)
+        if incluir_comedores:
+            resultados.extend(self._comedores_por_nombre.buscar(nombre))
         return resultados
     
-    def filtrar_por_precio(self, precio_min: float = 0, precio_max: float = float('inf')) -> List['Mueble']:
+    def filtrar_por_precio(self, precio_min: float = 0, precio_max: float = float('inf'),
+                           incluir_comedores: bool = False) -> List[Union['Mueble', 'Comedor']]:
         """
         Filtra muebles por rango de precios.
         
         Args:
             precio_min: Precio mínimo (inclusivo)
             precio_max: Precio máximo (inclusivo)
+            incluir_comedores: Si también se incluyen comedores (por su precio total)
             
         Returns:
-            List[Mueble]: Lista de muebles en el rango de precios
+            List[Union[Mueble, Comedor]]: Elementos en el rango de precios, en orden
+                de inventario (los comedores van después de los muebles)
         """
-        if not hasattr(self, '_inventario'):
-            return []
         if precio_min < 0:
             precio_min = 0
-        resultados = []
-        for mueble in self._inventario:
-            try:
-                precio = mueble.calcular_precio()
-                if precio_min <= precio <= precio_max:
-                    resultados.append(mueble)
-            except Exception:
-                continue  # Saltar muebles con errores de precio
+        resultados = self._almacen.rango_precio(precio_min, precio_max)
+        if incluir_comedores:
+            resultados.extend(self._comedores_por_precio.rango_en_orden(precio_min, precio_max))
         return resultados
+
+    def filtrar_comedores_por_capacidad(self, minimo: int = 0, maximo: float = float('inf')) -> List['Comedor']:
+        """
+        Filtra comedores por la cantidad de sillas que incluyen.
+
+        Args:
+            minimo: Cantidad mínima de sillas (inclusiva)
+            maximo: Cantidad máxima de sillas (inclusiva)
+
+        Returns:
+            List[Comedor]: Comedores en el rango, de menor a mayor capacidad
+        """
+        return self._comedores_por_capacidad.rango(minimo, maximo)
+
+    def obtener_mas_baratos(self, cantidad: int) -> List['Mueble']:
+        """
+        Obtiene los muebles más baratos del inventario.
+
+        Args:
+            cantidad: Número máximo de muebles a retornar
+
+        Returns:
+            List[Mueble]: Muebles ordenados de menor a mayor precio
+        """
+        return self._almacen.mas_baratos(cantidad)
+
+    def obtener_mas_caros(self, cantidad: int) -> List['Mueble']:
+        """
+        Obtiene los muebles más caros del inventario.
+
+        Args:
+            cantidad: Número máximo de muebles a retornar
+
+        Returns:
+            List[Mueble]: Muebles ordenados de mayor a menor precio
+        """
+        return self._almacen.mas_caros(cantidad)
     
-    def filtrar_por_material(self, material: str) -> List['Mueble']:
+    def filtrar_por_material(self, material: str,
+                             incluir_comedores: bool = False) -> List[Union['Mueble', 'Comedor']]:
         """
         Filtra muebles por material.
         
         Args:
             material: Material a buscar
+            incluir_comedores: Si también se incluyen los comedores que usan el
+                material en alguno de sus componentes (van después de los muebles)
             
         Returns:
-            List[Mueble]: Lista de muebles del material especificado
+            List[Union[Mueble, Comedor]]: Lista de muebles (y comedores) del material especificado
         """
-        if not hasattr(self, '_inventario') or not material or not material.strip():
+        if not material or not material.strip():
             return []
-        material_lower = material.lower().strip()
-        resultados = []
-        for mueble in self._inventario:
-            if mueble.material.lower() == material_lower:
-                resultados.append(mueble)
+        resultados = self._almacen.buscar_por_material(material)
+        if incluir_comedores:
+            resultados.extend(self._comedores_por_material.buscar(material))
         return resultados
-        
-        # return resultados
-        pass
-    
+
+    def filtrar_por_color(self, color: str) -> List['Mueble']:
+        """
+        Filtra muebles por color.
+
+        Args:
+            color: Color a buscar (case-insensitive)
+
+        Returns:
+            List[Mueble]: Lista de muebles del color especificado
+        """
+        if not color or not color.strip():
+            return []
+        return self._almacen.buscar_por_color(color)
+
     def obtener_muebles_por_tipo(self, tipo_clase: type) -> List['Mueble']:
         """
         Obtiene todos los muebles de un tipo específico.
+        Acepta clases concretas, categorías abstractas (ej: Asiento) y clases
+        base de herencia múltiple (ej: Cama incluye los SofaCama).
         
         Args:
             tipo_clase: Clase del tipo de mueble (ej: Silla, Mesa, etc.)
             
         Returns:
-            List[Mueble]: Lista de muebles del tipo especificado
+            List[Mueble]: Lista de muebles del tipo especificado, agrupados por clase concreta
         """
-        if not hasattr(self, '_inventario'):
-            return []
-        resultados = []
-        for mueble in self._inventario:
-            if isinstance(mueble, tipo_clase):
-                resultados.append(mueble)
-        return resultados
+        return self._almacen.buscar_por_tipo(tipo_clase)
+
+    def contar_muebles_por_tipo(self, tipo_clase: type) -> int:
+        """
+        Cuenta los muebles de un tipo específico sin recorrer el inventario.
+
+        Args:
+            tipo_clase: Clase del tipo de mueble (concreta o abstracta)
+
+        Returns:
+            int: Cantidad de muebles del tipo especificado
+        """
+        return self._almacen.contar_por_tipo(tipo_clase)
     
     def calcular_valor_inventario(self) -> float:
         """
         Calcula el valor total del inventario.
+        El valor se mantiene acumulado, por lo que la consulta es O(1).
         
         Returns:
             float: Valor total de todos los muebles en inventario
         """
-        valor_total = 0
-        if hasattr(self, '_inventario'):
-            for mueble in self._inventario:
-                try:
-                    valor_total += mueble.calcular_precio()
-                except Exception:
-                    continue  # Saltar muebles con errores
-        for comedor in self._comedores:
-            try:
-                valor_total += comedor.calcular_precio_total()
-            except Exception:
-                continue
-        return round(valor_total, 2)
+        return round(self._valor_centavos / 100, 2)
     
     def aplicar_descuento(self, categoria: str, porcentaje: float) -> str:
         """
         Aplica un descuento a una categoría de muebles.
         
+        La categoría puede ser cualquier clase de la jerarquía: una clase
+        concreta ("silla"), una categoría abstracta ("asiento",
+        "almacenamiento") o "mueble". Cada mueble recibe el descuento de la
+        clase más específica de su MRO que tenga una regla, de modo que un
+        SofaCama toma las promociones de "sofa" o de "cama".
+        
         Args:
-            categoria: Nombre de la categoría (ej: "sillas", "mesas")
+            categoria: Nombre de la categoría (ej: "silla", "asiento")
             porcentaje: Porcentaje de descuento (0-100)
             
         Returns:
@@ -221,44 +629,464 @@ class TiendaMuebles:
         """
         if not 0 <= porcentaje <= 100:
             return "Error: El porcentaje debe estar entre 0 y 100"
-        categoria_lower = categoria.lower().strip()
-        self._descuentos_activos[categoria_lower] = porcentaje / 100
+        self._descuentos.aplicar(categoria, porcentaje / 100)
         return f"Descuento del {porcentaje}% aplicado a la categoría '{categoria}'"
+
+    def programar_descuento(self, categoria: str, porcentaje: float,
+                            inicio: datetime.datetime, fin: datetime.datetime) -> str:
+        """
+        Programa un descuento que solo rige entre inicio (inclusive) y fin (exclusive).
+        
+        Las promociones programadas pueden superponerse: si en un momento
+        rigen varias de la misma categoría se aplica la mayor, y la categoría
+        más específica del MRO sigue teniendo prioridad.
+        
+        Args:
+            categoria: Nombre de la categoría (ej: "silla", "asiento")
+            porcentaje: Porcentaje de descuento (0-100)
+            inicio: Comienzo de la vigencia
+            fin: Fin de la vigencia
+            
+        Returns:
+            str: Mensaje de confirmación
+        """
+        if not 0 <= porcentaje <= 100:
+            return "Error: El porcentaje debe estar entre 0 y 100"
+        if not isinstance(inicio, datetime.datetime) or not isinstance(fin, datetime.datetime):
+            return "Error: Las fechas de vigencia deben ser datetime"
+        if fin <= inicio:
+            return "Error: La fecha de fin debe ser posterior a la de inicio"
+        self._descuentos.programar(categoria, porcentaje / 100, inicio, fin)
+        return (f"Descuento del {porcentaje}% programado para la categoría '{categoria}' "
+                f"del {inicio:%Y-%m-%d %H:%M} al {fin:%Y-%m-%d %H:%M}")
+
+    def obtener_precios_con_descuento(self, muebles: Iterable['Mueble'],
+                                      momento: datetime.datetime = None) -> List[float]:
+        """
+        Calcula el precio final (con el descuento vigente) de muchos muebles.
+        
+        Args:
+            muebles: Muebles a cotizar
+            momento: Instante cuyas reglas se aplican (por defecto, ahora)
+            
+        Returns:
+            List[float]: Precio con descuento de cada mueble, en el mismo orden
+        """
+        # Los precios invalidados (por ejemplo, tras cambiar precio_base) se recalculan por lote
+        muebles = list(muebles)
+        return self._descuentos.precios_con_descuento(muebles, cotizar(muebles), momento)
     
-    def realizar_venta(self, mueble: 'Mueble', cliente: str = "Cliente Anónimo") -> Dict:
+    def realizar_venta(self, mueble: 'Mueble', cliente: str = "Cliente Anónimo",
+                       cantidad: int = 1, por_configuracion: bool = False) -> Union[VentaRegistrada, Dict]:
         """
-        Procesa la venta de un mueble.
+        Procesa la venta de unidades de un mueble.
         
         Args:
-            mueble: Mueble a vender
+            mueble: Mueble del inventario a vender
             cliente: Nombre del cliente
+            cantidad: Unidades a vender
+            por_configuracion: Si el mueble no está en inventario (por
+                ejemplo, una copia idéntica), vender de la primera referencia
+                con su misma configuración en lugar de rechazar la venta
             
         Returns:
-            Dict: Información de la venta realizada
+            Union[VentaRegistrada, Dict]: Información de la venta realizada
+                (precios por unidad y total; se lee como un diccionario y sus
+                campos salen del historial al consultarlos), o un diccionario
+                con "error"
         """
-        import datetime
-        if not hasattr(self, '_inventario') or mueble not in self._inventario:
+        id_sku = self._resolver_referencia(mueble, por_configuracion)
+        if id_sku is None:
             return {"error": "El mueble no está disponible en inventario"}
+        if not isinstance(cantidad, int) or cantidad < 1:
+            return {"error": "La cantidad debe ser un entero mayor a 0"}
+        existencias = self._inventario.existencias(id_sku)
+        if cantidad > existencias:
+            return {"error": f"Existencias insuficientes: quedan {existencias} unidades"}
         try:
-            precio_original = mueble.calcular_precio()
-            descuento_aplicado = 0
-            tipo_mueble = type(mueble).__name__.lower()
-            if tipo_mueble in self._descuentos_activos:
-                descuento_aplicado = self._descuentos_activos[tipo_mueble]
-            precio_final = precio_original * (1 - descuento_aplicado)
-            venta = {
-                "mueble": mueble.nombre,
-                "cliente": cliente,
-                "precio_original": precio_original,
-                "descuento": descuento_aplicado * 100,
-                "precio_final": round(precio_final, 2),
-                "fecha": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-            self._ventas_realizadas.append(venta)
-            self._inventario.remove(mueble)
-            return venta
+            ahora = datetime.datetime.now()
+            vendido = self._inventario.obtener(id_sku)
+            fila = self._crear_venta(vendido, cliente, cantidad,
+                                     self._obtener_descuento(vendido, ahora),
+                                     segundos_desde_epoca(ahora))
+            if self._diario is not None:
+                # Escritura anticipada: la venta queda en el diario antes de aplicarse
+                self._secuencia_diario = self._diario.registrar(((id_sku, fila),))
+            posicion = self._ventas_realizadas.agregar(fila, type(vendido).__name__)
+            self._cambiar_existencias(id_sku, -cantidad)
+            return VentaRegistrada(self._ventas_realizadas, posicion)
         except Exception as e:
             return {"error": f"Error al procesar la venta: {str(e)}"}
+
+    def _resolver_referencia(self, mueble: 'Mueble', por_configuracion: bool) -> Optional[int]:
+        """
+        Obtiene el ID de la referencia que se vende: la del propio objeto y,
+        solo si se pidió explícitamente, la de un mueble con su configuración.
+        Método privado auxiliar.
+        """
+        if por_configuracion:
+            return self._inventario.buscar(mueble)
+        return self._inventario.id_de(mueble)
+
+    def _crear_venta(self, mueble: 'Mueble', cliente: str, cantidad: int, descuento: float,
+                     momento: int) -> tuple:
+        """
+        Arma la fila de una venta para el historial (ver RegistroVentas.agregar).
+        Método privado auxiliar.
+        """
+        precio_original = mueble.calcular_precio()
+        precio_final = round(precio_original * (1 - descuento), 2)
+        return (momento, cliente, mueble.nombre, cantidad, precio_original,
+                descuento * 100, precio_final, round(precio_final * cantidad, 2))
+
+    def realizar_ventas_lote(self, muebles: Iterable['Mueble'], cliente: str = "Cliente Anónimo",
+                             por_configuracion: bool = False) -> List[Union[VentaRegistrada, Dict]]:
+        """
+        Procesa la venta de varios muebles en una sola pasada.
+
+        Cada elemento vende una unidad de su referencia. Todas las ventas del
+        lote comparten la misma fecha y los registros se agregan juntos al
+        historial de ventas.
+
+        Args:
+            muebles: Muebles del inventario a vender
+            cliente: Nombre del cliente
+            por_configuracion: Como en realizar_venta, para cada mueble del lote
+
+        Returns:
+            List[Union[VentaRegistrada, Dict]]: Resultado de cada mueble, en el
+                mismo orden recibido (la venta realizada o un diccionario con "error")
+        """
+        ahora = datetime.datetime.now()
+        momento = segundos_desde_epoca(ahora)
+        resultados = []
+        filas = []
+        tipos = []
+        ids_vendidos = []
+        posiciones = []  # lugar en resultados de cada venta del lote
+        vendidos: Dict[int, int] = {}  # ID de referencia -> unidades vendidas en el lote
+        inventario = self._inventario
+        for mueble in muebles:
+            id_sku = self._resolver_referencia(mueble, por_configuracion)
+            if id_sku is None or vendidos.get(id_sku, 0) >= inventario.existencias(id_sku):
+                resultados.append({"error": "El mueble no está disponible en inventario"})
+                continue
+            vendido = inventario.obtener(id_sku)
+            try:
+                fila = self._crear_venta(vendido, cliente, 1, self._obtener_descuento(vendido, ahora), momento)
+            except Exception as e:
+                resultados.append({"error": f"Error al procesar la venta: {str(e)}"})
+                continue
+            vendidos[id_sku] = vendidos.get(id_sku, 0) + 1
+            filas.append(fila)
+            tipos.append(type(vendido).__name__)
+            ids_vendidos.append(id_sku)
+            posiciones.append(len(resultados))
+            resultados.append(None)
+        if filas and self._diario is not None:
+            # Todo el lote va al diario con una sola escritura, antes de aplicarse
+            try:
+                self._secuencia_diario = self._diario.registrar(zip(ids_vendidos, filas))
+            except OSError as e:
+                error = {"error": f"Error al procesar la venta: {str(e)}"}
+                return [error if resultado is None else resultado for resultado in resultados]
+        registro = self._ventas_realizadas
+        inicio = registro.extender(filas, tipos)
+        for desplazamiento, lugar in enumerate(posiciones):
+            resultados[lugar] = VentaRegistrada(registro, inicio + desplazamiento)
+        for id_sku, cantidad in vendidos.items():
+            self._cambiar_existencias(id_sku, -cantidad)
+        return resultados
+
+    def _obtener_descuento(self, mueble: 'Mueble', momento: datetime.datetime = None) -> float:
+        """
+        Obtiene la tasa de descuento (0 a 1) que corresponde a un mueble en un momento.
+        La línea de tiempo de cada clase está precalculada, por lo que la
+        consulta es una búsqueda binaria sobre sus cortes.
+        Método privado auxiliar.
+        """
+        return self._descuentos.tasa(type(mueble), momento)
+
+    def abrir_diario(self, ruta: str, tamaño_grupo: int = 32, espera_maxima: float = 0.05) -> Dict:
+        """
+        Abre un diario de ventas en disco y reproduce las ventas que contiene.
+        
+        Las ventas del diario posteriores al estado actual de la tienda (el
+        armado al arrancar o la última instantánea) se vuelven a aplicar al
+        historial y a las existencias. Desde ese momento cada venta se
+        escribe en el diario antes de aplicarse, y la sincronización con el
+        disco se hace por grupos de `tamaño_grupo` ventas o cada
+        `espera_maxima` segundos.
+        
+        Args:
+            ruta: Archivo del diario (se crea si no existe)
+            tamaño_grupo: Ventas por sincronización (1 = cada venta se confirma en disco)
+            espera_maxima: Segundos que una venta puede esperar su sincronización
+                (None = solo por tamaño de grupo)
+            
+        Returns:
+            Dict: Ventas recuperadas y bytes descartados de un registro
+                cortado, o un diccionario con "error"
+        """
+        try:
+            diario = DiarioVentas(ruta, tamaño_grupo, espera_maxima)
+        except (OSError, ValueError) as e:
+            return {"error": f"Error al abrir el diario: {str(e)}"}
+        self.cerrar_diario()
+        recuperadas = 0
+        for secuencia, id_sku, fila in diario.recuperar():
+            if secuencia <= self._secuencia_diario:
+                continue  # ya incluida en la instantánea cargada
+            self._aplicar_venta_recuperada(id_sku, fila)
+            self._secuencia_diario = secuencia
+            recuperadas += 1
+        diario.adelantar(self._secuencia_diario)
+        self._diario = diario
+        return {"ventas_recuperadas": recuperadas, "bytes_descartados": diario.bytes_descartados}
+
+    def _aplicar_venta_recuperada(self, id_sku: int, fila: tuple) -> None:
+        """
+        Vuelve a aplicar una venta leída del diario.
+        Si la referencia ya no tiene existencias (el estado de partida no es
+        el mismo que cuando se vendió) la venta igual queda en el historial.
+        Método privado auxiliar.
+        """
+        vendido = self._inventario.obtener(id_sku)
+        self._ventas_realizadas.agregar(fila, type(vendido).__name__ if vendido is not None else "")
+        cantidad = fila[3]
+        unidades = min(cantidad, self._inventario.existencias(id_sku))
+        if unidades:
+            self._cambiar_existencias(id_sku, -unidades)
+
+    def cerrar_diario(self) -> None:
+        """Sincroniza con el disco las ventas pendientes y cierra el diario de ventas."""
+        if self._diario is not None:
+            self._diario.cerrar()
+            self._diario = None
+    
+    def obtener_ventas_entre(self, desde: datetime.datetime,
+                             hasta: datetime.datetime) -> List[VentaRegistrada]:
+        """
+        Obtiene las ventas con fecha dentro de [desde, hasta).
+        El historial está ordenado por fecha, así que los límites se
+        encuentran con búsqueda binaria.
+        
+        Args:
+            desde: Inicio de la ventana (inclusivo)
+            hasta: Fin de la ventana (exclusivo)
+            
+        Returns:
+            List[VentaRegistrada]: Ventas de la ventana, en orden de fecha
+        """
+        registro = self._ventas_realizadas
+        posiciones = registro.posiciones(segundos_desde_epoca(desde), segundos_desde_epoca(hasta))
+        return [VentaRegistrada(registro, posicion) for posicion in posiciones]
+
+    def obtener_resumen_ventas(self, desde: datetime.datetime, hasta: datetime.datetime,
+                               granularidad: str = "hora", tipo: Optional[str] = None) -> Dict:
+        """
+        Obtiene las ventas de una ventana agrupadas por minuto, hora o día.
+        
+        Los resúmenes se actualizan con cada venta, así que la consulta
+        cuesta lo que la cantidad de cubetas de la ventana, sin importar
+        cuántas ventas haya.
+        
+        Args:
+            desde: Inicio de la ventana (inclusivo)
+            hasta: Fin de la ventana (exclusivo)
+            granularidad: "minuto", "hora" o "dia"
+            tipo: Nombre de una clase de mueble (ej: "Silla") para contar solo ese tipo
+            
+        Returns:
+            Dict: Granularidad y lista de cubetas con ventas (inicio, ventas,
+                unidades, ingresos, descuento y totales por tipo), o un
+                diccionario con "error"
+        """
+        if granularidad not in GRANULARIDADES:
+            return {"error": f"Granularidad inválida: use {', '.join(GRANULARIDADES)}"}
+        if not isinstance(desde, datetime.datetime) or not isinstance(hasta, datetime.datetime):
+            return {"error": "Las fechas deben ser datetime"}
+        cubetas = self._ventas_realizadas.resumen.cubetas(
+            granularidad, segundos_desde_epoca(desde), segundos_desde_epoca(hasta), tipo)
+        return {
+            "granularidad": granularidad,
+            "cubetas": [{"inicio": formatear_fecha(inicio), **totales} for inicio, totales in cubetas]
+        }
+
+    def obtener_totales_ventas(self, desde: datetime.datetime, hasta: datetime.datetime,
+                               tipo: Optional[str] = None) -> Dict:
+        """
+        Obtiene los totales exactos de las ventas de una ventana.
+        
+        Suma días, horas y minutos completos desde los resúmenes y solo lee
+        del historial las ventas de los segundos sueltos de cada borde.
+        
+        Args:
+            desde: Inicio de la ventana (inclusivo)
+            hasta: Fin de la ventana (exclusivo)
+            tipo: Nombre de una clase de mueble (ej: "Silla") para contar solo ese tipo
+            
+        Returns:
+            Dict: ventas, unidades, ingresos, descuento y los mismos totales
+                por tipo, o un diccionario con "error"
+        """
+        if not isinstance(desde, datetime.datetime) or not isinstance(hasta, datetime.datetime):
+            return {"error": "Las fechas deben ser datetime"}
+        return self._ventas_realizadas.totales(segundos_desde_epoca(desde), segundos_desde_epoca(hasta), tipo)
+    
+    def crear_instantanea_columnar(self) -> InstantaneaColumnar:
+        """
+        Crea una instantánea columnar del inventario para consultas analíticas.
+        La instantánea no se actualiza con cambios posteriores de la tienda.
+        
+        Returns:
+            InstantaneaColumnar: Columnas con los muebles en orden de inventario
+        """
+        valor_comedores = sum(self._acumulados[id(c)][0] for c in self._comedores) / 100
+        conteo_comedores = {}
+        for comedor in self._comedores:
+            tipo = type(comedor).__name__
+            conteo_comedores[tipo] = conteo_comedores.get(tipo, 0) + 1
+        return InstantaneaColumnar(self._inventario.referencias(), valor_comedores, conteo_comedores)
+
+    def guardar_instantanea(self, ruta: str) -> str:
+        """
+        Guarda la tienda completa (inventario, comedores, descuentos y
+        ventas) en una instantánea binaria. Si hay un diario de ventas
+        abierto se vacía, porque sus ventas pasan a estar en la instantánea.
+        
+        Args:
+            ruta: Archivo de destino (se reemplaza si existe)
+            
+        Returns:
+            str: Mensaje de confirmación
+        """
+        try:
+            resumen = self.obtener_estadisticas()
+            del resumen["descuentos_activos"]  # depende del momento en que se consulte
+            escribir_instantanea(ruta, self._nombre, self._inventario.referencias(),
+                                 self._inventario.siguiente_id, self._comedores,
+                                 self._descuentos, self._ventas_realizadas, resumen,
+                                 self._secuencia_diario)
+            if self._diario is not None:
+                # Las ventas del diario ya están en la instantánea
+                self._diario.vaciar()
+        except (OSError, pickle.PicklingError, AttributeError, TypeError) as e:
+            return f"Error al guardar la instantánea: {str(e)}"
+        return f"Instantánea guardada en {ruta}"
+
+    @classmethod
+    def cargar_instantanea(cls, ruta: str, almacen: Optional[Almacen] = None) -> 'TiendaMuebles':
+        """
+        Crea una tienda a partir de una instantánea binaria.
+        
+        Cargar solo abre el archivo con mmap y restaura los descuentos. El
+        inventario, los comedores y las ventas se decodifican en bloque la
+        primera vez que se usan, y el almacén recibe los muebles recién con
+        la primera búsqueda (AlmacenMemoria construye cada índice con la
+        primera consulta que lo necesita).
+        
+        Args:
+            ruta: Archivo escrito por guardar_instantanea
+            almacen: Almacén de búsquedas de la tienda (por defecto, en memoria)
+            
+        Returns:
+            TiendaMuebles: Tienda equivalente a la guardada
+            
+        Raises:
+            ValueError: Si el archivo no es una instantánea válida
+        """
+        instantanea = InstantaneaBinaria(ruta)
+        try:
+            tienda = cls(instantanea.nombre, almacen)
+            tienda._descuentos = instantanea.descuentos()
+            tienda._secuencia_diario = instantanea.secuencia_diario
+        except Exception:
+            instantanea.cerrar()
+            raise
+        # Se descarta el estado vacío que armó el constructor: las propiedades
+        # diferidas lo restauran desde la instantánea al primer uso
+        for nombre in ("_inventario", "_comedores", "_acumulados", "_valor_centavos",
+                       "_total_unidades", "_conteo_tipos", "_ventas_realizadas"):
+            del tienda.__dict__[nombre]
+        # El almacén (vacío) se conserva aparte hasta cargarlo con los muebles restaurados
+        tienda._almacen_pendiente = tienda.__dict__.pop("_almacen")
+        tienda._instantanea = instantanea
+        return tienda
+
+    def _restaurar_inventario(self) -> None:
+        """
+        Decodifica el inventario y los comedores de la instantánea y recalcula
+        los acumulados a partir de los precios guardados.
+        Método privado auxiliar.
+        """
+        instantanea = self._instantanea
+        muebles = instantanea.muebles(observadores=(self._observador_muebles,))
+        existencias = instantanea.existencias()
+        self._inventario = Inventario.desde_columnas(instantanea.ids(), muebles, existencias,
+                                                     instantanea.siguiente_id)
+        try:
+            # Los precios vienen memorizados en la instantánea: leerlos no recalcula nada
+            precios = list(map(methodcaller("calcular_precio"), muebles))
+        except Exception:
+            precios = [self._precio_o_cero(mueble) for mueble in muebles]
+        centavos = list(map(mul, map(round, map(mul, precios, repeat(100))), existencias))
+        self._acumulados = dict(zip(map(id, muebles), zip(centavos, existencias)))
+        self._valor_centavos = sum(centavos)
+        self._total_unidades = self._inventario.total_existencias
+        por_clase: Dict[type, int] = {}
+        for clase, unidades in zip(map(type, muebles), existencias):
+            por_clase[clase] = por_clase.get(clase, 0) + unidades
+        self._conteo_tipos = {}
+        for clase, unidades in por_clase.items():
+            tipo = clase.__name__
+            self._conteo_tipos[tipo] = self._conteo_tipos.get(tipo, 0) + unidades
+        self._comedores = []
+        # El almacén se carga con los muebles tal como se restauraron
+        self._restaurados = muebles
+        # Las sillas y mesas compartidas con el inventario vuelven como el mismo objeto
+        for comedor in instantanea.comedores(self._inventario.obtener):
+            self.agregar_comedor(comedor)
+        self._liberar_instantanea()
+
+    @staticmethod
+    def _precio_o_cero(mueble: 'Mueble') -> float:
+        """Precio de un mueble, o 0 si no se puede calcular (no suma valor)."""
+        try:
+            return mueble.calcular_precio()
+        except Exception:
+            return 0
+
+    def _restaurar_ventas(self) -> None:
+        """
+        Decodifica el historial de ventas de la instantánea.
+        Método privado auxiliar.
+        """
+        self._ventas_realizadas = self._instantanea.ventas()
+        self._liberar_instantanea()
+
+    def _restaurar_almacen(self) -> None:
+        """
+        Carga el almacén de búsquedas con los muebles restaurados.
+        
+        Toda alta, baja o modificación posterior a la carga pasa primero por
+        el almacén (lo que dispara esta carga) y después lo actualiza, así
+        que partir de los muebles restaurados lo deja al día.
+        Método privado auxiliar.
+        """
+        # Los muebles restaurados salen del inventario
+        self._asegurar_inventario()
+        almacen = self._almacen_pendiente
+        del self._almacen_pendiente
+        almacen.diferir(self._restaurados)
+        self._almacen = almacen
+        del self._restaurados
+
+    def _liberar_instantanea(self) -> None:
+        """Cierra la instantánea cuando ya no queda nada por leer de ella."""
+        if "_inventario" in self.__dict__ and "_ventas_realizadas" in self.__dict__:
+            self._instantanea.cerrar()
+            del self._instantanea
     
     def obtener_estadisticas(self) -> Dict:
         """
@@ -267,14 +1095,24 @@ class TiendaMuebles:
         Returns:
             Dict: Diccionario con estadísticas de la tienda
         """
-        # TODO: Implementar cálculo de estadísticas
+        if "_inventario" not in self.__dict__:
+            # Tienda recién cargada: los totales guardados evitan decodificar el inventario
+            estadisticas = dict(self._instantanea.resumen)
+            if "_ventas_realizadas" in self.__dict__:
+                estadisticas["ventas_realizadas"] = len(self._ventas_realizadas)
+                estadisticas["ingresos_ventas"] = self._ventas_realizadas.ingresos
+            estadisticas["descuentos_activos"] = len(self._descuentos.reglas_activas())
+            return estadisticas
         estadisticas = {
-            "total_muebles": len(self._inventario) if hasattr(self, '_inventario') else 0,
+            "total_muebles": self._inventario.total_existencias,
+            "total_referencias": len(self._inventario),
             "total_comedores": len(self._comedores),
+            "total_unidades": self.total_muebles,
             "valor_inventario": self.calcular_valor_inventario(),
             "ventas_realizadas": len(self._ventas_realizadas),
+            "ingresos_ventas": self._ventas_realizadas.ingresos,
             "tipos_muebles": self._contar_tipos_muebles(),
-            "descuentos_activos": len(self._descuentos_activos)
+            "descuentos_activos": len(self._descuentos.reglas_activas())
         }
         return estadisticas
     
@@ -286,34 +1124,108 @@ class TiendaMuebles:
         Returns:
             Dict[str, int]: Diccionario con el conteo por tipo
         """
-        conteo = {}
-        if hasattr(self, '_inventario'):
-            for mueble in self._inventario:
-                tipo = type(mueble).__name__
-                conteo[tipo] = conteo.get(tipo, 0) + 1
-        for comedor in self._comedores:
-            tipo = type(comedor).__name__
-            conteo[tipo] = conteo.get(tipo, 0) + 1
-        return conteo
+        return dict(self._conteo_tipos)
     
-    def generar_reporte_inventario(self) -> str:
+    def generar_reporte_inventario(self, detalle: bool = False, procesos: int = 1) -> str:
         """
         Genera un reporte completo del inventario.
+        Para inventarios grandes conviene iterar_reporte_inventario o
+        escribir_reporte_inventario, que no arman el texto completo en memoria.
         
+        Args:
+            detalle: Si se incluye la descripción de cada referencia
+            procesos: Procesos para describir el detalle (None: uno por núcleo)
+            
         Returns:
             str: Reporte detallado del inventario
         """
-        reporte = f"=== REPORTE DE INVENTARIO - {self.nombre} ===\n\n"
+        return "".join(self.iterar_reporte_inventario(detalle, procesos))
+
+    def iterar_reporte_inventario(self, detalle: bool = False, procesos: int = 1) -> Iterator[str]:
+        """
+        Genera el reporte de inventario línea por línea.
+        
+        Cada elemento es una línea terminada en salto de línea. Las líneas se
+        producen a medida que se consumen, por lo que la memoria usada no
+        depende del tamaño del inventario. El inventario no debe modificarse
+        mientras se recorre el detalle.
+        
+        Con procesos distinto de 1 las descripciones del detalle se calculan
+        en un único grupo de procesos; el texto resultante es idéntico al
+        serial. Con un solo núcleo o un inventario chico (ver
+        renderizado.procesos_efectivos) el detalle se describe en serie.
+        
+        Args:
+            detalle: Si se agrega una sección con la descripción de cada
+                referencia (obtener_descripcion) y de cada comedor
+                (obtener_descripcion_completa)
+            procesos: Procesos para describir el detalle (None: uno por núcleo)
+            
+        Yields:
+            str: Líneas del reporte
+        """
         estadisticas = self.obtener_estadisticas()
-        reporte += f"Total de muebles: {estadisticas['total_muebles']}\n"
-        reporte += f"Total de comedores: {estadisticas['total_comedores']}\n"
-        reporte += f"Valor total del inventario: ${estadisticas['valor_inventario']:.2f}\n\n"
-        reporte += "DISTRIBUCIÓN POR TIPOS:\n"
+        yield f"=== REPORTE DE INVENTARIO - {self.nombre} ===\n"
+        yield "\n"
+        yield f"Total de muebles: {estadisticas['total_muebles']}\n"
+        yield f"Total de comedores: {estadisticas['total_comedores']}\n"
+        yield f"Valor total del inventario: ${estadisticas['valor_inventario']:.2f}\n"
+        yield "\n"
+        yield "DISTRIBUCIÓN POR TIPOS:\n"
         for tipo, cantidad in estadisticas['tipos_muebles'].items():
-            reporte += f"- {tipo}: {cantidad} unidades\n"
-        if self._descuentos_activos:
-            reporte += "\nDESCUENTOS ACTIVOS:\n"
-            for categoria, descuento in self._descuentos_activos.items():
-                reporte += f"- {categoria}: {descuento * 100:.1f}%\n"
-        return reporte
+            yield f"- {tipo}: {cantidad} unidades\n"
+        descuentos_activos = self._descuentos.reglas_activas()
+        if descuentos_activos:
+            yield "\n"
+            yield "DESCUENTOS ACTIVOS:\n"
+            for categoria, descuento in descuentos_activos.items():
+                yield f"- {categoria}: {descuento * 100:.1f}%\n"
+        if detalle:
+            yield "\n"
+            yield "DETALLE DE MUEBLES:\n"
+            procesos = procesos_efectivos(procesos, len(self._inventario) + len(self._comedores))
+            # Un solo grupo de procesos para todo el detalle (muebles y comedores)
+            with grupo_de_procesos(procesos) as ejecutor:
+                referencias, para_describir = tee(self._inventario.referencias())
+                descripciones = self._describir(map(itemgetter(1), para_describir), procesos, ejecutor)
+                for (id_mueble, _, existencias), descripcion in zip(referencias, descripciones):
+                    yield "\n"
+                    yield f"[{id_mueble}] {existencias} unidades\n"
+                    for linea in descripcion.splitlines():
+                        yield linea + "\n"
+                if self._comedores:
+                    yield "\n"
+                    yield "DETALLE DE COMEDORES:\n"
+                    for descripcion in self._describir(self._comedores, procesos, ejecutor):
+                        yield "\n"
+                        for linea in descripcion.splitlines():
+                            yield linea + "\n"
+
+    def _describir(self, objetos: Iterable, procesos: int, ejecutor=None) -> Iterator[str]:
+        """
+        Descripciones de muebles o comedores, en serie o en el grupo de procesos del reporte.
+        Método privado auxiliar.
+        """
+        if procesos == 1:
+            return map(describir, objetos)
+        return describir_en_paralelo(objetos, procesos, ejecutor=ejecutor)
 
+    def escribir_reporte_inventario(self, archivo: TextIO, detalle: bool = False, procesos: int = 1) -> int:
+        """
+        Escribe el reporte de inventario directamente en un archivo abierto,
+        sin construir el texto completo en memoria.
+        
+        Args:
+            archivo: Objeto de archivo de texto abierto para escritura
+            detalle: Si se incluye la descripción de cada referencia
+            procesos: Procesos para describir el detalle (None: uno por núcleo)
+            
+        Returns:
+            int: Cantidad de líneas escritas
+        """
+        lineas = 0
+        escribir = archivo.write
+        for linea in self.iterar_reporte_inventario(detalle, procesos):
+            escribir(linea)
+            lineas += 1
+        return lineas
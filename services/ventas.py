@@ -0,0 +1,435 @@
+"""
+Registro columnar del historial de ventas.
+Cada venta ocupa una posición en columnas tipadas (arrays) en lugar de un
+diccionario propio; el diccionario de una venta se arma recién cuando se
+lo consulta. Junto con el registro se mantienen resúmenes por minuto, hora
+y día para consultar ventanas de tiempo sin recorrer las ventas.
+"""
+
+import datetime
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping, Sequence
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Las fechas se guardan como segundos desde esta época, en la hora local de la venta
+_EPOCA = datetime.datetime(1970, 1, 1)
+_FORMATO_FECHA = "%Y-%m-%d %H:%M:%S"
+_CAMPOS = ("mueble", "cliente", "precio_original", "descuento",
+           "precio_final", "cantidad", "total", "fecha")
+# Ancho en segundos de las cubetas de cada resumen, de la más fina a la más gruesa
+GRANULARIDADES = {"minuto": 60, "hora": 3600, "dia": 86400}
+
+
+def segundos_desde_epoca(momento: datetime.datetime) -> int:
+    """Convierte un momento (sin zona horaria) a segundos enteros desde 1970."""
+    return int((momento - _EPOCA).total_seconds())
+
+
+def formatear_fecha(segundos: int) -> str:
+    """Texto "AAAA-MM-DD HH:MM:SS" de un momento guardado como segundos desde 1970."""
+    return (_EPOCA + datetime.timedelta(seconds=segundos)).strftime(_FORMATO_FECHA)
+
+
+class VentaRegistrada(Mapping):
+    """
+    Vista de solo lectura de una venta del registro.
+
+    Se comporta como el diccionario de la venta (mismas claves, se compara
+    igual a él) pero cada campo se lee de las columnas al pedirlo: la fecha
+    se formatea recién cuando se consulta "fecha".
+    """
+
+    __slots__ = ('_registro', '_posicion')
+
+    def __init__(self, registro: 'RegistroVentas', posicion: int):
+        self._registro = registro
+        self._posicion = posicion
+
+    def __getitem__(self, campo: str):
+        return self._registro._campo(campo, self._posicion)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_CAMPOS)
+
+    def __len__(self) -> int:
+        return len(_CAMPOS)
+
+    def __contains__(self, campo: object) -> bool:
+        return campo in _CAMPOS
+
+    def __repr__(self) -> str:
+        return f"VentaRegistrada({dict(self)!r})"
+
+
+def _alinear(desde: int, hasta: int, ancho: int) -> Tuple[int, int]:
+    """Primer y último borde de cubeta de `ancho` segundos dentro de [desde, hasta]."""
+    return -(-desde // ancho) * ancho, hasta // ancho * ancho
+
+
+def _nuevo_total() -> Dict:
+    return {"ventas": 0, "unidades": 0, "ingresos": 0.0, "descuento": 0.0, "por_tipo": {}}
+
+
+def _sumar_total(total: Dict, tipo: str, acumulado: List[int]) -> None:
+    """Suma a un total los acumulados [ventas, unidades, centavos de ingreso, centavos de descuento] de un tipo."""
+    por_tipo = total["por_tipo"].get(tipo)
+    if por_tipo is None:
+        por_tipo = total["por_tipo"][tipo] = [0, 0, 0, 0]
+    for i, valor in enumerate(acumulado):
+        por_tipo[i] += valor
+
+
+def _cerrar_total(total: Dict) -> Dict:
+    """Convierte los acumulados por tipo de un total a su forma final (importes en pesos)."""
+    por_tipo = {}
+    for tipo, (ventas, unidades, ingresos, descuento) in total["por_tipo"].items():
+        por_tipo[tipo] = {"ventas": ventas, "unidades": unidades,
+                          "ingresos": ingresos / 100, "descuento": descuento / 100}
+        total["ventas"] += ventas
+        total["unidades"] += unidades
+        total["ingresos"] += ingresos
+        total["descuento"] += descuento
+    total["ingresos"] = total["ingresos"] / 100
+    total["descuento"] = total["descuento"] / 100
+    total["por_tipo"] = por_tipo
+    return total
+
+
+class ResumenVentas:
+    """
+    Resúmenes incrementales de ventas por minuto, hora y día.
+
+    Cada granularidad guarda los inicios de sus cubetas ordenados (array
+    'q') y, por cubeta, los acumulados de cada tipo de mueble: cantidad de
+    ventas, unidades, ingresos y descuento otorgado (estos dos en centavos,
+    para que la suma no acumule error). Registrar una venta actualiza una
+    cubeta por granularidad y consultar una ventana cuesta O(log n + k),
+    con k la cantidad de cubetas de la ventana.
+    """
+
+    def __init__(self):
+        """Constructor de los resúmenes vacíos."""
+        self._inicios = {nombre: array('q') for nombre in GRANULARIDADES}
+        self._cubetas: Dict[str, List[Dict[str, List[int]]]] = {nombre: [] for nombre in GRANULARIDADES}
+        self._minuto_actual: Optional[int] = None
+        self._cubetas_actuales: List[Dict[str, List[int]]] = []
+
+    def registrar(self, momento: int, tipo: str, unidades: int, ingresos: int, descuento: int) -> None:
+        """
+        Suma una venta a la cubeta que le corresponde en cada granularidad.
+
+        Args:
+            momento: Segundos desde 1970
+            tipo: Nombre de la clase del mueble vendido
+            unidades: Unidades vendidas
+            ingresos: Total de la venta en centavos
+            descuento: Descuento otorgado en centavos
+        """
+        minuto = momento - momento % GRANULARIDADES["minuto"]
+        if minuto != self._minuto_actual:
+            # Si la venta cae en el mismo minuto que la anterior, también cae en la misma hora y día
+            self._minuto_actual = minuto
+            self._cubetas_actuales = [self._cubeta(nombre, momento - momento % ancho)
+                                      for nombre, ancho in GRANULARIDADES.items()]
+        for cubeta in self._cubetas_actuales:
+            acumulado = cubeta.get(tipo)
+            if acumulado is None:
+                cubeta[tipo] = [1, unidades, ingresos, descuento]
+            else:
+                acumulado[0] += 1
+                acumulado[1] += unidades
+                acumulado[2] += ingresos
+                acumulado[3] += descuento
+
+    def _cubeta(self, granularidad: str, inicio: int) -> Dict[str, List[int]]:
+        """Cubeta de una granularidad que empieza en `inicio`; la crea si no existe."""
+        inicios = self._inicios[granularidad]
+        cubetas = self._cubetas[granularidad]
+        if inicios and inicios[-1] == inicio:
+            return cubetas[-1]
+        # Las ventas llegan en orden, así que casi siempre la cubeta nueva va al final
+        posicion = bisect_left(inicios, inicio)
+        if posicion < len(inicios) and inicios[posicion] == inicio:
+            return cubetas[posicion]
+        inicios.insert(posicion, inicio)
+        cubeta = {}
+        cubetas.insert(posicion, cubeta)
+        return cubeta
+
+    def _limites(self, granularidad: str, desde: int, hasta: int) -> Tuple[int, int]:
+        """Posiciones [inicio, fin) de las cubetas que empiezan dentro de [desde, hasta)."""
+        inicios = self._inicios[granularidad]
+        return bisect_left(inicios, desde), bisect_left(inicios, hasta)
+
+    def cubetas(self, granularidad: str, desde: int, hasta: int,
+                tipo: Optional[str] = None) -> List[Tuple[int, Dict]]:
+        """
+        Obtiene las cubetas de una granularidad que empiezan dentro de [desde, hasta).
+
+        Args:
+            granularidad: "minuto", "hora" o "dia"
+            desde: Segundos desde 1970 (inclusivo)
+            hasta: Segundos desde 1970 (exclusivo)
+            tipo: Nombre de una clase de mueble para contar solo ese tipo
+
+        Returns:
+            List[Tuple[int, Dict]]: (inicio de la cubeta, totales) de las
+                cubetas con ventas, en orden de tiempo
+        """
+        inicio, fin = self._limites(granularidad, desde, hasta)
+        inicios = self._inicios[granularidad]
+        resultados = []
+        for posicion in range(inicio, fin):
+            total = _nuevo_total()
+            for tipo_cubeta, acumulado in self._cubetas[granularidad][posicion].items():
+                if tipo is None or tipo_cubeta == tipo:
+                    _sumar_total(total, tipo_cubeta, acumulado)
+            if total["por_tipo"]:
+                resultados.append((inicios[posicion], _cerrar_total(total)))
+        return resultados
+
+    def acumular(self, total: Dict, granularidad: str, desde: int, hasta: int, tipo: Optional[str]) -> None:
+        """
+        Suma a un total (ver RegistroVentas.totales) las cubetas de una
+        granularidad que empiezan dentro de [desde, hasta).
+        """
+        inicio, fin = self._limites(granularidad, desde, hasta)
+        for cubeta in self._cubetas[granularidad][inicio:fin]:
+            for tipo_cubeta, acumulado in cubeta.items():
+                if tipo is None or tipo_cubeta == tipo:
+                    _sumar_total(total, tipo_cubeta, acumulado)
+
+
+class RegistroVentas(Sequence):
+    """
+    Historial de ventas guardado en columnas.
+
+    - Fecha: segundos enteros desde 1970 (array 'q').
+    - Cliente y nombre del mueble: código (array 'i') en una tabla de
+      textos internados, así cada nombre se guarda una sola vez.
+    - Cantidad: array 'q'; precios, descuento y total: arrays 'd'.
+    - Tipo de mueble: código (array 'i') en la misma tabla de textos.
+
+    Una venta ocupa 60 bytes. El registro se recorre y se indexa como una
+    lista de ventas (VentaRegistrada). Como las ventas se agregan en orden
+    de fecha, las consultas por rango de tiempo usan búsqueda binaria
+    sobre la columna de fechas; además cada venta se suma a los resúmenes
+    por minuto, hora y día (ResumenVentas).
+    """
+
+    def __init__(self):
+        """Constructor del registro vacío."""
+        self._momentos = array('q')
+        self._clientes = array('i')
+        self._muebles = array('i')
+        self._cantidades = array('q')
+        self._precios_originales = array('d')
+        self._descuentos = array('d')
+        self._precios_finales = array('d')
+        self._totales = array('d')
+        self._tipos = array('i')
+        self._textos: List[str] = []
+        self._codigos: Dict[str, int] = {}
+        # Deja de valer si el reloj retrocede entre dos ventas: entonces los rangos se recorren enteros
+        self._ordenado = True
+        self._resumen = ResumenVentas()
+        self._ingresos_centavos = 0
+
+    def _codigo(self, texto: str) -> int:
+        """Código del texto en la tabla de textos internados (lo agrega si es nuevo)."""
+        codigo = self._codigos.get(texto)
+        if codigo is None:
+            codigo = self._codigos[texto] = len(self._textos)
+            self._textos.append(texto)
+        return codigo
+
+    def agregar(self, fila: Tuple, tipo: str = "") -> int:
+        """
+        Agrega una venta y la suma a los resúmenes.
+
+        Args:
+            fila: (segundos, cliente, mueble, cantidad, precio original,
+                descuento en %, precio final, total)
+            tipo: Nombre de la clase del mueble vendido
+
+        Returns:
+            int: Posición de la venta en el registro
+        """
+        momento, cliente, mueble, cantidad, precio_original, descuento, precio_final, total = fila
+        if self._momentos and momento < self._momentos[-1]:
+            self._ordenado = False
+        ingresos, descuento_otorgado = self._centavos(cantidad, precio_original, precio_final, total)
+        self._resumen.registrar(momento, tipo, cantidad, ingresos, descuento_otorgado)
+        self._ingresos_centavos += ingresos
+        self._momentos.append(momento)
+        self._clientes.append(self._codigo(cliente))
+        self._muebles.append(self._codigo(mueble))
+        self._tipos.append(self._codigo(tipo))
+        self._cantidades.append(cantidad)
+        self._precios_originales.append(precio_original)
+        self._descuentos.append(descuento)
+        self._precios_finales.append(precio_final)
+        self._totales.append(total)
+        return len(self._momentos) - 1
+
+    def extender(self, filas: Iterable[Tuple], tipos: Iterable[str]) -> int:
+        """
+        Agrega varias ventas.
+
+        Args:
+            filas: Ventas como en agregar
+            tipos: Nombre de la clase del mueble de cada venta
+
+        Returns:
+            int: Posición de la primera venta agregada
+        """
+        inicio = len(self._momentos)
+        for fila, tipo in zip(filas, tipos):
+            self.agregar(fila, tipo)
+        return inicio
+
+    @staticmethod
+    def _centavos(cantidad: int, precio_original: float, precio_final: float, total: float) -> Tuple[int, int]:
+        """Ingreso y descuento otorgado de una venta, en centavos."""
+        return round(total * 100), round((precio_original - precio_final) * cantidad * 100)
+
+    @property
+    def resumen(self) -> ResumenVentas:
+        """Resúmenes por minuto, hora y día de las ventas del registro."""
+        return self._resumen
+
+    @property
+    def ingresos(self) -> float:
+        """Ingresos totales de todas las ventas."""
+        return self._ingresos_centavos / 100
+
+    def posiciones(self, desde: int, hasta: int) -> Iterable[int]:
+        """
+        Posiciones de las ventas con fecha dentro de [desde, hasta).
+        Con las fechas en orden es una búsqueda binaria; si el reloj
+        retrocedió alguna vez, se recorre la columna de fechas.
+
+        Args:
+            desde: Segundos desde 1970 (inclusivo)
+            hasta: Segundos desde 1970 (exclusivo)
+
+        Returns:
+            Iterable[int]: Posiciones en orden
+        """
+        momentos = self._momentos
+        if self._ordenado:
+            return range(bisect_left(momentos, desde), bisect_left(momentos, hasta))
+        return [posicion for posicion, momento in enumerate(momentos) if desde <= momento < hasta]
+
+    def totales(self, desde: int, hasta: int, tipo: Optional[str] = None) -> Dict:
+        """
+        Totales exactos de las ventas con fecha dentro de [desde, hasta).
+
+        La ventana se parte en tramos alineados a las cubetas más gruesas
+        que entran completas (días en el centro, horas y minutos hacia los
+        bordes), que se suman desde los resúmenes; solo las ventas de los
+        segundos sueltos de cada borde se leen del registro. El costo es
+        proporcional a la cantidad de cubetas, no a la de ventas.
+
+        Args:
+            desde: Segundos desde 1970 (inclusivo)
+            hasta: Segundos desde 1970 (exclusivo)
+            tipo: Nombre de una clase de mueble para contar solo ese tipo
+
+        Returns:
+            Dict: ventas, unidades, ingresos, descuento y los mismos totales por tipo
+        """
+        total = _nuevo_total()
+        # Bordes que no llegan a un minuto completo: se leen las ventas del registro
+        ancho = GRANULARIDADES["minuto"]
+        inicio, fin = _alinear(desde, hasta, ancho)
+        if inicio >= fin:
+            self._acumular_ventas(total, desde, hasta, tipo)
+            return _cerrar_total(total)
+        self._acumular_ventas(total, desde, inicio, tipo)
+        self._acumular_ventas(total, fin, hasta, tipo)
+        # De cada granularidad se suman los bordes que no llegan a una cubeta de la siguiente
+        granularidades = list(GRANULARIDADES.items())
+        for (nombre, _), (_, ancho_siguiente) in zip(granularidades, granularidades[1:]):
+            interior_inicio, interior_fin = _alinear(inicio, fin, ancho_siguiente)
+            if interior_inicio >= interior_fin:
+                self._resumen.acumular(total, nombre, inicio, fin, tipo)
+                return _cerrar_total(total)
+            self._resumen.acumular(total, nombre, inicio, interior_inicio, tipo)
+            self._resumen.acumular(total, nombre, interior_fin, fin, tipo)
+            inicio, fin = interior_inicio, interior_fin
+        self._resumen.acumular(total, granularidades[-1][0], inicio, fin, tipo)
+        return _cerrar_total(total)
+
+    def _acumular_ventas(self, total: Dict, desde: int, hasta: int, tipo: Optional[str]) -> None:
+        """Suma a un total las ventas del registro con fecha dentro de [desde, hasta)."""
+        textos = self._textos
+        for posicion in self.posiciones(desde, hasta):
+            tipo_venta = textos[self._tipos[posicion]]
+            if tipo is not None and tipo_venta != tipo:
+                continue
+            cantidad = self._cantidades[posicion]
+            ingresos, descuento = self._centavos(cantidad, self._precios_originales[posicion],
+                                                 self._precios_finales[posicion], self._totales[posicion])
+            _sumar_total(total, tipo_venta, (1, cantidad, ingresos, descuento))
+
+    def fila(self, posicion: int) -> Tuple:
+        """Venta en la forma en que se agrega (ver agregar), sin armar el diccionario."""
+        textos = self._textos
+        return (self._momentos[posicion], textos[self._clientes[posicion]],
+                textos[self._muebles[posicion]], self._cantidades[posicion],
+                self._precios_originales[posicion], self._descuentos[posicion],
+                self._precios_finales[posicion], self._totales[posicion])
+
+    def _campo(self, campo: str, posicion: int):
+        """Valor de un campo del diccionario de una venta."""
+        if campo == "mueble":
+            return self._textos[self._muebles[posicion]]
+        if campo == "cliente":
+            return self._textos[self._clientes[posicion]]
+        if campo == "precio_original":
+            return self._precios_originales[posicion]
+        if campo == "descuento":
+            return self._descuentos[posicion]
+        if campo == "precio_final":
+            return self._precios_finales[posicion]
+        if campo == "cantidad":
+            return self._cantidades[posicion]
+        if campo == "total":
+            return self._totales[posicion]
+        if campo == "fecha":
+            return formatear_fecha(self._momentos[posicion])
+        raise KeyError(campo)
+
+    def __getitem__(self, posicion):
+        if isinstance(posicion, slice):
+            return [VentaRegistrada(self, i) for i in range(*posicion.indices(len(self)))]
+        if posicion < 0:
+            posicion += len(self)
+        if not 0 <= posicion < len(self):
+            raise IndexError("Venta fuera del registro")
+        return VentaRegistrada(self, posicion)
+
+    def __len__(self) -> int:
+        return len(self._momentos)
+
+    def __eq__(self, otro: object) -> bool:
+        if not isinstance(otro, RegistroVentas):
+            return NotImplemented
+        return (len(self) == len(otro) and
+                all(map(tuple.__eq__, map(self.fila, range(len(self))), map(otro.fila, range(len(otro))))) and
+                all(map(str.__eq__, map(self._textos.__getitem__, self._tipos),
+                        map(otro._textos.__getitem__, otro._tipos))))
+
+    __hash__ = None
+
+    def __getstate__(self) -> Dict:
+        """Al serializar se omite el diccionario de códigos: se reconstruye con los textos."""
+        estado = self.__dict__.copy()
+        del estado["_codigos"]
+        return estado
+
+    def __setstate__(self, estado: Dict) -> None:
+        self.__dict__.update(estado)
+        self._codigos = {texto: codigo for codigo, texto in enumerate(self._textos)}
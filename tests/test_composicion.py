@@ -109,4 +109,47 @@ def test_agregar_silla_invalida():
 	mesa = crear_mesa()
 	comedor = Comedor("Comedor Edge", mesa, [])
 	msg = comedor.agregar_silla("no es silla")
-	assert "Solo se pueden agregar" in msg
\ No newline at end of file
+	assert "Solo se pueden agregar" in msg
+
+def test_sillas_vista_solo_lectura_y_subtotal_acumulado():
+	mesa = crear_mesa()
+	silla1 = crear_silla()
+	silla2 = Silla("Silla2", "metal", "azul", 120, True, "cuero", False, False)
+	comedor = Comedor("Comedor Prueba", mesa, [silla1])
+	vista = comedor.sillas
+	assert vista is comedor.sillas  # no se crea una copia por acceso
+	with pytest.raises(TypeError):
+		vista[0] = silla2
+	assert not hasattr(vista, "append")
+	comedor.agregar_silla(silla2)
+	assert list(vista) == [silla1, silla2] and comedor.cantidad_sillas == 2
+	esperado = round(mesa.calcular_precio() + silla1.calcular_precio() + silla2.calcular_precio(), 2)
+	assert comedor.calcular_precio_total() == esperado
+	silla2.precio_base = 300  # el cambio de precio de una silla ajusta el subtotal
+	esperado = round(mesa.calcular_precio() + silla1.calcular_precio() + silla2.calcular_precio(), 2)
+	assert comedor.calcular_precio_total() == esperado
+	comedor.quitar_silla(0)
+	assert comedor.precio_sillas == silla2.calcular_precio()
+	silla1.precio_base = 999  # la silla quitada ya no afecta al comedor
+	assert comedor.obtener_resumen()["precio_sillas"] == silla2.calcular_precio()
+
+def test_comedor_descartado_no_queda_vivo_por_sus_componentes():
+	import gc
+	import weakref
+	mesa = crear_mesa()
+	silla = crear_silla()
+	avisos = []
+	comedor = Comedor("Comedor Temporal", mesa, [silla])
+	comedor._suscribir(lambda objeto, atributo: avisos.append(atributo))
+	referencia = weakref.ref(comedor)
+	silla.precio_base = 150
+	assert avisos == ["precio"]
+	del comedor
+	gc.collect()
+	assert referencia() is None  # la mesa y la silla no lo mantienen vivo
+	silla.precio_base = 200
+	mesa.precio_base = 600
+	assert avisos == ["precio"]  # ni siguen notificando a través de él
+	# Al suscribir otro comedor se descartan los observadores muertos
+	Comedor("Comedor Nuevo", mesa, [silla])
+	assert len(silla._observadores) == 1
@@ -144,6 +144,19 @@ class TestSilla:
         assert isinstance(descripcion, str)
         assert len(descripcion) > 0
 
+    def test_precio_memorizado_se_invalida_en_setters(self):
+        """Prueba que el precio memorizado se recalcula al cambiar atributos."""
+        assert self.silla_basica.calcular_precio() == 165.0
+        assert self.silla_basica._precio_cache == 165.0
+
+        self.silla_basica.precio_base = 200.0
+        assert self.silla_basica._precio_cache is None
+        assert self.silla_basica.calcular_precio() == 220.0
+
+        self.silla_basica.material_tapizado = "cuero"
+        self.silla_basica.tiene_ruedas = True
+        assert self.silla_basica.calcular_precio() == 470.0  # 200 * 1.3 + 150 + 60
+
 
 class TestSofaCama:
     """
@@ -230,6 +243,16 @@ class TestSofaCama:
         assert hasattr(self.sofacama, 'convertir_a_cama')
         assert hasattr(self.sofacama, 'convertir_a_sofa')
         assert hasattr(self.sofacama, 'calcular_precio')
+
+    def test_campos_de_cama_en_slots(self):
+        """Cama y SofaCama guardan todos sus atributos en slots, sin __dict__."""
+        from models.concretos.cama import Cama
+
+        cama = Cama("Cama", "Madera", "Blanco", 700.0, "queen")
+        assert not hasattr(cama, '__dict__')
+        assert not hasattr(self.sofacama, '__dict__')
+        assert self.sofacama.tamaño == "matrimonial"
+        assert self.sofacama.incluye_colchon is True
         assert hasattr(self.sofacama, 'obtener_descripcion')
 
 
@@ -347,6 +370,113 @@ class TestConceptosOOPGenerales:
         pass
 
 
+class TestValoresCategoricos:
+    """
+    Pruebas de los atributos categóricos internados.
+    """
+
+    def test_textos_iguales_comparten_objeto(self):
+        """Dos muebles con el mismo material comparten un único objeto de texto."""
+        material = "".join(["Mad", "era"])  # texto construido, no literal
+        silla = Silla("Silla A", material, "Negro", 100.0)
+        mesa = Mesa("Mesa A", "Madera", "Roble", 300.0)
+        assert silla.material is mesa.material
+        assert silla.material == "Madera"
+        assert str(silla.material) == "Madera"
+
+    def test_clave_y_codigo_normalizados(self):
+        """La clave se normaliza al asignar y el código no distingue mayúsculas."""
+        silla = Silla("Silla A", "Madera", "Negro", 100.0, True, "  CUERO ")
+        assert silla.material_tapizado.clave == "cuero"
+        assert silla.calcular_precio() == Silla("Silla C", "Madera", "Negro", 100.0, True, "cuero").calcular_precio()
+        silla.material = "madera"
+        otra = Silla("Silla B", "MADERA", "Negro", 100.0)
+        assert silla.material.codigo == otra.material.codigo
+        assert silla.material is not otra.material
+
+    def test_serializacion_conserva_objeto_compartido(self):
+        """Al deserializar un mueble su texto vuelve a ser el objeto compartido."""
+        import pickle
+        sofacama = SofaCama("SofaCama", "Tela", "Gris", 800.0, mecanismo_conversion="Electrico")
+        copia = pickle.loads(pickle.dumps(sofacama))
+        assert copia.mecanismo_conversion is sofacama.mecanismo_conversion
+        assert copia.calcular_precio() == sofacama.calcular_precio()
+
+
+class TestMotorPrecios:
+    """
+    Pruebas del motor de precios por lote contra los métodos escalares.
+    """
+
+    def crear_muebles_variados(self):
+        """Genera muebles de todas las clases concretas con combinaciones de atributos."""
+        from itertools import product
+        from models.concretos.sillon import Sillon
+        from models.concretos.sofa import Sofa
+        from models.concretos.escritorio import Escritorio
+        from models.concretos.cama import Cama
+        from models.concretos.armario import Armario
+        from models.concretos.cajonera import Cajonera
+
+        muebles = []
+        for base, flag, tapizado in product([99.99, 150, 1234.567], [True, False], [None, "Cuero", "tela", "lino"]):
+            muebles.append(Silla("Silla", "Madera", "Café", base, flag, tapizado, not flag, flag))
+            muebles.append(Sillon("Sillón", "Tela", "Gris", base, flag, tapizado, flag, not flag))
+            for capacidad in (1, 3, 5):
+                muebles.append(Sofa("Sofá", "Tela", "Azul", base, capacidad, flag, tapizado, flag, not flag))
+            for mecanismo in ("Electrico", "hidraulico", "plegable"):
+                muebles.append(SofaCama("SofaCama", "Tela", "Gris", base, 2, tapizado, "queen", flag, mecanismo))
+            for forma, capacidad in product(["Redonda", "rectangular", "circular"], [2, 4, 8]):
+                muebles.append(Mesa("Mesa", "Madera", "Roble", base, forma, capacidad, 1.37, flag))
+            for forma, altura in product(["esquinero", "recto"], [75, 80, 80.5]):
+                muebles.append(Escritorio("Escritorio", "Madera", "Negro", base, forma, 1.1, altura,
+                                          flag, 0, 3, not flag))
+            for tamaño in ("Queen", "king", "matrimonial", "individual", "otro"):
+                muebles.append(Cama("Cama", "Madera", "Blanco", base, tamaño, flag, not flag))
+            muebles.append(Armario("Armario", "Madera", "Blanco", base, 3, 2, flag))
+            muebles.append(Cajonera("Cajonera", "Madera", "Blanco", base, 4, flag))
+        return muebles
+
+    def test_precios_por_lote_identicos_a_escalares(self):
+        """El motor por lote debe dar exactamente los mismos precios que calcular_precio."""
+        from services.precios import calcular_precios
+        muebles = self.crear_muebles_variados()
+        assert calcular_precios(muebles) == [m.calcular_precio() for m in muebles]
+
+    def test_factor_comodidad_por_lote(self):
+        """El factor de comodidad por lote coincide con Asiento.calcular_factor_comodidad."""
+        from services.precios import calcular_factores_comodidad
+        from models.categorias.asientos import Asiento
+        asientos = [m for m in self.crear_muebles_variados() if isinstance(m, Asiento)]
+        assert calcular_factores_comodidad(asientos) == [a.calcular_factor_comodidad() for a in asientos]
+
+    def test_subclase_usa_metodo_escalar(self):
+        """Una subclase que redefine calcular_precio no usa la fórmula de su clase base."""
+        from services.precios import calcular_precios
+
+        class SillaEspecial(Silla):
+            def calcular_precio(self):
+                return 1.0
+
+        silla = Silla("Silla", "Madera", "Café", 100.0)
+        assert calcular_precios([SillaEspecial("Especial", "Madera", "Café", 100.0), silla]) == [1.0, silla.calcular_precio()]
+
+    def test_cotizar_recalcula_y_memoriza_los_invalidados(self):
+        """cotizar recalcula por lote solo los precios invalidados y los deja memorizados."""
+        from services.precios import cotizar
+        muebles = self.crear_muebles_variados()
+        for mueble in muebles:
+            mueble.calcular_precio()
+        for mueble in muebles[::3]:
+            mueble.precio_base = mueble.precio_base * 2
+        assert all(m._precio_cache is None for m in muebles[::3])
+        precios = cotizar(muebles)
+        assert [m._precio_cache for m in muebles] == precios
+        for mueble in muebles:
+            mueble._precio_cache = None
+        assert precios == [m.calcular_precio() for m in muebles]
+
+
 # Agregar fixture para datos de prueba si es necesario
 @pytest.fixture
 def muebles_de_prueba():
@@ -359,6 +489,36 @@ def muebles_de_prueba():
 
 
 # TODO: Agregar tests de integración 
+class TestSerializacion:
+    """
+    Pruebas de pickle y copy sobre muebles y comedores observados.
+    """
+
+    def test_pickle_omite_observadores(self):
+        """La copia serializada conserva la configuración pero no los observadores."""
+        import pickle
+        avisos = []
+        sofacama = SofaCama("SofaCama Test", "Tela", "Gris", 800.0)
+        sofacama._suscribir(lambda mueble, atributo: avisos.append(atributo))
+        copia = pickle.loads(pickle.dumps(sofacama))
+        assert copia.clave_configuracion() == sofacama.clave_configuracion()
+        assert copia.obtener_descripcion() == sofacama.obtener_descripcion()
+        assert copia.material is sofacama.material  # sigue internado
+        copia.precio_base = 900.0
+        assert avisos == []
+
+    def test_copia_de_comedor_observa_sus_componentes(self):
+        """Un comedor deserializado vuelve a seguir los precios de sus sillas."""
+        import copy
+        mesa = Mesa("Mesa Test", "madera", "roble", 500, "rectangular", 4, 1.5, False)
+        silla = Silla("Silla Test", "madera", "rojo", 100, True, "tela", True, True)
+        comedor = Comedor("Comedor Test", mesa, [silla])
+        copia = copy.deepcopy(comedor)
+        copia.sillas[0].precio_base = 200
+        assert comedor.calcular_precio_total() != copia.calcular_precio_total()
+        assert copia.calcular_precio_total() == round(copia.mesa.calcular_precio() + copia.sillas[0].calcular_precio(), 2)
+
+
 class TestIntegracion:
     """
     Pruebas de integración que validan el funcionamiento conjunto de múltiples clases.
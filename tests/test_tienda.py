@@ -152,4 +152,781 @@ def test_filtrar_precio_edge():
 	silla = crear_silla()
 	tienda.agregar_mueble(silla)
 	resultados = tienda.filtrar_por_precio(-100, 100)
-	assert silla in resultados
\ No newline at end of file
+	assert silla in resultados
+
+# Índices de material y color
+def test_filtrar_por_color():
+	tienda = TiendaMuebles()
+	silla = crear_silla()
+	mesa = crear_mesa()
+	tienda.agregar_mueble(silla)
+	tienda.agregar_mueble(mesa)
+	assert tienda.filtrar_por_color("ROJO ") == [silla]
+	assert tienda.filtrar_por_color("") == []
+
+def test_indices_tras_venta_y_cambio_de_material():
+	tienda = TiendaMuebles()
+	silla = crear_silla()
+	mesa = crear_mesa()
+	tienda.agregar_mueble(silla)
+	tienda.agregar_mueble(mesa)
+	mesa.material = "Vidrio"
+	assert tienda.filtrar_por_material("madera") == [silla]
+	assert tienda.filtrar_por_material("vidrio") == [mesa]
+	tienda.realizar_venta(silla)
+	assert tienda.filtrar_por_material("madera") == []
+	assert tienda.filtrar_por_color("rojo") == []
+
+def test_editar_material_conserva_el_orden_del_inventario():
+	from services.almacen import AlmacenSQLite
+	for almacen in (None, AlmacenSQLite()):
+		tienda = TiendaMuebles(almacen=almacen)
+		alfa, beta, gama = crear_silla(), crear_silla(), crear_silla()
+		alfa.nombre, beta.nombre, gama.nombre = "Alfaa", "Beta", "Gama"
+		for silla in (alfa, beta, gama):
+			tienda.agregar_mueble(silla)
+		alfa.material = "Metal"
+		assert tienda.filtrar_por_material("metal") == [alfa]
+		alfa.material = "Madera"
+		beta.color = "Azul"
+		beta.color = "Rojo"
+		assert tienda.filtrar_por_material("madera") == [alfa, beta, gama]
+		assert tienda.filtrar_por_color("rojo") == [alfa, beta, gama]
+
+def test_catalogo_descartado_no_queda_vivo_por_sus_muebles():
+	import gc
+	import weakref
+	from services.catalogo import Catalogo
+	silla, mesa = crear_silla(), crear_mesa()
+	catalogo = Catalogo([silla, mesa])
+	referencia = weakref.ref(catalogo)
+	del catalogo
+	gc.collect()
+	assert referencia() is None
+	silla.material = "Metal"  # sin catálogo que actualizar
+	otro = Catalogo([silla, mesa])
+	assert len(silla._observadores) == 1
+	mesa.material = "Metal"
+	assert otro.filtrar_por_material("metal") == [silla, mesa]
+
+def test_filtrar_por_precio_en_orden_del_inventario():
+	from services.almacen import AlmacenSQLite
+	from services.catalogo import Catalogo
+	for almacen in (None, AlmacenSQLite()):
+		tienda = TiendaMuebles(almacen=almacen)
+		cara, barata, media = crear_silla(), crear_silla(), crear_silla()
+		cara.precio_base, barata.precio_base, media.precio_base = 300, 100, 200
+		for silla in (cara, barata, media):
+			tienda.agregar_mueble(silla)
+		assert tienda.filtrar_por_precio() == [cara, barata, media]
+		# Un cambio de precio no mueve el mueble de su lugar en el inventario
+		cara.precio_base = 50
+		assert tienda.filtrar_por_precio() == [cara, barata, media]
+		assert tienda.filtrar_por_precio(0, barata.calcular_precio()) == [cara, barata]
+		assert tienda.obtener_mas_baratos(1) == [cara]
+	catalogo = Catalogo([cara, barata, media])
+	barata.precio_base = 1000
+	assert catalogo.filtrar_por_precio() == [cara, barata, media]
+
+def test_obtener_muebles_por_tipo_jerarquia():
+	from models.categorias.asientos import Asiento
+	from models.concretos.cama import Cama
+	from models.concretos.sofacama import SofaCama
+	tienda = TiendaMuebles()
+	silla = crear_silla()
+	sofacama = SofaCama("SofaCama Test", "Tela", "Gris", 800.0)
+	cama = Cama("Cama Test", "Madera", "Nogal", 400.0)
+	for mueble in (silla, sofacama, cama, crear_mesa()):
+		tienda.agregar_mueble(mueble)
+	assert tienda.obtener_muebles_por_tipo(Asiento) == [silla, sofacama]
+	assert tienda.obtener_muebles_por_tipo(Cama) == [sofacama, cama]
+	assert tienda.contar_muebles_por_tipo(Cama) == 2
+	tienda.realizar_venta(sofacama)
+	assert tienda.obtener_muebles_por_tipo(Cama) == [cama]
+	assert "SofaCama" not in tienda._contar_tipos_muebles()
+
+# Índice ordenado de precios
+def test_indice_precios_se_actualiza_con_setters():
+	tienda = TiendaMuebles()
+	silla = crear_silla()
+	mesa = crear_mesa()
+	tienda.agregar_mueble(silla)
+	tienda.agregar_mueble(mesa)
+	assert tienda.filtrar_por_precio(0, 500) == [silla]
+	silla.precio_base = 1000
+	assert tienda.filtrar_por_precio(0, 500) == []
+	assert tienda.filtrar_por_precio(silla.calcular_precio(), silla.calcular_precio()) == [silla]
+
+def test_obtener_mas_baratos_y_mas_caros():
+	tienda = TiendaMuebles()
+	silla = crear_silla()
+	mesa = crear_mesa()
+	tienda.agregar_mueble(mesa)
+	tienda.agregar_mueble(silla)
+	assert tienda.obtener_mas_baratos(1) == [silla]
+	assert tienda.obtener_mas_caros(5) == [mesa, silla]
+	tienda.realizar_venta(mesa)
+	assert tienda.obtener_mas_caros(1) == [silla]
+
+# Índice de n-gramas por nombre
+def test_buscar_por_nombre_parcial_y_renombrado():
+	tienda = TiendaMuebles()
+	silla = crear_silla()
+	mesa = crear_mesa()
+	tienda.agregar_mueble(silla)
+	tienda.agregar_mueble(mesa)
+	assert tienda.buscar_muebles_por_nombre("t") == [silla, mesa]
+	assert tienda.buscar_muebles_por_nombre("LLA T") == [silla]
+	assert tienda.buscar_muebles_por_nombre("a test") == [silla, mesa]
+	assert tienda.buscar_muebles_por_nombre("silla tests") == []
+	silla.nombre = "Banqueta Alta"
+	assert tienda.buscar_muebles_por_nombre("silla") == []
+	assert tienda.buscar_muebles_por_nombre("queta al") == [silla]
+
+def test_busqueda_corta_en_orden_del_inventario():
+	from services.almacen import AlmacenSQLite
+	for almacen in (None, AlmacenSQLite()):
+		tienda = TiendaMuebles(almacen=almacen)
+		casa, mesa, casa_dos = crear_silla(), crear_mesa(), crear_silla()
+		casa.nombre, mesa.nombre, casa_dos.nombre = "Casa", "Mesa Baja", "Casa Dos"
+		tienda.agregar_muebles_lote([casa, mesa, casa_dos])
+		assert tienda.buscar_muebles_por_nombre("a") == [casa, mesa, casa_dos]
+		# La carga inicial posterga las claves de configuración, pero se siguen encontrando
+		otra = crear_mesa()
+		otra.nombre = "Mesa Baja"
+		assert "existencia: 2" in tienda.agregar_existencias(otra)
+		assert tienda.buscar_muebles_por_nombre("sa") == [casa, mesa, casa_dos]
+		assert tienda.buscar_muebles_por_nombre("j") == [mesa]
+
+def test_renombrar_conserva_el_orden_del_inventario():
+	from services.almacen import AlmacenSQLite
+	for almacen in (None, AlmacenSQLite()):
+		tienda = TiendaMuebles(almacen=almacen)
+		alfa, beta, gama = crear_silla(), crear_silla(), crear_silla()
+		alfa.nombre, beta.nombre, gama.nombre = "Sala Alfa", "Sala Beta", "Sala Gama"
+		for silla in (alfa, beta, gama):
+			tienda.agregar_mueble(silla)
+		alfa.nombre = "Sala Alfaa"
+		assert tienda.buscar_muebles_por_nombre("sala") == [alfa, beta, gama]
+		assert tienda.buscar_muebles_por_nombre("ala ") == [alfa, beta, gama]
+		gama.nombre = "Otra"
+		gama.nombre = "Sala Gama"
+		beta.nombre = "Sala Beta Dos"
+		assert tienda.buscar_muebles_por_nombre("sala") == [alfa, beta, gama]
+		assert tienda.buscar_muebles_por_nombre("alfaa") == [alfa]
+
+# Acumulados incrementales
+def test_acumulados_se_mantienen_al_dia():
+	tienda = TiendaMuebles()
+	silla = crear_silla()
+	tienda.agregar_mueble(silla)
+	comedor = Comedor("Comedor Test", crear_mesa(), [crear_silla()])
+	tienda.agregar_comedor(comedor)
+	esperado = round(silla.calcular_precio() + comedor.calcular_precio_total(), 2)
+	assert tienda.calcular_valor_inventario() == esperado
+	assert tienda.total_muebles == 3
+	silla.precio_base = 300
+	comedor.agregar_silla(crear_silla())
+	esperado = round(silla.calcular_precio() + comedor.calcular_precio_total(), 2)
+	assert tienda.calcular_valor_inventario() == esperado
+	assert tienda.total_muebles == 4
+	tienda.realizar_venta(silla)
+	assert tienda.calcular_valor_inventario() == comedor.calcular_precio_total()
+	stats = tienda.obtener_estadisticas()
+	assert stats["tipos_muebles"] == {"Comedor": 1}
+	assert stats["total_unidades"] == 3
+
+# Inventario indexado por ID
+def test_ids_estables_y_orden_de_insercion():
+	tienda = TiendaMuebles()
+	muebles = [crear_silla(), crear_mesa(), crear_silla()]
+	for mueble in muebles:
+		tienda.agregar_mueble(mueble)
+	ids = [tienda.obtener_id(mueble) for mueble in muebles]
+	assert ids == [1, 2, 3]
+	tienda.realizar_venta(muebles[1])
+	assert tienda.obtener_id(muebles[1]) is None
+	assert tienda.obtener_mueble_por_id(3) is muebles[2]
+	assert list(tienda._inventario) == [muebles[0], muebles[2]]
+	venta = tienda.realizar_venta(muebles[1])
+	assert "error" in venta
+
+# Ventas por lote
+def test_realizar_ventas_lote():
+	tienda = TiendaMuebles()
+	tienda.aplicar_descuento("silla", 10)
+	silla = crear_silla()
+	mesa = crear_mesa()
+	tienda.agregar_mueble(silla)
+	tienda.agregar_mueble(mesa)
+	resultados = tienda.realizar_ventas_lote([silla, silla, mesa, crear_silla()], "Cliente Lote")
+	assert [("error" in r) for r in resultados] == [False, True, False, True]
+	assert resultados[0]["descuento"] == 10
+	assert resultados[0]["precio_final"] == round(silla.calcular_precio() * 0.9, 2)
+	assert resultados[0]["fecha"] == resultados[2]["fecha"]
+	assert len(tienda._inventario) == 0
+	assert tienda.obtener_estadisticas()["ventas_realizadas"] == 2
+
+# Carga masiva
+def test_agregar_muebles_lote():
+	tienda = TiendaMuebles()
+	silla = crear_silla()
+	mesa = crear_mesa()
+	tienda.agregar_mueble(mesa)
+	generador = (m for m in [silla, "no es mueble", mesa, silla])
+	resumen = tienda.agregar_muebles_lote(generador)
+	assert resumen["agregados"] == 1
+	assert [r["posicion"] for r in resumen["rechazados"]] == [1, 2, 3]
+	assert tienda.filtrar_por_material("madera") == [mesa, silla]
+	assert tienda.obtener_mas_baratos(1) == [silla]
+	assert tienda.buscar_muebles_por_nombre("silla") == [silla]
+	assert tienda.calcular_valor_inventario() == round(silla.calcular_precio() + mesa.calcular_precio(), 2)
+	assert tienda._contar_tipos_muebles() == {"Mesa": 1, "Silla": 1}
+
+# Instantánea columnar
+def test_instantanea_columnar_equivale_a_la_tienda():
+	tienda = TiendaMuebles()
+	silla = crear_silla()
+	mesa = crear_mesa()
+	otra = Silla("Silla Metal", "Metal", "Negro", 80, False)
+	tienda.agregar_muebles_lote([silla, mesa, otra])
+	tienda.agregar_comedor(Comedor("Comedor Test", crear_mesa(), [crear_silla()]))
+	instantanea = tienda.crear_instantanea_columnar()
+	assert len(instantanea) == 3
+	assert list(instantanea.ids) == [1, 2, 3]
+	assert instantanea.filtrar_por_precio(0, 200) == tienda.filtrar_por_precio(0, 200)
+	assert instantanea.filtrar_por_material("MADERA") == tienda.filtrar_por_material("madera")
+	assert instantanea.filtrar_por_material("vidrio") == []
+	assert instantanea.calcular_valor_inventario() == tienda.calcular_valor_inventario()
+	assert instantanea.contar_tipos_muebles() == tienda._contar_tipos_muebles()
+	assert instantanea.capacidad_personas[1] == 4
+	assert instantanea.area_superficie[0] != instantanea.area_superficie[0]  # NaN para sillas
+
+# Referencias (SKU) con existencias
+def test_agregar_existencias_agrupa_muebles_identicos():
+	tienda = TiendaMuebles()
+	silla = crear_silla()
+	tienda.agregar_mueble(silla, cantidad=3)
+	msg = tienda.agregar_existencias(crear_silla(), 2)
+	assert "existencia: 5" in msg
+	assert len(tienda._inventario) == 1
+	assert tienda.obtener_existencias(silla) == 5
+	assert tienda.total_muebles == 5
+	assert tienda.calcular_valor_inventario() == round(silla.calcular_precio() * 5, 2)
+	assert tienda._contar_tipos_muebles() == {"Silla": 5}
+	assert tienda.obtener_estadisticas()["total_referencias"] == 1
+	silla.precio_base = 200
+	assert tienda.calcular_valor_inventario() == round(silla.calcular_precio() * 5, 2)
+
+def test_venta_por_cantidad_descuenta_existencias():
+	tienda = TiendaMuebles()
+	silla = crear_silla()
+	tienda.agregar_mueble(silla, cantidad=4)
+	assert "error" in tienda.realizar_venta(crear_silla(), "Cliente", cantidad=3)
+	venta = tienda.realizar_venta(crear_silla(), "Cliente", cantidad=3, por_configuracion=True)
+	assert venta["cantidad"] == 3
+	assert venta["total"] == round(venta["precio_final"] * 3, 2)
+	assert tienda.obtener_existencias(silla) == 1
+	assert "error" in tienda.realizar_venta(silla, cantidad=2)
+	resultados = tienda.realizar_ventas_lote([silla, silla])
+	assert [("error" in r) for r in resultados] == [False, True]
+	assert silla not in tienda._inventario
+	assert tienda.total_muebles == 0
+	assert tienda._contar_tipos_muebles() == {}
+
+def test_venta_no_toma_otra_referencia_sin_pedirlo():
+	tienda = TiendaMuebles()
+	agotada, otra = crear_silla(), crear_silla()
+	otra.nombre = "Silla Test"
+	tienda.agregar_mueble(agotada)
+	tienda.agregar_mueble(otra, 5)
+	assert "error" not in tienda.realizar_venta(agotada)
+	assert "error" in tienda.realizar_venta(agotada)
+	assert "error" in tienda.realizar_ventas_lote([agotada])[0]
+	assert "error" in tienda.realizar_venta(crear_silla())  # nunca se agregó
+	assert tienda.obtener_existencias(otra) == 5
+	venta = tienda.realizar_venta(agotada, "Ana", por_configuracion=True)
+	assert venta["mueble"] == otra.nombre and tienda.obtener_existencias(otra) == 4
+	assert "error" not in tienda.realizar_ventas_lote([crear_silla()], por_configuracion=True)[0]
+	assert tienda.obtener_existencias(otra) == 3
+
+def test_carga_masiva_agrupada_y_configuracion_modificada():
+	tienda = TiendaMuebles()
+	resumen = tienda.agregar_muebles_lote([crear_silla() for _ in range(4)] + [crear_mesa()], agrupar=True)
+	assert resumen["agregados"] == 2
+	assert resumen["agrupados"] == 3
+	assert tienda._contar_tipos_muebles() == {"Silla": 4, "Mesa": 1}
+	silla = tienda.obtener_mueble_por_id(1)
+	silla.material = "metal"
+	assert crear_silla() not in tienda._inventario
+	tienda.agregar_existencias(crear_silla())
+	assert len(tienda._inventario) == 3
+	assert tienda.obtener_existencias(silla) == 4
+
+# Descuentos por jerarquía
+def test_descuentos_resueltos_por_jerarquia():
+	from models.concretos.sofacama import SofaCama
+	from models.concretos.armario import Armario
+	tienda = TiendaMuebles()
+	silla = crear_silla()
+	sofacama = SofaCama("SofaCama Test", "Tela", "Gris", 800.0)
+	armario = Armario("Armario Test", "Madera", "Blanco", 500.0)
+	for mueble in (silla, sofacama, armario, crear_mesa()):
+		tienda.agregar_mueble(mueble)
+	tienda.aplicar_descuento("cama", 30)
+	tienda.aplicar_descuento("Asiento", 10)
+	tienda.aplicar_descuento("almacenamiento", 5)
+	assert tienda._obtener_descuento(sofacama) == 0.10  # Asiento precede a Cama en el MRO
+	tienda.aplicar_descuento("sofa", 20)
+	assert tienda._obtener_descuento(sofacama) == 0.20
+	assert tienda._obtener_descuento(silla) == 0.10
+	assert tienda._obtener_descuento(armario) == 0.05
+	assert tienda._obtener_descuento(crear_mesa()) == 0
+	muebles = [silla, sofacama, armario]
+	esperados = [tienda.realizar_venta(m)["precio_final"] for m in muebles]
+	assert tienda.obtener_precios_con_descuento(muebles) == esperados
+
+def test_descuentos_programados_por_ventana():
+	import datetime
+	tienda = TiendaMuebles()
+	silla = crear_silla()
+	tienda.agregar_mueble(silla)
+	dia = datetime.datetime(2024, 6, 1)
+	hora = datetime.timedelta(hours=1)
+	tienda.aplicar_descuento("asiento", 5)
+	tienda.programar_descuento("silla", 10, dia, dia + 4 * hora)
+	tienda.programar_descuento("silla", 25, dia + hora, dia + 2 * hora)
+	tienda.programar_descuento("mueble", 50, dia - hora, dia + 10 * hora)
+	assert tienda._obtener_descuento(silla, dia - 2 * hora) == 0.05
+	assert tienda._obtener_descuento(silla, dia) == 0.10
+	assert tienda._obtener_descuento(silla, dia + hora) == 0.25  # gana la mayor superpuesta
+	assert tienda._obtener_descuento(silla, dia + 2 * hora) == 0.10  # el fin es exclusivo
+	assert tienda._obtener_descuento(silla, dia + 5 * hora) == 0.05
+	assert tienda._obtener_descuento(crear_mesa(), dia) == 0.50
+	assert tienda._obtener_descuento(crear_mesa(), dia + 10 * hora) == 0
+	precio = silla.calcular_precio()
+	assert tienda.obtener_precios_con_descuento([silla], dia + hora) == [round(precio * 0.75, 2)]
+	assert tienda.programar_descuento("silla", 10, dia, dia).startswith("Error")
+	# El reporte solo lista las reglas vigentes ahora
+	ahora = datetime.datetime.now()
+	tienda.programar_descuento("cama", 15, ahora - hora, ahora + hora)
+	reporte = tienda.generar_reporte_inventario()
+	assert "- cama: 15.0%" in reporte
+	assert "- asiento: 5.0%" in reporte
+	assert "- silla" not in reporte and "- mueble" not in reporte
+
+def test_busquedas_combinadas_con_comedores():
+	tienda = TiendaMuebles()
+	silla = crear_silla()
+	mesa = crear_mesa()
+	tienda.agregar_mueble(silla)
+	tienda.agregar_mueble(mesa)
+	comedor = Comedor("Comedor Familiar", crear_mesa(), [crear_silla(), crear_silla()])
+	tienda.agregar_comedor(comedor)
+	assert tienda.buscar_muebles_por_nombre("familiar") == []
+	assert tienda.buscar_muebles_por_nombre("familiar", incluir_comedores=True) == [comedor]
+	assert comedor not in tienda.filtrar_por_precio()
+	combinados = tienda.filtrar_por_precio(incluir_comedores=True)
+	assert combinados == [silla, mesa, comedor]  # en orden de inventario, comedores al final
+	assert tienda.filtrar_por_material("tela", incluir_comedores=True) == [comedor]  # tapizado de las sillas
+	assert tienda.filtrar_comedores_por_capacidad(2, 2) == [comedor]
+	# Los índices siguen los cambios del comedor y de sus componentes
+	comedor.agregar_silla(Silla("Silla Metal", "metal", "gris", 90, True, "cuero", False, False))
+	assert tienda.filtrar_comedores_por_capacidad(3) == [comedor]
+	assert tienda.filtrar_por_material("METAL", incluir_comedores=True) == [comedor]
+	comedor.mesa.material = "vidrio"
+	assert tienda.filtrar_por_material("vidrio", incluir_comedores=True) == [comedor]
+	total = comedor.calcular_precio_total()
+	assert tienda.filtrar_por_precio(total, total, incluir_comedores=True) == [comedor]
+	comedor.mesa.precio_base = 50
+	assert tienda.filtrar_por_precio(total, total, incluir_comedores=True) == []
+	nuevo_total = comedor.calcular_precio_total()
+	assert tienda.filtrar_por_precio(nuevo_total, nuevo_total, incluir_comedores=True) == [comedor]
+
+def test_reporte_en_flujo_y_escritura_en_archivo():
+	import io
+	tienda = TiendaMuebles()
+	silla = crear_silla()
+	tienda.agregar_mueble(silla, 3)
+	tienda.agregar_comedor(Comedor("Comedor Reporte", crear_mesa(), [crear_silla()]))
+	tienda.aplicar_descuento("silla", 10)
+	lineas = list(tienda.iterar_reporte_inventario())
+	assert all(linea.endswith("\n") for linea in lineas)
+	assert "".join(lineas) == tienda.generar_reporte_inventario()
+	assert "DETALLE" not in tienda.generar_reporte_inventario()
+	archivo = io.StringIO()
+	tienda.escribir_reporte_inventario(archivo)
+	assert archivo.getvalue() == tienda.generar_reporte_inventario()  # mismo valor por defecto
+	archivo = io.StringIO()
+	escritas = tienda.escribir_reporte_inventario(archivo, detalle=True)
+	texto = archivo.getvalue()
+	assert escritas == texto.count("\n")
+	assert texto.startswith(tienda.generar_reporte_inventario())
+	assert "[1] 3 unidades\n" in texto
+	assert silla.obtener_descripcion() in texto
+	assert tienda._comedores[0].obtener_descripcion_completa() in texto
+
+def test_reporte_paralelo_identico_al_serial(monkeypatch):
+	import os
+	from concurrent.futures import ProcessPoolExecutor
+	from models.concretos.sofacama import SofaCama
+	from services import renderizado
+	# Sin umbral y con dos núcleos simulados el detalle usa un único grupo de procesos
+	monkeypatch.setattr(renderizado, "MINIMO_PARALELO", 0)
+	monkeypatch.setattr(os, "cpu_count", lambda: 2)
+	grupos = []
+	monkeypatch.setattr(renderizado, "ProcessPoolExecutor",
+		lambda max_workers: grupos.append(max_workers) or ProcessPoolExecutor(max_workers))
+	tienda = TiendaMuebles()
+	for i in range(40):
+		tienda.agregar_mueble(Silla(f"Silla {i}", "madera", "rojo", 100 + i, True, "tela", i % 2 == 0, False))
+		tienda.agregar_mueble(SofaCama(f"SofaCama {i}", "Tela", "Gris", 800.0 + i))
+	tienda.agregar_comedor(Comedor("Comedor Paralelo", crear_mesa(), [crear_silla(), crear_silla()]))
+	serial = tienda.generar_reporte_inventario(detalle=True)
+	assert tienda.generar_reporte_inventario(detalle=True, procesos=4) == serial
+	assert grupos == [2]
+	# Por debajo del umbral (o con un solo núcleo) el reporte queda en serie
+	monkeypatch.setattr(renderizado, "MINIMO_PARALELO", 1000)
+	assert tienda.generar_reporte_inventario(detalle=True, procesos=2) == serial
+	assert grupos == [2]
+	assert renderizado.procesos_efectivos(None, 5000) == 2
+	monkeypatch.setattr(os, "cpu_count", lambda: 1)
+	assert renderizado.procesos_efectivos(8, 5000) == 1
+	# Los observadores no viajan a los procesos y los originales siguen observados
+	silla = tienda.obtener_mueble_por_id(1)
+	silla.precio_base = 500
+	assert tienda.filtrar_por_precio(silla.calcular_precio(), silla.calcular_precio()) == [silla]
+
+def crear_tienda_variada(almacen=None):
+	import datetime
+	from models.concretos.sofacama import SofaCama
+	from models.concretos.cama import Cama
+	from models.concretos.armario import Armario
+	tienda = TiendaMuebles("Tienda Instantánea", almacen)
+	tienda.agregar_mueble(crear_silla(), 5)
+	tienda.agregar_mueble(Silla("Silla Metal", "Metal", "Gris", 120.5, False, None, False, True))
+	tienda.agregar_mueble(SofaCama("SofaCama Test", "Tela", "Gris", 800.0), 2)
+	tienda.agregar_mueble(Cama("Cama Test", "Madera", "Blanco", 700.0, "queen"))
+	tienda.agregar_mueble(Armario("Armario Test", "Madera", "Blanco", 500.0, 3, 2, True))
+	tienda.agregar_mueble(crear_mesa())
+	tienda.agregar_comedor(Comedor("Comedor Guardado", crear_mesa(), [crear_silla(), crear_silla()]))
+	tienda.aplicar_descuento("asiento", 10)
+	ahora = datetime.datetime.now()
+	tienda.programar_descuento("cama", 20, ahora - datetime.timedelta(hours=1), ahora + datetime.timedelta(hours=1))
+	tienda.realizar_venta(tienda.obtener_mueble_por_id(1), "Ana", 2)
+	return tienda
+
+def test_instantanea_binaria_restaura_la_tienda(tmp_path):
+	original = crear_tienda_variada()
+	ruta = str(tmp_path / "tienda.snap")
+	assert "guardada" in original.guardar_instantanea(ruta)
+	cargada = TiendaMuebles.cargar_instantanea(ruta)
+	assert cargada.nombre == original.nombre
+	assert cargada.obtener_estadisticas() == original.obtener_estadisticas()  # sin decodificar el inventario
+	assert "_inventario" not in cargada.__dict__
+	assert cargada.generar_reporte_inventario(detalle=True) == original.generar_reporte_inventario(detalle=True)
+	assert cargada.obtener_estadisticas() == original.obtener_estadisticas()
+	assert cargada._ventas_realizadas == original._ventas_realizadas
+	ids = lambda muebles: [cargada.obtener_id(m) for m in muebles]
+	ids_originales = lambda muebles: [original.obtener_id(m) for m in muebles]
+	assert ids(cargada.filtrar_por_precio()) == ids_originales(original.filtrar_por_precio())
+	# Los cambios posteriores a la carga mantienen índices y acumulados al día
+	for tienda in (original, cargada):
+		tienda.obtener_mueble_por_id(2).precio_base = 999
+		tienda.obtener_mueble_por_id(3).material = "Cuero"
+		tienda.agregar_mueble(Silla("Silla Nueva", "Pino", "Natural", 80, True, "tela", False, False))
+		tienda.realizar_venta(tienda.obtener_mueble_por_id(4))
+	assert cargada.obtener_estadisticas() == original.obtener_estadisticas()
+	assert ids(cargada.filtrar_por_precio()) == ids_originales(original.filtrar_por_precio())
+	assert ids(cargada.filtrar_por_material("cuero")) == [3]
+	assert ids(cargada.buscar_muebles_por_nombre("silla")) == ids_originales(original.buscar_muebles_por_nombre("silla"))
+	assert cargada.obtener_existencias(crear_silla()) == 3  # búsqueda por configuración
+
+def test_instantanea_binaria_comparte_sillas_con_el_inventario(tmp_path):
+	original = TiendaMuebles()
+	silla = crear_silla()
+	original.agregar_mueble(silla, 3)
+	original.agregar_comedor(Comedor("Comedor Compartido", crear_mesa(), [silla, crear_silla()]))
+	ruta = str(tmp_path / "tienda.snap")
+	original.guardar_instantanea(ruta)
+	cargada = TiendaMuebles.cargar_instantanea(ruta)
+	restaurada = cargada.obtener_mueble_por_id(1)
+	assert cargada._comedores[0].sillas[0] is restaurada
+	assert cargada._comedores[0].sillas[1] is not restaurada
+	# Editar la silla compartida actualiza a la vez la referencia y el comedor
+	for tienda in (original, cargada):
+		tienda.obtener_mueble_por_id(1).precio_base = 250
+	assert cargada.calcular_valor_inventario() == original.calcular_valor_inventario()
+	assert cargada.obtener_estadisticas() == original.obtener_estadisticas()
+	assert cargada._acumulados == {id(cargada._comedores[0]): original._acumulados[id(original._comedores[0])],
+		id(restaurada): original._acumulados[id(silla)]}
+
+def test_busqueda_por_nombre_con_indice_en_construccion(tmp_path, monkeypatch):
+	from services.almacen import AlmacenMemoria
+	monkeypatch.setattr(AlmacenMemoria, "TROZO_NOMBRES", 1)
+	original = crear_tienda_variada()
+	ruta = str(tmp_path / "tienda.snap")
+	original.guardar_instantanea(ruta)
+	cargada = TiendaMuebles.cargar_instantanea(ruta)
+	ids = lambda tienda, muebles: [tienda.obtener_id(m) for m in muebles]
+	for consulta in ("silla", "e", "test"):
+		assert ids(cargada, cargada.buscar_muebles_por_nombre(consulta)) == \
+			ids(original, original.buscar_muebles_por_nombre(consulta))
+	# Cada búsqueda indexó un mueble más; el índice sigue incompleto
+	almacen = cargada._almacen
+	assert len(almacen._pendientes["_indice_nombres"]) == 3
+	# Un cambio completa el índice antes de aplicarse
+	for tienda in (original, cargada):
+		tienda.obtener_mueble_por_id(len(cargada._inventario)).nombre = "Silla Renombrada"
+	assert "_indice_nombres" not in almacen.__dict__.get("_pendientes", {})
+	assert ids(cargada, cargada.buscar_muebles_por_nombre("silla")) == \
+		ids(original, original.buscar_muebles_por_nombre("silla"))
+
+def test_instantanea_binaria_invalida(tmp_path):
+	ruta = tmp_path / "otra_cosa.snap"
+	ruta.write_bytes(b"no es una instantanea" * 4)
+	with pytest.raises(ValueError):
+		TiendaMuebles.cargar_instantanea(str(ruta))
+
+def vender_con_diario(tienda, ruta):
+	"""Abre un diario y hace ventas sueltas; devuelve el tamaño del archivo y las estadísticas tras cada una."""
+	import os
+	assert tienda.abrir_diario(ruta, tamaño_grupo=4, espera_maxima=None)["ventas_recuperadas"] == 0
+	limites = [os.path.getsize(ruta)]
+	estados = [tienda.obtener_estadisticas()]
+	for id_mueble, cliente, cantidad in [(1, "Ana", 1), (3, "Luis", 2), (2, "Bea", 1), (4, "Ñandú", 1), (1, "Ana", 2)]:
+		venta = tienda.realizar_venta(tienda.obtener_mueble_por_id(id_mueble), cliente, cantidad)
+		assert "error" not in venta
+		limites.append(os.path.getsize(ruta))
+		estados.append(tienda.obtener_estadisticas())
+	return limites, estados
+
+def test_diario_reproduce_ventas_tras_caida(tmp_path):
+	original = crear_tienda_variada()
+	ruta = str(tmp_path / "ventas.diario")
+	limites, estados = vender_con_diario(original, ruta)
+	with open(ruta, "rb") as archivo:
+		datos = archivo.read()
+	# Caída en cualquier punto: se recuperan exactamente las ventas completas
+	for corte in range(len(datos) + 1):
+		copia = tmp_path / "cortado.diario"
+		copia.write_bytes(datos[:corte])
+		completas = sum(1 for limite in limites[1:] if limite <= corte)
+		tienda = crear_tienda_variada()
+		resultado = tienda.abrir_diario(str(copia))
+		assert resultado["ventas_recuperadas"] == completas
+		assert tienda.obtener_estadisticas() == estados[completas]
+		assert tienda._ventas_realizadas[1:] == original._ventas_realizadas[1:1 + completas]
+		# El diario sigue utilizable: la venta nueva queda después de las recuperadas
+		assert "error" not in tienda.realizar_venta(tienda.obtener_mueble_por_id(6))
+		tienda.cerrar_diario()
+		reabierta = crear_tienda_variada()
+		assert reabierta.abrir_diario(str(copia))["ventas_recuperadas"] == completas + 1
+		reabierta.cerrar_diario()
+	# Un byte dañado corta la reproducción en el registro que lo contiene
+	dañado = bytearray(datos)
+	dañado[limites[2] + 12] ^= 0xFF
+	copia.write_bytes(bytes(dañado))
+	tienda = crear_tienda_variada()
+	assert tienda.abrir_diario(str(copia))["ventas_recuperadas"] == 2
+	assert tienda.obtener_estadisticas() == estados[2]
+	tienda.cerrar_diario()
+
+def test_diario_confirma_en_grupo(tmp_path, monkeypatch):
+	import os
+	sincronizaciones = []
+	fsync = os.fsync
+	monkeypatch.setattr(os, "fsync", lambda descriptor: (sincronizaciones.append(descriptor), fsync(descriptor)))
+	tienda = TiendaMuebles()
+	silla = crear_silla()
+	tienda.agregar_mueble(silla, 100)
+	tienda.abrir_diario(str(tmp_path / "grupo.diario"), tamaño_grupo=4, espera_maxima=None)
+	sincronizaciones.clear()
+	for _ in range(10):
+		tienda.realizar_venta(silla)
+	assert len(sincronizaciones) == 2 and tienda._diario.pendientes == 2
+	# Un lote se escribe de una vez y completa el grupo
+	assert all("error" not in venta for venta in tienda.realizar_ventas_lote([silla] * 5))
+	assert len(sincronizaciones) == 3 and tienda._diario.pendientes == 0
+	tienda.realizar_venta(silla)
+	tienda.cerrar_diario()
+	assert len(sincronizaciones) == 4
+	# Con grupos de una venta cada venta se sincroniza antes de confirmarse
+	tienda.abrir_diario(str(tmp_path / "grupo.diario"), tamaño_grupo=1)
+	sincronizaciones.clear()
+	tienda.realizar_venta(silla)
+	tienda.realizar_venta(silla)
+	assert len(sincronizaciones) == 2
+	tienda.cerrar_diario()
+	reabierta = TiendaMuebles()
+	reabierta.agregar_mueble(crear_silla(), 100)
+	assert reabierta.abrir_diario(str(tmp_path / "grupo.diario"))["ventas_recuperadas"] == 18
+	assert reabierta.obtener_existencias(crear_silla()) == tienda.obtener_existencias(crear_silla()) == 82
+	reabierta.cerrar_diario()
+
+def test_diario_sincroniza_al_vencer_la_espera(tmp_path):
+	import time
+	tienda = TiendaMuebles()
+	silla = crear_silla()
+	tienda.agregar_mueble(silla, 10)
+	tienda.abrir_diario(str(tmp_path / "espera.diario"), tamaño_grupo=100, espera_maxima=0.01)
+	tienda.realizar_venta(silla)
+	diario = tienda._diario
+	# Sin más ventas, el temporizador sincroniza el grupo al vencer el plazo
+	limite = time.monotonic() + 5
+	while diario.pendientes and time.monotonic() < limite:
+		time.sleep(0.01)
+	assert diario.pendientes == 0 and diario.sincronizaciones == 1
+	tienda.cerrar_diario()
+
+def test_diario_e_instantanea(tmp_path):
+	import shutil
+	tienda = crear_tienda_variada()
+	diario = str(tmp_path / "ventas.diario")
+	instantanea = str(tmp_path / "tienda.snap")
+	vender_con_diario(tienda, diario)
+	shutil.copy(diario, tmp_path / "previo.diario")
+	# Guardar la instantánea vacía el diario: sus ventas ya están guardadas
+	assert "guardada" in tienda.guardar_instantanea(instantanea)
+	assert tienda.realizar_venta(tienda.obtener_mueble_por_id(6), "Eva")["cliente"] == "Eva"
+	tienda.cerrar_diario()
+	cargada = TiendaMuebles.cargar_instantanea(instantanea)
+	assert cargada.abrir_diario(diario)["ventas_recuperadas"] == 1
+	assert cargada.obtener_estadisticas() == tienda.obtener_estadisticas()
+	assert cargada._ventas_realizadas == tienda._ventas_realizadas
+	cargada.cerrar_diario()
+	# Caída entre guardar la instantánea y vaciar el diario: no se repiten ventas
+	cargada = TiendaMuebles.cargar_instantanea(instantanea)
+	assert cargada.abrir_diario(str(tmp_path / "previo.diario"))["ventas_recuperadas"] == 0
+	cargada.cerrar_diario()
+	(tmp_path / "otro.diario").write_bytes(b"no es un diario de ventas")
+	assert "error" in cargada.abrir_diario(str(tmp_path / "otro.diario"))
+
+def test_almacen_sqlite_equivale_al_de_memoria(tmp_path):
+	from services.almacen import AlmacenSQLite
+	from models.categorias.asientos import Asiento
+	from models.concretos.cama import Cama
+	from models.concretos.sofacama import SofaCama
+	memoria = crear_tienda_variada()
+	sqlite = crear_tienda_variada(AlmacenSQLite(str(tmp_path / "almacen.db")))
+	for tienda in (memoria, sqlite):
+		tienda.agregar_muebles_lote(
+			Silla(f"Silla Lote {i}", "Madera" if i % 2 else "Metal", "Negro", 100 + i % 3, True, "tela", False, False)
+			for i in range(30))
+		tienda.obtener_mueble_por_id(2).nombre = "Silla Renombrada"
+		tienda.obtener_mueble_por_id(3).material = "Cuero"
+		tienda.obtener_mueble_por_id(4).color = "negro"
+		tienda.obtener_mueble_por_id(8).precio_base = 700
+		tienda.realizar_venta(tienda.obtener_mueble_por_id(5))  # se agota y sale del inventario
+	ids = lambda tienda, muebles: [tienda.obtener_id(m) for m in muebles]
+	consultas = [
+		lambda t: t.buscar_muebles_por_nombre("silla"),
+		lambda t: t.buscar_muebles_por_nombre("LOTE 1"),
+		lambda t: t.buscar_muebles_por_nombre("renombrada"),
+		lambda t: t.buscar_muebles_por_nombre("cama", incluir_comedores=True),
+		lambda t: t.filtrar_por_precio(),
+		lambda t: t.filtrar_por_precio(100, 200),
+		lambda t: t.filtrar_por_precio(0, 1000, incluir_comedores=True),
+		lambda t: t.filtrar_por_material("madera"),
+		lambda t: t.filtrar_por_material(" CUERO ", incluir_comedores=True),
+		lambda t: t.filtrar_por_color("Negro"),
+		lambda t: t.obtener_muebles_por_tipo(Asiento),
+		lambda t: t.obtener_muebles_por_tipo(Cama),
+		lambda t: t.obtener_mas_baratos(5),
+		lambda t: t.obtener_mas_caros(5),
+	]
+	for consulta in consultas:
+		assert ids(sqlite, consulta(sqlite)) == ids(memoria, consulta(memoria))
+	assert sqlite.contar_muebles_por_tipo(Asiento) == memoria.contar_muebles_por_tipo(Asiento)
+	assert sqlite.contar_muebles_por_tipo(SofaCama) == 1
+	assert sqlite.obtener_estadisticas() == memoria.obtener_estadisticas()
+	# Una instantánea se puede cargar sobre cualquiera de los dos almacenes
+	ruta = str(tmp_path / "tienda.snap")
+	memoria.guardar_instantanea(ruta)
+	cargadas = [TiendaMuebles.cargar_instantanea(ruta), TiendaMuebles.cargar_instantanea(ruta, AlmacenSQLite())]
+	for consulta in consultas:
+		assert ids(cargadas[1], consulta(cargadas[1])) == ids(cargadas[0], consulta(cargadas[0]))
+
+def test_historial_de_ventas_en_columnas():
+	import datetime
+	import pickle
+	from services.ventas import RegistroVentas, VentaRegistrada, formatear_fecha, segundos_desde_epoca
+	tienda = TiendaMuebles()
+	tienda.agregar_mueble(crear_silla(), 10)
+	tienda.aplicar_descuento("silla", 10)
+	antes = datetime.datetime.now().replace(microsecond=0)
+	silla = tienda.obtener_mueble_por_id(1)
+	venta = tienda.realizar_venta(silla, "Ana", 3)
+	assert isinstance(venta, VentaRegistrada)
+	assert venta["cliente"] == "Ana" and venta["cantidad"] == 3 and venta["descuento"] == 10
+	assert venta["total"] == round(venta["precio_final"] * 3, 2)
+	assert "fecha" in venta and "error" not in venta and len(venta) == 8
+	fecha = datetime.datetime.strptime(venta["fecha"], "%Y-%m-%d %H:%M:%S")
+	assert antes <= fecha <= datetime.datetime.now()
+	assert venta == dict(venta)  # se compara igual que el diccionario de la venta
+	with pytest.raises(KeyError):
+		venta["inexistente"]
+	lote = tienda.realizar_ventas_lote([silla, crear_mesa(), silla], "Luis")
+	assert "error" in lote[1] and lote[0]["fecha"] == lote[2]["fecha"]
+	historial = tienda._ventas_realizadas
+	assert len(historial) == 3 and historial[-1] == lote[2] and historial[1:] == [lote[0], lote[2]]
+	assert [v["cliente"] for v in historial] == ["Ana", "Luis", "Luis"]
+	assert historial._textos == ["Ana", "Silla Test", "Silla", "Luis"]  # clientes, muebles y tipos internados
+	copia = pickle.loads(pickle.dumps(historial))
+	assert copia == historial
+	assert copia.agregar((0, "Luis", "Silla Test", 1, 1.0, 0.0, 1.0, 1.0), "Silla") == 3 and len(copia._textos) == 4
+	momento = datetime.datetime(2024, 2, 29, 23, 59, 58)
+	assert formatear_fecha(segundos_desde_epoca(momento)) == "2024-02-29 23:59:58"
+	assert RegistroVentas() == RegistroVentas() != historial
+
+def test_resumen_de_ventas_coincide_con_el_historial():
+	import datetime
+	import random
+	from services.ventas import segundos_desde_epoca
+	tienda = TiendaMuebles()
+	tienda.agregar_mueble(crear_silla(), 5)
+	tienda.aplicar_descuento("silla", 10)
+	assert tienda.realizar_venta(tienda.obtener_mueble_por_id(1), "Ana", 2)["cantidad"] == 2
+	registro = tienda._ventas_realizadas
+	assert tienda.obtener_estadisticas()["ingresos_ventas"] == registro[0]["total"]
+	# Ventas durante tres días, con segundos, minutos y horas sin ventas
+	azar = random.Random(7)
+	base = datetime.datetime(2024, 2, 28, 22, 0, 0)
+	momento = segundos_desde_epoca(base)
+	for _ in range(3000):
+		momento += azar.choice((0, 1, 7, 59, 61, 600, 3601))
+		tipo = azar.choice(("Silla", "Mesa"))
+		cantidad = azar.randint(1, 3)
+		precio_final = azar.choice((90.0, 99.99, 450.5))
+		registro.agregar((momento, "Luis", f"{tipo} Test", cantidad, precio_final + 10, 5.0,
+						  precio_final, round(precio_final * cantidad, 2)), tipo)
+	primera, ultima = registro.fila(1)[0], registro.fila(len(registro) - 1)[0]
+
+	def por_recorrido(desde, hasta, tipo=None):
+		ventas = [v for v in registro.posiciones(desde, hasta)
+				  if tipo is None or registro._textos[registro._tipos[v]] == tipo]
+		return (len(ventas), sum(registro[v]["cantidad"] for v in ventas),
+				round(sum(registro[v]["total"] for v in ventas), 2))
+
+	for _ in range(200):
+		desde = azar.randint(primera - 100, ultima)
+		hasta = desde + azar.choice((0, 30, 90, 4000, 90000, 300000))
+		tipo = azar.choice((None, "Silla", "Mesa"))
+		totales = registro.totales(desde, hasta, tipo)
+		assert (totales["ventas"], totales["unidades"], round(totales["ingresos"], 2)) == por_recorrido(desde, hasta, tipo)
+		assert sum(t["ventas"] for t in totales["por_tipo"].values()) == totales["ventas"]
+	# Las cubetas de cada granularidad reparten exactamente las ventas de la ventana
+	desde, hasta = base + datetime.timedelta(hours=2), base + datetime.timedelta(days=2, hours=2)
+	esperado = tienda.obtener_totales_ventas(desde, hasta)
+	assert esperado["ventas"] == len(tienda.obtener_ventas_entre(desde, hasta)) > 0
+	for granularidad, ancho in (("minuto", 60), ("hora", 3600), ("dia", 86400)):
+		resumen = tienda.obtener_resumen_ventas(desde, hasta, granularidad)
+		assert resumen["granularidad"] == granularidad
+		assert sum(c["ventas"] for c in resumen["cubetas"]) == esperado["ventas"]
+		inicios = [segundos_desde_epoca(datetime.datetime.strptime(c["inicio"], "%Y-%m-%d %H:%M:%S"))
+				   for c in resumen["cubetas"]]
+		assert inicios == sorted(inicios) and all(inicio % ancho == 0 for inicio in inicios)
+	sillas = tienda.obtener_resumen_ventas(desde, hasta, "dia", tipo="Silla")["cubetas"]
+	assert all(set(c["por_tipo"]) == {"Silla"} for c in sillas)
+	assert "error" in tienda.obtener_resumen_ventas(desde, hasta, "semana")
+	assert "error" in tienda.obtener_totales_ventas("2024-02-28", hasta)
@@ -66,8 +66,19 @@ class MenuTienda:
         table.add_column("Material", style="yellow")
         table.add_column("Color", style="blue")
         table.add_column("Precio", style="red", justify="right")
+        table.add_column("Con descuento", style="green", justify="right")
+        table.add_column("Existencias", style="white", justify="right")
         
-        for i, mueble in enumerate(muebles, 1):
+        referencias = list(muebles.referencias())
+        # Los precios con descuento se calculan juntos para todo el catálogo
+        try:
+            con_descuento = self.tienda.obtener_precios_con_descuento(m for _, m, _ in referencias)
+        except Exception:
+            con_descuento = [None] * len(referencias)
+        
+        # El ID es el asignado por la tienda, estable aunque se vendan otros muebles.
+        # Cada fila es una referencia con todas sus unidades en existencia.
+        for (i, mueble, existencias), precio_final in zip(referencias, con_descuento):
             try:
                 precio = f"${mueble.calcular_precio():.2f}"
                 tipo = type(mueble).__name__
@@ -77,10 +88,12 @@ class MenuTienda:
                     tipo,
                     mueble.material,
                     mueble.color,
-                    precio
+                    precio,
+                    f"${precio_final:.2f}" if precio_final is not None else "-",
+                    str(existencias)
                 )
             except Exception as e:
-                table.add_row(str(i), mueble.nombre, "Error", "-", "-", "Error")
+                table.add_row(str(i), mueble.nombre, "Error", "-", "-", "Error", "-", str(existencias))
         
         self.console.print(table)
     
@@ -180,7 +193,7 @@ class MenuTienda:
     def realizar_venta_interactiva(self):
         """Interfaz interactiva para realizar ventas."""
 
-        muebles = self.tienda._inventario
+        muebles = list(self.tienda._inventario)
         
         if not muebles:
             self.console.print("[red]No hay muebles disponibles para venta.[/red]")
@@ -206,12 +219,17 @@ class MenuTienda:
                 self.console.print("[yellow]Venta cancelada.[/yellow]")
                 return
             
+            existencias = self.tienda.obtener_existencias(mueble_seleccionado)
+            cantidad = 1
+            if existencias > 1:
+                cantidad = IntPrompt.ask(f"Cantidad (disponibles: {existencias})", default=1)
+            
             cliente = Prompt.ask(
                 "Nombre del cliente",
                 default="Cliente Anónimo"
             )
             
-            resultado = self.tienda.realizar_venta(mueble_seleccionado, cliente)
+            resultado = self.tienda.realizar_venta(mueble_seleccionado, cliente, cantidad)
             
             if "error" in resultado:
                 self.console.print(f"[red]Error: {resultado['error']}[/red]")
@@ -233,9 +251,12 @@ class MenuTienda:
         table.add_column("Valor", style="magenta", justify="right")
         
         table.add_row("Total de muebles", str(stats["total_muebles"]))
+        table.add_row("Referencias distintas", str(stats["total_referencias"]))
         table.add_row("Total de comedores", str(stats["total_comedores"]))
+        table.add_row("Total de unidades", str(stats["total_unidades"]))
         table.add_row("Valor del inventario", f"${stats['valor_inventario']:.2f}")
         table.add_row("Ventas realizadas", str(stats["ventas_realizadas"]))
+        table.add_row("Ingresos por ventas", f"${stats['ingresos_ventas']:.2f}")
         table.add_row("Descuentos activos", str(stats["descuentos_activos"]))
         
         self.console.print(table)
@@ -248,9 +269,10 @@ class MenuTienda:
     def generar_reporte_interactivo(self):
         """Genera y muestra el reporte de inventario."""
 
+        detalle = False  # el archivo guardado repite exactamente lo que muestra el panel
         with self.console.status("[bold green]Generando reporte..."):
             time.sleep(1)  # Simular tiempo de generación
-            reporte = self.tienda.generar_reporte_inventario()
+            reporte = self.tienda.generar_reporte_inventario(detalle)
         
         panel = Panel(
             reporte,
@@ -269,8 +291,9 @@ class MenuTienda:
                 default="reporte_inventario.txt"
             )
             try:
+                # El archivo se escribe línea por línea, sin armar el texto completo en memoria
                 with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(reporte)
+                    self.tienda.escribir_reporte_inventario(f, detalle)
                 self.console.print(f"[green]Reporte guardado en {filename}[/green]")
             except Exception as e:
                 self.console.print(f"[red]Error al guardar: {str(e)}[/red]")
@@ -278,7 +301,9 @@ class MenuTienda:
     def aplicar_descuentos_interactivo(self):
         """Interfaz para aplicar descuentos por categoría."""
 
-        categorias_disponibles = ["silla", "mesa", "sofa", "cama", "armario", "escritorio"]
+        # Clases concretas y categorías abstractas: la regla más específica gana
+        categorias_disponibles = ["silla", "sillon", "sofa", "sofacama", "mesa", "escritorio",
+                                  "cama", "armario", "cajonera", "asiento", "superficie", "almacenamiento"]
         
         self.console.print("[cyan]Categorías disponibles:[/cyan]")
         for i, categoria in enumerate(categorias_disponibles, 1):
@@ -358,6 +383,8 @@ class MenuTienda:
         Precio original: ${venta['precio_original']:.2f}
         Descuento aplicado: {venta['descuento']:.1f}%
         PRECIO FINAL: ${venta['precio_final']:.2f}
+        Cantidad: {venta['cantidad']}
+        TOTAL: ${venta['total']:.2f}
         
         ¡Gracias por su compra!
         """